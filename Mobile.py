@@ -1,31 +1,494 @@
-from typing import Dict, Optional, Tuple
-import time, os, configparser, re
-from lxml import etree
-from xml.etree import ElementTree as ET
+from __future__ import annotations
+from typing import Dict, Iterable, Iterator, List, Mapping, Optional, Tuple, Union
+from functools import lru_cache, wraps
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
+import time, os, sys, configparser, re, io, importlib, inspect, operator, shutil, logging, threading
 from tal.KeywordDrivenBase.Core.ConfigManager import PYTHON_PATH
 
+# Element query diagnostics are logged at debug level; messages are only formatted when enabled
+logger = logging.getLogger(__name__)
+
+class _LazyImport:
+    def __init__(self, module: str, attr: Optional[str] = None, package: Optional[str] = None):
+        """
+        Defers importing a module, or one of its attributes, until it is first used.
+
+        Args:
+            module (str): Dotted name of the module to import.
+            attr (Optional[str]): Attribute of the module to expose instead of the module itself.
+            package (Optional[str]): Pip package to install if the import fails; no install is attempted if None.
+        """
+        self._module = module
+        self._attr = attr
+        self._package = package
+        self._target = None
+
+    def _load(self):
+        """
+        Imports the target on first use, installing its package if it is not already installed.
+
+        Returns:
+            The imported module or attribute.
+
+        Raises:
+            ImportError: If the module cannot be imported.
+        """
+        if self._target is None:
+            try:
+                module = importlib.import_module(self._module)
+            except ImportError:
+                if not self._package:
+                    raise
+                os.system(PYTHON_PATH + ' -m pip install ' + self._package)
+                module = importlib.import_module(self._module)
+            self._target = getattr(module, self._attr) if self._attr else module
+        return self._target
+
+    def __getattr__(self, name: str):
+        # Only reached for names not set in __init__; guard them so a half-built proxy cannot recurse
+        if name in ("_module", "_attr", "_package", "_target"):
+            raise AttributeError(name)
+        return getattr(self._load(), name)
+
+    def __call__(self, *args, **kwargs):
+        return self._load()(*args, **kwargs)
+
+# lxml, Appium and selenium.webdriver are only imported once a device is driven,
+# so reading configurations does not pay their import cost
+etree = _LazyImport("lxml.etree")
+
 # Install Appium if not already installed
-try:
-    from appium import webdriver
-    from appium.webdriver.common.appiumby import AppiumBy
-    from appium.options.common import AppiumOptions
-except ImportError:
-    os.system(PYTHON_PATH + ' -m pip install Appium-Python-Client')
-    from appium import webdriver
-    from appium.webdriver.common.appiumby import AppiumBy
-    from appium.options.common import AppiumOptions
+webdriver = _LazyImport("appium.webdriver", package="Appium-Python-Client")
+AppiumBy = _LazyImport("appium.webdriver.common.appiumby", "AppiumBy", package="Appium-Python-Client")
+AppiumOptions = _LazyImport("appium.options.common", "AppiumOptions", package="Appium-Python-Client")
 
 # Install Selenium if not already installed
 try:
-    from selenium.common.exceptions import WebDriverException, NoSuchElementException, StaleElementReferenceException
-    from selenium.webdriver.common.by import By
+    from selenium.common.exceptions import WebDriverException, NoSuchElementException, StaleElementReferenceException, TimeoutException, InvalidSelectorException, UnknownMethodException
 except ImportError:
     os.system(PYTHON_PATH + ' -m pip install selenium')
-    from selenium.common.exceptions import WebDriverException, NoSuchElementException, StaleElementReferenceException
-    from selenium.webdriver.common.by import By
+    from selenium.common.exceptions import WebDriverException, NoSuchElementException, StaleElementReferenceException, TimeoutException, InvalidSelectorException, UnknownMethodException
+By = _LazyImport("selenium.webdriver.common.by", "By", package="selenium")
+interaction = _LazyImport("selenium.webdriver.common.actions.interaction", package="selenium")
+ActionBuilder = _LazyImport("selenium.webdriver.common.actions.action_builder", "ActionBuilder", package="selenium")
+MouseButton = _LazyImport("selenium.webdriver.common.actions.mouse_button", "MouseButton", package="selenium")
+PointerInput = _LazyImport("selenium.webdriver.common.actions.pointer_input", "PointerInput", package="selenium")
+WebDriverWait = _LazyImport("selenium.webdriver.support.ui", "WebDriverWait", package="selenium")
+
+# Lowercased error message fragments of drivers that do not implement a command (older servers report an
+# unsupported W3C actions endpoint this way rather than as an unknown method)
+_UNSUPPORTED_COMMAND_MESSAGES = ("unknown command", "unknown method", "not implemented", "not supported")
 
 # Global variable to store unique element types
 ELEMENT_TYPES = set()
+# (ELEMENT_TYPES, XPath predicate selecting them), published together in one assignment so that a thread never
+# sees the types without their predicate
+_ELEMENT_TYPES_AND_FILTER = (ELEMENT_TYPES, "")
+
+# Pre-compiled patterns for the INI subset used by the smartphone configuration files
+_SECTION_RE = re.compile(r'^\s*\[([^\]]+)\]\s*$')
+_KV_RE = re.compile(r'^\s*([^=:;#\s][^=:]*?)\s*[=:]\s*(.*?)\s*$')
+# configparser.BasicInterpolation syntax: '%%' is a literal '%', '%(name)s' the value of another key;
+# any other '%' matches the empty alternative and is an error
+_INTERPOLATION_RE = re.compile(r'%(?:(%)|\(([^)]*)\)s|)')
+
+# Pre-compiled patterns for element names and bounds, used on every element lookup
+_NAME_ATTR_RE = re.compile(r"@name='([^']*)'")
+_LABEL_ATTR_RE = re.compile(r"@(name|label|value)=['\"]([^'\"]*?)['\"]")
+_BOUNDS_RE = re.compile(r'\[(\d+),(\d+)\]\[(\d+),(\d+)\]')
+# A single-step XPath selecting an element by type and name, which can be answered while streaming the page source
+_SIMPLE_NAME_XPATH_RE = re.compile(r"^//(\*|[\w.-]+)\[@name='([^']*)'\]$")
+
+# Pre-compiled patterns for binding attribute values to XPath variables (quotes must pair up, so the
+# other quote type may appear inside a value) and for the predicates once bound
+_PAIRED_QUOTED_ATTR_RE = re.compile(r"""@(\w+)=(?:'([^']*)'|"([^"]*)")""")
+_BOUND_ATTR_RE = re.compile(r"@(\w+)=\$(v\d+)\b")
+_BOUND_VARIABLE_RE = re.compile(r"\$(v\d+)\b")
+
+# Pre-compiled patterns extracting a name, label or value predicate (quoted or bound) for the element type fallback
+_ATTR_VALUE_RES = tuple(
+    (attr, re.compile(fr"@{attr}=(?:['\"]([^'\"]*?)['\"]|\$(\w+))")) for attr in ("name", "label", "value")
+)
+
+# Expression templates for the element type fallback per attribute, matching the value exactly or
+# whitespace-normalized in one pass; {types} is filled in with the predicate of _ELEMENT_TYPES_AND_FILTER
+_ATTR_FALLBACK_XPATHS = {
+    attr: f"//*[{{types}}][@{attr}=$value or normalize-space(@{attr})=$value]" for attr in ("name", "label", "value")
+}
+
+# Text normalization and attributes used when searching elements by text
+_SURROUNDING_QUOTES_RE = re.compile(r'^[\'"]|[\'"]$')
+_TEXT_ATTRIBUTES = ("label", "name", "value")
+
+# CheckElementProperty comparisons, as operator -> (check on actual and expected, message logged on mismatch)
+_STRING_COMPARISONS = {
+    "==": (operator.eq, "Element '%(element)s' attribute '%(attribute)s'=%(actual)s, expected=%(expected)s for comparison '==' on device %(sp_num)s"),
+    "!=": (operator.ne, "Element '%(element)s' attribute '%(attribute)s'=%(actual)s, not expected=%(expected)s for comparison '!=' on device %(sp_num)s"),
+    "contains": (lambda actual, expected: expected in actual,
+                 "Element '%(element)s' attribute '%(attribute)s'=%(actual)s does not contain '%(expected)s' on device %(sp_num)s"),
+    "!contains": (lambda actual, expected: expected not in actual,
+                  "Element '%(element)s' attribute '%(attribute)s'=%(actual)s contains '%(expected)s', not expected on device %(sp_num)s"),
+    "startsWith": (str.startswith, "Element '%(element)s' attribute '%(attribute)s'=%(actual)s does not start with '%(expected)s' on device %(sp_num)s"),
+    "!startsWith": (lambda actual, expected: not actual.startswith(expected),
+                    "Element '%(element)s' attribute '%(attribute)s'=%(actual)s starts with '%(expected)s', not expected on device %(sp_num)s"),
+    "endsWith": (str.endswith, "Element '%(element)s' attribute '%(attribute)s'=%(actual)s does not end with '%(expected)s' on device %(sp_num)s"),
+    "!endsWith": (lambda actual, expected: not actual.endswith(expected),
+                  "Element '%(element)s' attribute '%(attribute)s'=%(actual)s ends with '%(expected)s', not expected on device %(sp_num)s"),
+}
+_NUMERIC_COMPARISONS = {
+    "<=": (operator.le, "Element '%(element)s' attribute '%(attribute)s'=%(actual)s, expected <= %(expected)s on device %(sp_num)s"),
+    ">=": (operator.ge, "Element '%(element)s' attribute '%(attribute)s'=%(actual)s, expected >= %(expected)s on device %(sp_num)s"),
+    ">": (operator.gt, "Element '%(element)s' attribute '%(attribute)s'=%(actual)s, expected > %(expected)s on device %(sp_num)s"),
+    "<": (operator.lt, "Element '%(element)s' attribute '%(attribute)s'=%(actual)s, expected < %(expected)s on device %(sp_num)s"),
+}
+
+# Backoff used when polling the screen for an element (seconds)
+_POLL_START = 0.05
+_POLL_MAX = 0.5
+_POLL_BACKOFF = 1.5
+
+# Compiled XPaths kept by Mobile._compile_xpath; the least recently used one is dropped beyond this
+_XPATH_CACHE_SIZE = 512
+
+# Default for Mobile.page_source_ttl_ms: page sources fetched this recently are shared by consecutive
+# element queries and tap lookups, until an action on the device invalidates them (milliseconds)
+_PAGE_SOURCE_TTL_MS = 150
+
+# Scrolls up to this fraction of the screen height shift elements predictably enough to skip a re-lookup
+_SMALL_SCROLL_RATIO = 0.2
+
+# Attributes of a matched element used to look it up natively, as (page source attribute, predicate or
+# UiSelector property); the first entry is the element type
+_IOS_PREDICATE_ATTRS = (("type", "type"), ("name", "name"), ("label", "label"))
+_UI_SELECTOR_ATTRS = (("class", "className"), ("resource-id", "resourceId"), ("text", "text"), ("content-desc", "description"))
+
+# Tap script and its fixed arguments per platform; the coordinates and duration are added per tap
+_TAP_SCRIPTS = {
+    "ios": ("mobile: tap", {}),
+    "android": ("mobile: clickGesture", {"tapCount": 1}),
+}
+
+# Default automation engine per platform
+_AUTOMATION_NAMES = {"ios": "XCUITest", "android": "UiAutomator2"}
+
+# Interned capability keys looked up on every StartApplication call
+_KEY_NEW_CMD = sys.intern("appium:newCommandTimeout")
+_KEY_USE_WDA = sys.intern("appium:usePrebuiltWDA")
+
+# Capabilities read from the smartphone configuration, as (appium key, lowercase ini key, default) per platform
+_COMMON_CAPS = (
+    ("appium:platformVersion", "platformversion", ""),
+    ("appium:deviceName", "devicename", ""),
+    ("appium:udid", "udid", ""),
+    ("appium:bundleId", "bundleid", ""),
+    ("appium:app", "app", ""),
+    ("appium:newCommandTimeout", "newcommandtimeout", 600),
+)
+_PLATFORM_CAPS = {
+    "ios": _COMMON_CAPS + (
+        ("appium:automationName", "automationname", _AUTOMATION_NAMES["ios"]),
+    ),
+    "android": _COMMON_CAPS + (
+        ("appium:automationName", "automationname", _AUTOMATION_NAMES["android"]),
+        ("appium:appPackage", "apppackage", ""),
+        ("appium:appActivity", "appactivity", ""),
+    ),
+}
+
+# Fixed capabilities merged over the configured ones per platform
+_PLATFORM_FIXED_CAPS = {
+    "ios": {"appium:platformName": "iOS", "appium:usePrebuiltWDA": "true"},
+    "android": {"appium:platformName": "Android", "appium:usePrebuiltWDA": "true"},
+}
+
+class ConfigError(configparser.Error):
+    """Raised when a configuration file cannot be parsed by FastConfigParser."""
+
+class FastConfigParser:
+    def __init__(self, preserve_case: bool = False):
+        """
+        Initializes a single-pass, regex-based parser for INI-style configuration files.
+
+        Args:
+            preserve_case (bool): If True, keeps the original case of keys; otherwise keys are lowercased
+                                  like configparser's default optionxform.
+        """
+        self.preserve_case = preserve_case
+
+    def parse(self, lines: Iterable[str], source: str = "<string>") -> Dict[str, Dict[str, str]]:
+        """
+        Parses configuration lines into a dictionary of sections and key-value pairs.
+
+        Behaves like configparser.ConfigParser with its defaults: full-line '#' and ';' comments are
+        skipped, indented lines continue the previous value (blank lines between them are kept, trailing
+        ones dropped), keys from a [DEFAULT] section are merged into every other section and values are
+        interpolated like BasicInterpolation ('%%' becomes '%', '%(name)s' the value of key 'name').
+        With preserve_case, a reference that matches no key exactly falls back to a case-insensitive match.
+
+        Args:
+            lines (Iterable[str]): The configuration lines to parse.
+            source (str): Name of the configuration source, used in error messages.
+
+        Returns:
+            Dict[str, Dict[str, str]]: Parsed configuration data.
+
+        Raises:
+            ConfigError: If a line is malformed, appears before any section header, is duplicated,
+                         or a value cannot be interpolated.
+        """
+        data = {}
+        defaults = {}
+        section = None
+        key = None
+        blank_lines = 0  # Blank lines since the last line of the current value
+        for lineno, line in enumerate(lines, start=1):
+            stripped = line.strip()
+            if not stripped:
+                if key is not None:
+                    blank_lines += 1
+                continue
+            if stripped[0] in "#;":
+                continue
+
+            # Indented lines continue the value of the previous key
+            if key is not None and line[0].isspace():
+                section[key] = section[key] + "\n" * (blank_lines + 1) + stripped
+                blank_lines = 0
+                continue
+            blank_lines = 0
+
+            match = _SECTION_RE.match(line)
+            if match:
+                name = match.group(1).strip()
+                if name in data:
+                    raise ConfigError(f"Duplicate section '{name}' at line {lineno} of '{source}'")
+                section = defaults if name == "DEFAULT" else data.setdefault(name, {})
+                key = None
+                continue
+
+            match = _KV_RE.match(line)
+            if not match:
+                raise ConfigError(f"Malformed line {lineno} in '{source}': '{stripped}'")
+            if section is None:
+                raise ConfigError(f"Missing section header before line {lineno} in '{source}'")
+            key = match.group(1) if self.preserve_case else match.group(1).lower()
+            if key in section:
+                raise ConfigError(f"Duplicate key '{key}' at line {lineno} of '{source}'")
+            section[key] = match.group(2)
+
+        for name, values in data.items():
+            if defaults:
+                values = data[name] = {**defaults, **values}
+            if any("%" in value for value in values.values()):
+                raw = dict(values)  # References always expand the raw values
+                for key, value in raw.items():
+                    if "%" in value:
+                        values[key] = self._interpolate(value, raw, name, key, source)
+        return data
+
+    def _interpolate(self, value: str, values: Mapping[str, str], section: str, key: str, source: str, depth: int = 1) -> str:
+        """
+        Expands '%%' and '%(name)s' references in a raw value, like configparser.BasicInterpolation.
+
+        Args:
+            value (str): The raw value.
+            values (Mapping[str, str]): The raw values of the section, [DEFAULT] keys included.
+            section (str): The section name, used in error messages.
+            key (str): The key of the value, used in error messages.
+            source (str): Name of the configuration source, used in error messages.
+            depth (int): Nesting level of the reference being expanded.
+
+        Returns:
+            str: The interpolated value.
+
+        Raises:
+            ConfigError: If a '%' is malformed, a reference is missing, or references nest too deeply.
+        """
+        if depth > configparser.MAX_INTERPOLATION_DEPTH:
+            raise ConfigError(f"Interpolation too deep for key '{key}' in section '{section}' of '{source}'")
+
+        def expand(match: re.Match) -> str:
+            if match.group(1):
+                return "%"
+            name = match.group(2)
+            if name is None:
+                raise ConfigError(
+                    f"Bad interpolation in key '{key}' in section '{section}' of '{source}': "
+                    f"'%' must be followed by '%' or '(', found: '{match.string[match.start():]}'"
+                )
+            if not self.preserve_case:
+                name = name.lower()
+            if name not in values:
+                name = next((other for other in values if other.lower() == name.lower()), name)
+            if name not in values:
+                raise ConfigError(f"Key '{key}' in section '{section}' of '{source}' references missing key '{name}'")
+            raw = values[name]
+            return self._interpolate(raw, values, section, key, source, depth + 1) if "%" in raw else raw
+
+        return _INTERPOLATION_RE.sub(expand, value)
+
+def _iter_config_lines(abspath: str) -> Iterator[str]:
+    """
+    Yields the lines of a configuration file with %APP% replaced by the config directory.
+
+    Args:
+        abspath (str): Absolute path to the configuration file.
+
+    Yields:
+        str: The next configuration line, with path separators of the replacement preserved.
+
+    Raises:
+        IOError: If there is an error reading the configuration file.
+    """
+    app_dir = os.path.dirname(abspath).replace('\\', os.sep)
+    with open(abspath, "r", encoding="utf-8", buffering=65536) as f:
+        for line in f:
+            # Most lines carry no token; the substring check is cheaper than an unconditional replace
+            yield line.replace("%APP%", app_dir) if "%APP%" in line else line
+
+@lru_cache(maxsize=32)
+def _load_config_cached(abspath: str, mtime_ns: int, size: int) -> Mapping[str, Mapping[str, str]]:
+    """
+    Reads and parses a configuration file once per (path, mtime, size), replacing %APP% with the config directory.
+
+    Args:
+        abspath (str): Absolute path to the configuration file.
+        mtime_ns (int): Modification time of the file in nanoseconds; part of the cache key only.
+        size (int): Size of the file in bytes; part of the cache key only.
+
+    Returns:
+        Mapping[str, Mapping[str, str]]: Read-only view of the parsed configuration, with the original case of keys.
+
+    Raises:
+        ConfigError: If the configuration file is invalid or cannot be parsed.
+        IOError: If there is an error reading the configuration file.
+    """
+    data = FastConfigParser(preserve_case=True).parse(_iter_config_lines(abspath), source=abspath)
+    return MappingProxyType({section: MappingProxyType(values) for section, values in data.items()})
+
+def _load_config(path: str) -> Mapping[str, Mapping[str, str]]:
+    """
+    Returns the parsed configuration for a file, reparsing it only when its mtime or size changed.
+
+    Args:
+        path (str): Path to the configuration file.
+
+    Returns:
+        Mapping[str, Mapping[str, str]]: Read-only view of the parsed configuration.
+
+    Raises:
+        FileNotFoundError: If the configuration file does not exist.
+        ConfigError: If the configuration file is invalid or cannot be parsed.
+    """
+    abspath = os.path.abspath(path)
+    stat = os.stat(abspath)
+    return _load_config_cached(abspath, stat.st_mtime_ns, stat.st_size)
+
+def _xpath_literal(value: str) -> str:
+    """
+    Quotes a string as an XPath 1.0 literal, using concat() when it contains both quote types.
+
+    Args:
+        value (str): The string to quote.
+
+    Returns:
+        str: The XPath expression evaluating to the string.
+    """
+    if "'" not in value:
+        return f"'{value}'"
+    if '"' not in value:
+        return f'"{value}"'
+    return "concat('" + value.replace("'", "', \"'\", '") + "')"
+
+
+@lru_cache(maxsize=256)
+def _xpath_templates(xpath: str) -> Tuple[Tuple[Tuple[str, str], ...], Tuple[Tuple[str, str], ...]]:
+    """
+    Binds the quoted attribute values of an XPath to variables and returns its matching strategies.
+
+    The strategies are the exact predicate, its whitespace-normalized form and a substring match. Bound
+    values need no quoting or escaping, so one template covers every quote style and compiles once.
+
+    Args:
+        xpath (str): The XPath expression.
+
+    Returns:
+        Tuple: (strategies, bindings). strategies holds distinct (template, canonical) pairs in the order
+        they should be tried: the template references $v0, $v1, ... for lxml, the canonical form inlines
+        the values as XPath literals for the Appium server. bindings holds the (variable, value) pairs.
+    """
+    bindings = []
+
+    def bind(match):
+        variable = f"v{len(bindings)}"
+        value = match.group(2) if match.group(2) is not None else match.group(3)
+        bindings.append((variable, value))
+        return f"@{match.group(1)}=${variable}"
+
+    template = _PAIRED_QUOTED_ATTR_RE.sub(bind, xpath)
+    if not bindings:
+        return ((xpath, xpath),), ()
+
+    values = dict(bindings)
+    templates = dict.fromkeys((
+        template,
+        _BOUND_ATTR_RE.sub(r"@\1[normalize-space(.)=$\2]", template),
+        _BOUND_ATTR_RE.sub(r"@\1[contains(., $\2)]", template)
+    ))
+    strategies = tuple(
+        (alt, _BOUND_VARIABLE_RE.sub(lambda m: _xpath_literal(values[m.group(1)]), alt)) for alt in templates
+    )
+    return strategies, tuple(bindings)
+
+def _normalize_text(text: str) -> str:
+    """
+    Normalizes text for matching: removes surrounding quotes, collapses whitespace and lowercases it.
+
+    Args:
+        text (str): The text to normalize.
+
+    Returns:
+        str: The normalized text.
+    """
+    # The quote pattern only runs when there is a quote to remove; split() collapses and strips
+    # the same whitespace as \s+ without a regex pass
+    if "'" in text or '"' in text:
+        text = _SURROUNDING_QUOTES_RE.sub('', text)
+    return " ".join(text.split()).lower()
+
+@lru_cache(maxsize=256)
+def _contains_text_xpath(text: str, exact: bool = False) -> str:
+    """
+    Builds an XPath matching visible elements whose text attributes contain the text, ignoring case and extra whitespace.
+
+    The text is normalized like _get_deepest_matching_element does: surrounding quotes are removed,
+    whitespace is collapsed and the text is lowercased. XPath 1.0 has no lower-case(), so translate()
+    maps the uppercase form of each character of the text, ASCII or not, to the character itself;
+    characters whose uppercase form is several characters (e.g. 'ß') only match as written. Unlike
+    the Python search, quotes around attribute values are kept and only XML whitespace is collapsed.
+
+    Args:
+        text (str): The text to search for.
+        exact (bool): If True, an attribute must be equal to the text instead of containing it.
+
+    Returns:
+        str: The XPath expression.
+    """
+    target = _normalize_text(text)
+    folded = {char.upper(): char for char in set(target) if len(char.upper()) == 1 and char.upper() != char}
+    literal = _xpath_literal(target)
+    if folded:
+        upper, lower = _xpath_literal("".join(folded)), _xpath_literal("".join(folded.values()))
+        values = [f"translate(normalize-space(@{attr}), {upper}, {lower})" for attr in _TEXT_ATTRIBUTES]
+    else:
+        values = [f"normalize-space(@{attr})" for attr in _TEXT_ATTRIBUTES]
+    if exact:
+        tests = " or ".join(f"{value}={literal}" for value in values)
+    else:
+        tests = " or ".join(f"contains({value}, {literal})" for value in values)
+    # Hidden elements are dropped by the driver, so only visible candidates cost a rect request
+    return f"//*[{tests}][not(@visible='false')][not(@displayed='false')]"
 
 class Appium:
     def __init__(self, config_path: str):
@@ -60,42 +523,32 @@ class Appium:
             configparser.Error: If the configuration file is invalid or cannot be parsed.
             IOError: If there is an error reading the configuration file.
         """
-        try:
-            # Determine the driver directory path for %APP% replacement from the config file location
-            driver_dir = os.path.dirname(os.path.abspath(self.config_path))
-            if not driver_dir or not os.path.isdir(driver_dir):
-                raise ValueError(f"Invalid driver directory for %APP% replacement: '{driver_dir}'")
-
-            # Read and preprocess the config file to replace %APP%
-            config_content = []
-            with open(self.config_path, "r", encoding="utf-8") as f:
-                for line in f:
-                    # Replace %APP% with driver_dir, preserving path separators
-                    processed_line = line.replace("%APP%", driver_dir.replace('\\', os.sep))
-                    config_content.append(processed_line)
-
-            # Parse the processed content using configparser
-            config = configparser.ConfigParser()
-            config.read_string(''.join(config_content))
-
-            data = {}
-            for section in config.sections():
-                data[section] = {}
-                for key, value in config[section].items():
-                    data[section][key] = value.strip()
-
-            return data
+        if not os.path.isfile(self.config_path):
+            raise FileNotFoundError(f"Failed to read configuration file '{self.config_path}': not an existing file")
 
-        except FileNotFoundError as fnf:
-            raise FileNotFoundError(f"Failed to read configuration file '{self.config_path}': {fnf}")
-        except configparser.Error as ce:
-            raise configparser.Error(f"Failed to parse configuration file '{self.config_path}' after %APP% replacement: {ce}")
-        except IOError as ioe:
-            raise IOError(f"Failed to read configuration file '{self.config_path}': {ioe}")
-        except ValueError as ve:
-            raise ValueError(f"Failed to parse configuration file '{self.config_path}': {ve}")
-        except Exception as e:
-            raise Exception(f"Unexpected error while parsing configuration file '{self.config_path}': {e}") from e
+        # Determine the driver directory path for %APP% replacement from the config file location
+        driver_dir = os.path.dirname(os.path.abspath(self.config_path))
+        if not driver_dir or not os.path.isdir(driver_dir):
+            raise ValueError(f"Failed to parse configuration file '{self.config_path}': Invalid driver directory for %APP% replacement: '{driver_dir}'")
+
+        # Read the shared, %APP%-replaced configuration and lowercase keys like configparser does
+        try:
+            config = _load_config(self.config_path)
+        except ConfigError as ce:
+            raise configparser.Error(f"Failed to parse configuration file '{self.config_path}' after %APP% replacement: {ce}") from ce
+        except OSError as ose:
+            raise IOError(f"Failed to read configuration file '{self.config_path}': {ose}") from ose
+
+        data = {}
+        for section, values in config.items():
+            folded = data[section] = {}
+            for key, value in values.items():
+                lower_key = key.lower()
+                if lower_key in folded:
+                    # configparser compares keys after lowercasing them, so 'Key' and 'key' are duplicates
+                    raise configparser.DuplicateOptionError(section, lower_key, self.config_path)
+                folded[lower_key] = value
+        return data
 
     def _get_server_url(self, sp_num: int) -> str:
         """
@@ -123,6 +576,31 @@ class Appium:
         except ValueError as ve:
             raise ValueError(f"Failed to get server URL for Smartphone_{sp_num}: {ve}")
 
+def _require_device(method):
+    """
+    Decorates a Mobile method so it only runs for a loaded smartphone with an initialized driver.
+
+    sp_num may be passed positionally or by keyword; it is validated with Mobile._ensure_ready
+    before the method body runs, so the body can index self.devices[sp_num]["driver"] directly.
+
+    Args:
+        method: The Mobile method to wrap; it must take an sp_num parameter.
+
+    Returns:
+        The wrapped method.
+    """
+    sp_index = list(inspect.signature(method).parameters).index("sp_num") - 1  # Position after self
+
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        sp_num = args[sp_index] if len(args) > sp_index else kwargs.get("sp_num")
+        try:
+            self._ensure_ready(sp_num)
+        except ValueError as ve:
+            raise ValueError(f"{method.__name__} failed for Smartphone_{sp_num}: {ve}") from None
+        return method(self, *args, **kwargs)
+    return wrapper
+
 class Mobile:
     def __init__(self, config: dict = None):
         """
@@ -130,111 +608,101 @@ class Mobile:
         """
         self.config_path = None
         self.devices = {}  # Dictionary to store device configurations and drivers
+        self._options_cache = {}  # AppiumOptions keyed by (sp_num, frozenset of capabilities)
+        self._xpath_cache = {}  # Compiled etree.XPath objects keyed by expression
+        self._xpath_cache_lock = threading.Lock()  # Guards _xpath_cache; the *Multi methods query devices in threads
+        self._mappings = {}  # Parsed mapping files keyed by path, as (mtime, {logical name: XPath})
+        self._mapping_texts = {}  # Mapping file contents keyed by path, as (mtime, text)
+        self._element_types_root = None  # Last tree ELEMENT_TYPES was extracted from
+        self._xml_parsers = threading.local()  # One etree.XMLParser per thread, reused by its page source parses
+        self.page_source_ttl_ms = _PAGE_SOURCE_TTL_MS  # Age up to which a page source is reused by element queries; 0 always fetches
 
     def LoadPhoneConfiguration(self, path: str) -> None:
         """
         Creates device configurations for all smartphones defined in the config file without initializing drivers.
         """
-        try:
-            if not path or not isinstance(path, str):
-                raise ValueError(f"Invalid configuration path: '{path}' must be a non-empty string")
+        if not path or not isinstance(path, str):
+            raise ValueError(f"Failed to load configurations: Invalid configuration path: '{path}' must be a non-empty string")
+        if not os.path.isfile(path):
+            raise FileNotFoundError(f"Failed to load configuration file '{path}': Configuration file not found")
 
-            config = configparser.ConfigParser()
-            config.optionxform = str  # Preserve original case of keys
-            if not os.path.exists(path):
-                raise FileNotFoundError(f"Configuration file not found at '{path}'")
-            config.read(path, encoding="utf-8")
-
-            self.config_path = path
+        try:
+            config = _load_config(path)  # Preserves original case of keys
+        except ConfigError as ce:
+            raise configparser.Error(f"Failed to parse configuration file '{path}': {ce}") from ce
+
+        self.config_path = path
+
+        for section, values in config.items():
+            if not section.startswith("Smartphone_"):
+                continue
+            entry = self._build_device_entry(section, values)
+            if entry is not None:
+                # Add or refresh the device entry, keeping any runtime state (driver, ...)
+                sp_num, fields = entry
+                self.devices.setdefault(sp_num, {}).update(fields)
+
+    def _build_device_entry(self, section: str, values: Mapping[str, str]) -> Optional[Tuple[int, Dict[str, object]]]:
+        """
+        Builds the device entry for one Smartphone_* section of the configuration.
 
-            for section in config.sections():
-                if not section.startswith("Smartphone_"):
-                    continue
-                try:
-                    sp_num = int(section.replace("Smartphone_", ""))
-                    if sp_num < 0:
-                        continue
+        Args:
+            section (str): The section name, e.g. 'Smartphone_0'.
+            values (Mapping[str, str]): The case-preserved key-value pairs of the section.
 
-                    capabilities = dict(config[section])
-                    server_url = capabilities.get("appium:serverURL", capabilities.get("serverURL", ""))
-                    if not server_url:
-                        raise ValueError(f"No serverURL defined for {section}")
-
-                    # Determine platform
-                    platform_name = capabilities.get("platformName", capabilities.get("platformname", "")).lower()
-
-                    # Start building always_match for AppiumOptions
-                    always_match = {}
-
-                    if platform_name.lower() == "iOS".lower():
-                        always_match = {
-                            "appium:platformVersion": capabilities.get("platformVersion", capabilities.get("platformversion", "")),
-                            "appium:platformName": "iOS",
-                            "appium:deviceName": capabilities.get("deviceName", capabilities.get("devicename", "")),
-                            "appium:udid": capabilities.get("udid", ""),
-                            "appium:automationName": capabilities.get("automationName", capabilities.get("automationname", "XCUITest")),
-                            "appium:bundleId": capabilities.get("bundleId", capabilities.get("bundleid", "")),
-                            "appium:app": capabilities.get("app", ""),
-                            "appium:newCommandTimeout": int(capabilities.get("newCommandTimeout", capabilities.get("newcommandtimeout", 600))),
-                            "appium:usePrebuiltWDA": "true"
-                        }
-                        # Include additional keys from config not already in always_match
-                        for key, value in capabilities.items():
-                            appium_key = f"appium:{key}" if not key.startswith("appium:") else key
-                            if appium_key not in always_match:
-                                always_match[appium_key] = value
-
-                    elif platform_name.lower() == "android".lower():
-                        # Placeholder for future Android logic
-                        always_match = {
-                            "appium:platformName": "Android",
-                            "appium:platformVersion": capabilities.get("platformVersion", capabilities.get("platformversion", "")),
-                            "appium:deviceName": capabilities.get("deviceName", capabilities.get("devicename", "")),
-                            "appium:udid": capabilities.get("udid", ""),
-                            "appium:automationName": capabilities.get("automationName", capabilities.get("automationname", "UiAutomator2")),
-                            "appium:appPackage": capabilities.get("appPackage", capabilities.get("apppackage", "")),
-                            "appium:appActivity": capabilities.get("appActivity", capabilities.get("appactivity", "")),
-                            "appium:bundleId": capabilities.get("bundleId", capabilities.get("bundleid", "")),
-                            "appium:app": capabilities.get("app", ""),
-                            "appium:newCommandTimeout": int(capabilities.get("newCommandTimeout", capabilities.get("newcommandtimeout", 600))),
-                            "appium:usePrebuiltWDA": "true"
-                        }
-
-                    # Build AppiumOptions
-                    options = AppiumOptions()
-                    options.load_capabilities(always_match)
-
-                    # Initialize device entry if it doesn't exist
-                    if sp_num not in self.devices:
-                        self.devices[sp_num] = {}
-
-                    # Define the fields to update or add
-                    fields_to_update = {
-                        "capabilities": capabilities,
-                        "server_url": server_url,
-                        "options": options,
-                        "mapping_path": self._get_mapping_path(sp_num=sp_num)
-                    }
-
-                    # Update only if key exists or add new key
-                    for key, value in fields_to_update.items():
-                        if key in self.devices[sp_num]:
-                            self.devices[sp_num][key] = value
-                        else:
-                            self.devices[sp_num][key] = value
+        Returns:
+            Optional[Tuple[int, Dict[str, object]]]: The smartphone identifier and its device fields,
+                                                     or None if the section is skipped.
+        """
+        try:
+            sp_num = int(section.replace("Smartphone_", ""))
+            if sp_num < 0:
+                return None
 
-                except ValueError as ve:
-                    print(f"Warning: Failed to load configuration for {section}: {ve}")
-                    continue
+            # Read-only, with interned keys, so repeated lookups compare by identity
+            capabilities = MappingProxyType({sys.intern(k): v for k, v in values.items()})
+            # Fold keys to lowercase once so every lookup below is a single dict access
+            caps_lc = {k.lower(): v for k, v in capabilities.items()}
+            server_url = caps_lc.get("appium:serverurl") or caps_lc.get("serverurl", "")
+            if not server_url:
+                raise ValueError(f"No serverURL defined for {section}")
+
+            # Determine platform
+            pname = caps_lc.get("platformname", "").lower()
+
+            # Start building always_match for AppiumOptions
+            always_match = {}
+
+            spec = _PLATFORM_CAPS.get(pname)
+            if spec is not None:
+                always_match = {appium_key: caps_lc.get(ini_key, default) for appium_key, ini_key, default in spec}
+                always_match["appium:newCommandTimeout"] = int(always_match["appium:newCommandTimeout"])
+                always_match.update(_PLATFORM_FIXED_CAPS[pname])
+
+            if pname == "ios":
+                # Include additional keys from config not already in always_match
+                for key, value in capabilities.items():
+                    appium_key = key if key.startswith("appium:") else "appium:" + key
+                    if appium_key not in always_match:
+                        always_match[appium_key] = value
+
+            # Build AppiumOptions, reusing the cached instance when capabilities are unchanged
+            options = self._get_options(sp_num, always_match)
+
+            return sp_num, {
+                "capabilities": capabilities,
+                "server_url": server_url,
+                "options": options,
+                "mapping_path": self._get_mapping_path(sp_num=sp_num),
+                "dom_cache": {"fingerprint": None, "source": None, "tree": None, "fetched_at": None},
+                "platform_name": None,
+                "tap_script": None,
+                "window_size": None
+            }
 
-        except FileNotFoundError as fnf:
-            raise FileNotFoundError(f"Failed to load configuration file '{path}': {fnf}")
-        except configparser.Error as ce:
-            raise configparser.Error(f"Failed to parse configuration file '{path}': {ce}")
         except ValueError as ve:
-            raise ValueError(f"Failed to load configurations: {ve}")
-        except Exception as e:
-            raise Exception(f"Unexpected error while loading configuration file '{path}': {e}") from e
+            logger.warning("Failed to load configuration for %s: %s", section, ve)
+            return None
 
     def InitSmartphone(self, alternate_server: str = "", alternate_url: str = "", sp_num: Optional[int] = None) -> bool:
         """
@@ -245,16 +713,18 @@ class Mobile:
                 raise ValueError(f"Invalid sp_num: {sp_num} must be a non-negative integer")
             if sp_num not in self.devices:
                 raise ValueError(f"Device {sp_num} not found in loaded configurations")
+            dev = self.devices[sp_num]
 
-            url = alternate_url or alternate_server or self.devices[sp_num]["server_url"]
+            url = alternate_url or alternate_server or dev["server_url"]
             if not url or not isinstance(url, str):
                 raise ValueError(f"Invalid server URL: '{url}' must be a non-empty string")
 
             # Reinitialize driver with prebuilt AppiumOptions
-            self.devices[sp_num]["driver"] = webdriver.Remote(
+            dev["driver"] = webdriver.Remote(
                 command_executor=url,
-                options=self.devices[sp_num]["options"]
+                options=dev["options"]
             )
+            dev["window_size"] = None  # New session; query the screen size again
             return True
 
         except WebDriverException as wde:
@@ -299,36 +769,35 @@ class Mobile:
                 raise ValueError(f"Invalid sp_num: {sp_num} must be a non-negative integer")
             if sp_num not in self.devices:
                 raise ValueError(f"Device {sp_num} not found in loaded configurations")
+            dev = self.devices[sp_num]
             if not all(isinstance(x, str) and x for x in [device_name, phone_id, platform_name, platform_version, app_package, app_activity, url]):
                 raise ValueError("All parameters (device_name, phone_id, platform_name, platform_version, app_package, app_activity, url) must be non-empty strings")
 
-            if platform_name.lower() == "ios":
-                capabilities = {
-                    "appium:deviceName": device_name,
-                    "appium:udid": phone_id,
-                    "appium:platformName": platform_name,
-                    "appium:platformVersion": platform_version,
-                    "appium:automationName": self.devices[sp_num]["capabilities"].get("automationname", "XCUITest"),
-                    "appium:bundleId": bundle_id,
-                    "appium:newCommandTimeout": self.devices[sp_num]["capabilities"].get("appium:newCommandTimeout", 600),
-                    "appium:usePrebuiltWDA": self.devices[sp_num]["capabilities"].get("appium:usePrebuiltWDA", "true")
-                }
-            elif platform_name.lower() == "android":
-                capabilities = {
-                    "appium:deviceName": device_name,
-                    "appium:udid": phone_id,
-                    "appium:platformName": platform_name,
-                    "appium:platformVersion": platform_version,
-                    "appium:automationName": self.devices[sp_num]["capabilities"].get("automationname", "UiAutomator2"),
-                    "appium:appPackage" = app_package
-                    "appium:appActivity" = app_activity
-                    "appium:newCommandTimeout": self.devices[sp_num]["capabilities"].get("appium:newCommandTimeout", 600),
-                    "appium:usePrebuiltWDA": self.devices[sp_num]["capabilities"].get("appium:usePrebuiltWDA", "true")
-                }
-
-            options = AppiumOptions()
-            options.load_capabilities(capabilities)
-            self.devices[sp_num]["driver"] = webdriver.Remote(command_executor=url, options=options)
+            pname = platform_name.lower()
+            if pname not in _PLATFORM_CAPS:
+                raise ValueError(f"Unsupported platform_name: '{platform_name}' must be iOS or Android")
+
+            caps = dev["capabilities"]
+            capabilities = {
+                "appium:deviceName": device_name,
+                "appium:udid": phone_id,
+                "appium:platformName": platform_name,
+                "appium:platformVersion": platform_version,
+                "appium:automationName": caps.get("automationname", _AUTOMATION_NAMES[pname]),
+                _KEY_NEW_CMD: caps.get(_KEY_NEW_CMD, 600),
+                _KEY_USE_WDA: caps.get(_KEY_USE_WDA, "true")
+            }
+            if pname == "ios":
+                capabilities["appium:bundleId"] = bundle_id
+            else:
+                capabilities["appium:appPackage"] = app_package
+                capabilities["appium:appActivity"] = app_activity
+
+            options = self._get_options(sp_num, capabilities)
+            dev["driver"] = webdriver.Remote(command_executor=url, options=options)
+            dev["window_size"] = None  # New session; query the screen size again
+            dev["platform_name"] = pname  # Taps dispatch on the platform this session was started with
+            dev["tap_script"] = _TAP_SCRIPTS[pname]
             return True
 
         except ValueError as ve:
@@ -336,6 +805,37 @@ class Mobile:
         except WebDriverException as wde:
             raise WebDriverException(f"Failed to start application with bundleId '{app_activity}' for Smartphone_{sp_num}: {wde}")
 
+    def _build_options(self, capabilities: Dict[str, object]) -> AppiumOptions:
+        """
+        Builds AppiumOptions from a capabilities dictionary.
+
+        Args:
+            capabilities (Dict[str, object]): The capabilities to load.
+
+        Returns:
+            AppiumOptions: The options with the capabilities loaded.
+        """
+        options = AppiumOptions()
+        options.load_capabilities(capabilities)
+        return options
+
+    def _get_options(self, sp_num: int, capabilities: Dict[str, object]) -> AppiumOptions:
+        """
+        Returns the AppiumOptions for a device, building them only once per distinct set of capabilities.
+
+        Args:
+            sp_num (int): Smartphone identifier.
+            capabilities (Dict[str, object]): The capabilities to load.
+
+        Returns:
+            AppiumOptions: The cached or newly built options.
+        """
+        key = (sp_num, frozenset(capabilities.items()))
+        options = self._options_cache.get(key)
+        if options is None:
+            options = self._options_cache[key] = self._build_options(capabilities)
+        return options
+
     def GoToWindow(self, target_window: str, sp_num: Optional[int] = None) -> bool:
         """
         Simulates navigation to a specific window or context.
@@ -351,15 +851,10 @@ class Mobile:
             ValueError: If target_window is invalid or sp_num is not found.
             WebDriverException: If driver is not initialized.
         """
-        if sp_num is None or not isinstance(sp_num, int) or sp_num < 0:
-            raise ValueError(f"Invalid sp_num: {sp_num} must be a non-negative integer")
-        if sp_num not in self.devices:
-            raise ValueError(f"Device {sp_num} not found in loaded configurations")
-        if self.devices[sp_num]["driver"] is None:
-            raise ValueError(f"InitSmartphone must be called first for device {sp_num}")
+        self._ensure_ready(sp_num)
         raise NotImplementedError("Simulated Go To Window (not implemented)")
 
-    def SwipeLeft(self, repeat_count: int, back_interval_ms: float, sp_num: Optional[int] = None) -> bool:
+    def SwipeLeft(self, repeat_count: int, back_interval_ms: float, sp_num: Optional[int] = None, legacy: bool = False) -> bool:
         """
         Performs left swipe gestures on the specified smartphone.
 
@@ -367,6 +862,8 @@ class Mobile:
             repeat_count (int): Number of swipes to perform.
             back_interval_ms (float): Delay between swipes in milliseconds.
             sp_num (Optional[int]): Smartphone identifier.
+            legacy (bool): If True, sends one driver.swipe request per swipe and sleeps in between, as before
+                the batched action sequence (for servers without W3C actions support).
 
         Returns:
             bool: True if swipes are successful.
@@ -376,20 +873,13 @@ class Mobile:
             WebDriverException: If the swipe operation fails.
         """
         try:
-            if sp_num is None or not isinstance(sp_num, int) or sp_num < 0:
-                raise ValueError(f"Invalid sp_num: {sp_num} must be a non-negative integer")
-            if sp_num not in self.devices:
-                raise ValueError(f"Device {sp_num} not found in loaded configurations")
+            self._ensure_ready(sp_num)
             if not isinstance(repeat_count, int) or repeat_count < 0:
                 raise ValueError(f"Invalid repeat_count: {repeat_count} must be a non-negative integer")
             if not isinstance(back_interval_ms, (int, float)) or back_interval_ms < 0:
                 raise ValueError(f"Invalid back_interval_ms: {back_interval_ms} must be non-negative")
-            if self.devices[sp_num]["driver"] is None:
-                raise ValueError(f"InitSmartphone must be called first for device {sp_num}")
 
-            for _ in range(repeat_count):
-                self.devices[sp_num]["driver"].swipe(550, 500, 450, 500, 300)
-                time.sleep(back_interval_ms / 1000.0)
+            self._swipe(sp_num, 550, 500, 450, 500, repeat_count, back_interval_ms, legacy=legacy)
             return True
 
         except ValueError as ve:
@@ -397,7 +887,7 @@ class Mobile:
         except WebDriverException as wde:
             raise WebDriverException(f"Failed to perform left swipe with repeat_count={repeat_count} for Smartphone_{sp_num}: {wde}")
 
-    def SwipeRight(self, repeat_count: int, back_interval_ms: float, sp_num: Optional[int] = None) -> bool:
+    def SwipeRight(self, repeat_count: int, back_interval_ms: float, sp_num: Optional[int] = None, legacy: bool = False) -> bool:
         """
         Performs right swipe gestures on the specified smartphone.
 
@@ -405,6 +895,8 @@ class Mobile:
             repeat_count (int): Number of swipes to perform.
             back_interval_ms (float): Delay between swipes in milliseconds.
             sp_num (Optional[int]): Smartphone identifier.
+            legacy (bool): If True, sends one driver.swipe request per swipe and sleeps in between, as before
+                the batched action sequence (for servers without W3C actions support).
 
         Returns:
             bool: True if swipes are successful.
@@ -414,20 +906,13 @@ class Mobile:
             WebDriverException: If the swipe operation fails.
         """
         try:
-            if sp_num is None or not isinstance(sp_num, int) or sp_num < 0:
-                raise ValueError(f"Invalid sp_num: {sp_num} must be a non-negative integer")
-            if sp_num not in self.devices:
-                raise ValueError(f"Device {sp_num} not found in loaded configurations")
+            self._ensure_ready(sp_num)
             if not isinstance(repeat_count, int) or repeat_count < 0:
                 raise ValueError(f"Invalid repeat_count: {repeat_count} must be a non-negative integer")
             if not isinstance(back_interval_ms, (int, float)) or back_interval_ms < 0:
                 raise ValueError(f"Invalid back_interval_ms: {back_interval_ms} must be non-negative")
-            if self.devices[sp_num]["driver"] is None:
-                raise ValueError(f"InitSmartphone must be called first for device {sp_num}")
 
-            for _ in range(repeat_count):
-                self.devices[sp_num]["driver"].swipe(450, 500, 550, 500, 300)
-                time.sleep(back_interval_ms / 1000.0)
+            self._swipe(sp_num, 450, 500, 550, 500, repeat_count, back_interval_ms, legacy=legacy)
             return True
 
         except ValueError as ve:
@@ -435,7 +920,7 @@ class Mobile:
         except WebDriverException as wde:
             raise WebDriverException(f"Failed to perform right swipe with repeat_count={repeat_count} for Smartphone_{sp_num}: {wde}")
 
-    def SwipeUp(self, swipe_count: int, interval_ms: float, sp_num: Optional[int] = None) -> bool:
+    def SwipeUp(self, swipe_count: int, interval_ms: float, sp_num: Optional[int] = None, legacy: bool = False) -> bool:
         """
         Performs upward swipe gestures on the specified smartphone.
 
@@ -443,6 +928,8 @@ class Mobile:
             swipe_count (int): Number of swipes to perform.
             interval_ms (float): Delay between swipes in milliseconds.
             sp_num (Optional[int]): Smartphone identifier.
+            legacy (bool): If True, sends one driver.swipe request per swipe and sleeps in between, as before
+                the batched action sequence (for servers without W3C actions support).
 
         Returns:
             bool: True if swipes are successful.
@@ -452,20 +939,13 @@ class Mobile:
             WebDriverException: If the swipe operation fails.
         """
         try:
-            if sp_num is None or not isinstance(sp_num, int) or sp_num < 0:
-                raise ValueError(f"Invalid sp_num: {sp_num} must be a non-negative integer")
-            if sp_num not in self.devices:
-                raise ValueError(f"Device {sp_num} not found in loaded configurations")
+            self._ensure_ready(sp_num)
             if not isinstance(swipe_count, int) or swipe_count < 0:
                 raise ValueError(f"Invalid swipe_count: {swipe_count} must be a non-negative integer")
             if not isinstance(interval_ms, (int, float)) or interval_ms < 0:
                 raise ValueError(f"Invalid interval_ms: {interval_ms} must be non-negative")
-            if self.devices[sp_num]["driver"] is None:
-                raise ValueError(f"InitSmartphone must be called first for device {sp_num}")
 
-            for _ in range(swipe_count):
-                self.devices[sp_num]["driver"].swipe(500, 550, 500, 450, 300)
-                time.sleep(interval_ms / 1000.0)
+            self._swipe(sp_num, 500, 550, 500, 450, swipe_count, interval_ms, legacy=legacy)
             return True
 
         except ValueError as ve:
@@ -473,7 +953,7 @@ class Mobile:
         except WebDriverException as wde:
             raise WebDriverException(f"Failed to perform upward swipe with swipe_count={swipe_count} for Smartphone_{sp_num}: {wde}")
 
-    def SwipeDown(self, swipe_count: int, interval_ms: float, sp_num: Optional[int] = None) -> bool:
+    def SwipeDown(self, swipe_count: int, interval_ms: float, sp_num: Optional[int] = None, legacy: bool = False) -> bool:
         """
         Performs downward swipe gestures on the specified smartphone.
 
@@ -481,6 +961,8 @@ class Mobile:
             swipe_count (int): Number of swipes to perform.
             interval_ms (float): Delay between swipes in milliseconds.
             sp_num (Optional[int]): Smartphone identifier.
+            legacy (bool): If True, sends one driver.swipe request per swipe and sleeps in between, as before
+                the batched action sequence (for servers without W3C actions support).
 
         Returns:
             bool: True if swipes are successful.
@@ -490,20 +972,13 @@ class Mobile:
             WebDriverException: If the swipe operation fails.
         """
         try:
-            if sp_num is None or not isinstance(sp_num, int) or sp_num < 0:
-                raise ValueError(f"Invalid sp_num: {sp_num} must be a non-negative integer")
-            if sp_num not in self.devices:
-                raise ValueError(f"Device {sp_num} not found in loaded configurations")
+            self._ensure_ready(sp_num)
             if not isinstance(swipe_count, int) or swipe_count < 0:
                 raise ValueError(f"Invalid swipe_count: {swipe_count} must be a non-negative integer")
             if not isinstance(interval_ms, (int, float)) or interval_ms < 0:
                 raise ValueError(f"Invalid interval_ms: {interval_ms} must be non-negative")
-            if self.devices[sp_num]["driver"] is None:
-                raise ValueError(f"InitSmartphone must be called first for device {sp_num}")
 
-            for _ in range(swipe_count):
-                self.devices[sp_num]["driver"].swipe(500, 450, 500, 550, 300)
-                time.sleep(interval_ms / 1000.0)
+            self._swipe(sp_num, 500, 450, 500, 550, swipe_count, interval_ms, legacy=legacy)
             return True
 
         except ValueError as ve:
@@ -511,6 +986,85 @@ class Mobile:
         except WebDriverException as wde:
             raise WebDriverException(f"Failed to perform downward swipe with swipe_count={swipe_count} for Smartphone_{sp_num}: {wde}")
 
+    def _swipe(self, sp_num: int, start_x: int, start_y: int, end_x: int, end_y: int, count: int, interval_ms: float, duration_ms: int = 300, legacy: bool = False) -> None:
+        """
+        Performs repeated swipes as a single W3C touch action sequence, dispatched in one request.
+
+        With legacy, each swipe is a driver.swipe request followed by the interval sleep instead.
+
+        Args:
+            sp_num (int): Smartphone identifier.
+            start_x (int): X coordinate where each swipe starts.
+            start_y (int): Y coordinate where each swipe starts.
+            end_x (int): X coordinate where each swipe ends.
+            end_y (int): Y coordinate where each swipe ends.
+            count (int): Number of swipes to perform.
+            interval_ms (float): Pause between consecutive swipes in milliseconds.
+            duration_ms (int): Duration of each swipe movement in milliseconds.
+            legacy (bool): Whether to send the swipes one by one with driver.swipe.
+
+        Raises:
+            WebDriverException: If the action sequence fails.
+        """
+        if count <= 0:
+            return
+        if legacy:
+            driver = self.devices[sp_num]["driver"]
+            for _ in range(count):
+                driver.swipe(start_x, start_y, end_x, end_y, duration_ms)
+                time.sleep(interval_ms / 1000.0)
+            self._invalidate_dom(sp_num)
+            return
+        finger = PointerInput(interaction.POINTER_TOUCH, "finger")
+        actions = ActionBuilder(self.devices[sp_num]["driver"], mouse=finger)
+        for i in range(count):
+            if i and interval_ms:
+                finger.create_pause(interval_ms / 1000.0)
+            finger.create_pointer_move(duration=0, x=start_x, y=start_y)
+            finger.create_pointer_down(button=MouseButton.LEFT)
+            finger.create_pointer_move(duration=duration_ms, x=end_x, y=end_y)
+            finger.create_pointer_up(button=MouseButton.LEFT)
+        actions.perform()
+        self._invalidate_dom(sp_num)
+
+    def _native_swipe(self, sp_num: int, start_x: int, start_y: int, end_x: int, end_y: int, duration_ms: int = 300) -> None:
+        """
+        Performs a single swipe with the platform's native gesture, returning once the gesture is complete.
+
+        Android uses 'mobile: swipeGesture' over a one-pixel wide (or high) region spanning the swipe.
+        iOS and other platforms use a W3C touch action: 'mobile: dragFromToForDuration' holds the finger
+        for its duration (0.5 s at least) before dragging, which turns a swipe into a long press and drag.
+
+        Args:
+            sp_num (int): Smartphone identifier.
+            start_x (int): X coordinate where the swipe starts.
+            start_y (int): Y coordinate where the swipe starts.
+            end_x (int): X coordinate where the swipe ends.
+            end_y (int): Y coordinate where the swipe ends.
+            duration_ms (int): Duration of the swipe movement in milliseconds.
+
+        Raises:
+            WebDriverException: If the gesture fails.
+        """
+        if self._platform_name(sp_num) == "android":
+            dx, dy = end_x - start_x, end_y - start_y
+            if abs(dy) >= abs(dx):
+                region = {"left": start_x, "top": min(start_y, end_y), "width": 1, "height": max(abs(dy), 1)}
+                direction = "down" if dy > 0 else "up"
+                distance = abs(dy)
+            else:
+                region = {"left": min(start_x, end_x), "top": start_y, "width": max(abs(dx), 1), "height": 1}
+                direction = "right" if dx > 0 else "left"
+                distance = abs(dx)
+            speed = int(distance * 1000 / max(duration_ms, 1))  # pixels per second
+            self.devices[sp_num]["driver"].execute_script(
+                "mobile: swipeGesture",
+                dict(region, direction=direction, percent=1.0, speed=max(speed, 1))
+            )
+        else:
+            self._swipe(sp_num, start_x, start_y, end_x, end_y, 1, 0, duration_ms)
+        self._invalidate_dom(sp_num)
+
     def SetElementText(self, element: str, text: str, append: bool, sp_num: Optional[int] = None) -> bool:
         """
         Sets the text of an element on the specified smartphone, optionally appending to existing text.
@@ -531,22 +1085,17 @@ class Mobile:
             WebDriverException: If there is an issue with the WebDriver during text setting.
         """
         try:
-            if sp_num is None or not isinstance(sp_num, int) or sp_num < 0:
-                raise ValueError(f"Invalid sp_num: {sp_num} must be a non-negative integer")
-            if sp_num not in self.devices:
-                raise ValueError(f"Device {sp_num} not found in loaded configurations")
+            dev = self._ensure_ready(sp_num)
             if not element or not isinstance(element, str):
                 raise ValueError(f"Invalid element: '{element}' must be a non-empty string")
             if not isinstance(text, str):
                 raise ValueError(f"Invalid text: '{text}' must be a string")
             if not isinstance(append, bool):
                 raise ValueError(f"Invalid append: {append} must be a boolean")
-            if self.devices[sp_num]["driver"] is None:
-                raise ValueError(f"InitSmartphone must be called first for device {sp_num}")
 
             xpath = None
-            xml_source = self.devices[sp_num]["driver"].page_source
-            self.mapping_path = self.devices[sp_num]["mapping_path"]
+            locator = None
+            root = self._get_dom(sp_num, ttl_ms=self.page_source_ttl_ms)
             elem = None
             text_to_find = element
 
@@ -554,44 +1103,46 @@ class Mobile:
             if element.startswith("/"):
                 xpath = element
                 # Extract name value for fallback if XPath is for XCUIElementTypeOther
-                match = re.search(r"@name='([^']*)'", element)
+                match = _NAME_ATTR_RE.search(element)
                 if match:
                     text_to_find = match.group(1).strip()
             else:
                 # Try resolving the element as a logical name
-                xpath = self._resolve_xpath(element)
+                xpath = self._resolve_xpath(element, dev["mapping_path"])
 
             if xpath is not None:
                 # Use the provided or resolved XPath to get the element
-                elem = self._get_element_from_xpath(xml=xml_source, xpath=xpath)
+                elem = self._get_element_from_xpath(xml=root, xpath=xpath)
 
-            # Fallback to finding the deepest matching element by text
-            if elem is None:
-                match = self._get_deepest_matching_element(xml=xml_source, text_to_find=text_to_find, sp_num=sp_num)
+            if elem is not None:
+                locator = (AppiumBy.XPATH, xpath)
+            else:
+                # Fallback to finding the deepest matching element by text
+                match = self._get_deepest_matching_element(xml=root, text_to_find=text_to_find, sp_num=sp_num)
                 if match is not None:
                     elem = match["element"]
-                    # Construct XPath from the found element
-                    xpath = self._element_to_xpath(elem)
-                    if xpath is None:
-                        raise ValueError(f"Could not construct XPath for element '{element}'")
-                    # Re-fetch element with constructed XPath for consistency
-                    elem = self._get_element_from_xpath(xml=xml_source, xpath=xpath)
+                    # Query the match by its attributes when they identify it alone in the page source; otherwise
+                    # the indexed XPath built from the tree makes sure the text goes to this very field
+                    locator = self._native_locator(elem, self._platform_name(sp_num) == "ios")
+                    if locator is None:
+                        xpath = self._element_to_xpath(elem)
+                        if xpath is None:
+                            raise ValueError(f"Could not construct XPath for element '{element}'")
+                        locator = (AppiumBy.XPATH, xpath)
 
             # If no element is found, raise an exception
             if elem is None:
                 raise ValueError(f"No element found for '{element}' in XML source")
 
             # Check if the element is visible and enabled
-            is_visible = self._is_element_visible(elem, sp_num=sp_num)
-            is_enabled = elem.attrib.get("enabled", "false").lower() == "true"
-            if not (is_visible and is_enabled):
-                raise AssertionError(f"Element '{element}' is not editable (visible={is_visible}, enabled={is_enabled})")
+            self._assert_interactable(elem, element, "editable", sp_num=sp_num)
 
             # Fetch WebDriver element for text operations
-            webdriver_elem = self.devices[sp_num]["driver"].find_element(AppiumBy.XPATH, xpath)
+            webdriver_elem = dev["driver"].find_element(*locator)
             if not append:
                 webdriver_elem.clear()
             webdriver_elem.send_keys(text)
+            self._invalidate_dom(sp_num)
             return True
 
         except AssertionError:
@@ -601,8 +1152,9 @@ class Mobile:
         except etree.LxmlError as le:
             raise etree.LxmlError(f"Failed to set text for element '{element}' on Smartphone_{sp_num} due to XML parsing: {le}")
         except WebDriverException as wde:
-            raise WebDriverException(f"Failed to set text for element '{element}' with XPath '{xpath}' on Smartphone_{sp_num}: {wde}")
+            raise WebDriverException(f"Failed to set text for element '{element}' with locator {locator} on Smartphone_{sp_num}: {wde}")
 
+    @_require_device
     def GoBack(self, repeat_count: int, back_interval_ms: float, sp_num: Optional[int] = None) -> bool:
         """
         Performs back navigation on the specified smartphone.
@@ -620,20 +1172,19 @@ class Mobile:
             WebDriverException: If the back operation fails.
         """
         try:
-            if sp_num is None or not isinstance(sp_num, int) or sp_num < 0:
-                raise ValueError(f"Invalid sp_num: {sp_num} must be a non-negative integer")
-            if sp_num not in self.devices:
-                raise ValueError(f"Device {sp_num} not found in loaded configurations")
+            dev = self.devices[sp_num]
             if not isinstance(repeat_count, int) or repeat_count < 0:
                 raise ValueError(f"Invalid repeat_count: {repeat_count} must be a non-negative integer")
             if not isinstance(back_interval_ms, (int, float)) or back_interval_ms < 0:
                 raise ValueError(f"Invalid back_interval_ms: {back_interval_ms} must be non-negative")
-            if self.devices[sp_num]["driver"] is None:
-                raise ValueError(f"InitSmartphone must be called first for device {sp_num}")
 
-            for _ in range(repeat_count):
-                self.devices[sp_num]["driver"].back()
-                time.sleep(back_interval_ms / 1000.0)
+            driver = dev["driver"]
+            for i in range(repeat_count):
+                # Only wait between presses; nothing follows the last one
+                if i and back_interval_ms:
+                    time.sleep(back_interval_ms / 1000.0)
+                driver.back()
+            self._invalidate_dom(sp_num)
             return True
 
         except ValueError as ve:
@@ -649,15 +1200,9 @@ class Mobile:
             sp_num (Optional[int]): Smartphone identifier.
 
         Raises:
-            ValueError: If sp_num is invalid or not found.
-            NotImplementedError: Always raised as the method is not implemented.
+            NotImplementedError: Always raised as the method is not implemented; sp_num
+                is not validated first.
         """
-        if sp_num is None or not isinstance(sp_num, int) or sp_num < 0:
-            raise ValueError(f"Invalid sp_num: {sp_num} must be a non-negative integer")
-        if sp_num not in self.devices:
-            raise ValueError(f"Device {sp_num} not found in loaded configurations")
-        if self.devices[sp_num]["driver"] is None:
-            raise ValueError(f"InitSmartphone must be called first for device {sp_num}")
         raise NotImplementedError("Simulated enabling BLE (not implemented)")
 
     def DisableBLE(self, sp_num: Optional[int] = None) -> bool:
@@ -668,17 +1213,12 @@ class Mobile:
             sp_num (Optional[int]): Smartphone identifier.
 
         Raises:
-            ValueError: If sp_num is invalid or not found.
-            NotImplementedError: Always raised as the method is not implemented.
+            NotImplementedError: Always raised as the method is not implemented; sp_num
+                is not validated first.
         """
-        if sp_num is None or not isinstance(sp_num, int) or sp_num < 0:
-            raise ValueError(f"Invalid sp_num: {sp_num} must be a non-negative integer")
-        if sp_num not in self.devices:
-            raise ValueError(f"Device {sp_num} not found in loaded configurations")
-        if self.devices[sp_num]["driver"] is None:
-            raise ValueError(f"InitSmartphone must be called first for device {sp_num}")
         raise NotImplementedError("Simulated disabling BLE (not implemented)")
 
+    @_require_device
     def ShowNotificationControlPanel(self, sp_num: Optional[int] = None) -> bool:
         """
         Shows the notification control panel on the specified smartphone by swiping down and verifying a Bluetooth button.
@@ -695,65 +1235,14 @@ class Mobile:
             TimeoutError: If the Bluetooth button is not visible within 5 seconds.
         """
         try:
-            if sp_num is None or not isinstance(sp_num, int) or sp_num < 0:
-                raise ValueError(f"Invalid sp_num: {sp_num} must be a non-negative integer")
-            if sp_num not in self.devices:
-                raise ValueError(f"Device {sp_num} not found in loaded configurations")
-            if self.devices[sp_num]["driver"] is None:
-                raise ValueError(f"InitSmartphone must be called first for device {sp_num}")
-
-            size = self.devices[sp_num]["driver"].get_window_size()
-            if not isinstance(size, dict) or 'width' not in size or 'height' not in size:
-                raise ValueError("Invalid screen dimensions returned by driver")
+            screen_width, screen_height = self._get_window_size(sp_num)
 
-            self.mapping_path = self.devices[sp_num]["mapping_path"]
-            start_x = size['width'] - 10
+            start_x = screen_width - 10
             start_y = 10
-            end_y = size['height'] // 2
-            self.devices[sp_num]["driver"].swipe(start_x, start_y, start_x, end_y, 400)
-
-            # Check if BLE_Indicator is present and non-empty
-            ble_indicator = self._get_capability(sp_num, 'BLE_Indicator')
-            if not ble_indicator:
-                return True  # Bypass check if BLE_Indicator is absent or empty
+            end_y = screen_height // 2
+            self._native_swipe(sp_num, start_x, start_y, start_x, end_y, 400)
 
-            # Initialize XPath
-            xpath = None
-            if ble_indicator.startswith("/"):
-                xpath = ble_indicator
-            else:
-                xpath = self._resolve_xpath(ble_indicator)
-
-            if not xpath:
-                raise ValueError(f"Invalid XPath resolved from BLE_Indicator: '{ble_indicator}'")
-
-            # Normalize XPath quotes and create variations
-            normalized_xpath = re.sub(r"@(\w+)=[']([^']*?)[']", r'@\1="\2"', xpath)
-            xpath_variations = [
-                xpath,
-                normalized_xpath,
-                re.sub(r"@(\w+)=['\"]([^'\"]*?)['\"]", r'@\1[normalize-space(.)="\2"]', normalized_xpath),
-                re.sub(r"@(\w+)=['\"]([^'\"]*?)['\"]", r'@\1[contains(., "\2")]', normalized_xpath)
-            ]
-
-            end_time = time.time() + 5
-            while time.time() < end_time:
-                xml_source = self.devices[sp_num]["driver"].page_source
-                for alt_xpath in xpath_variations:
-                    try:
-                        # Check element presence in XML
-                        elem = self._get_element_from_xpath(xml=xml_source, xpath=alt_xpath)
-                        if elem is None:
-                            return True  # Element not found, considered not visible
-                        # Check if element is visible
-                        is_visible = self._is_element_visible(elem, sp_num=sp_num)
-                        if not is_visible:
-                            return True  # Element not visible
-                    except (NoSuchElementException, etree.LxmlError):
-                        return True  # Element not found or XML error, considered not visible
-                time.sleep(0.3)
-
-            raise TimeoutError("Timeout after 5s: Bluetooth indicator still visible in notification control panel")
+            return self._wait_ble_indicator_hidden(sp_num, timeout=5)
 
         except ValueError as ve:
             raise ValueError(f"Failed to check Bluetooth indicator for Smartphone_{sp_num}: {ve}")
@@ -762,6 +1251,7 @@ class Mobile:
         except TimeoutError:
             raise  # Re-raise TimeoutError
 
+    @_require_device
     def HideNotificationControlPanel(self, sp_num: Optional[int] = None) -> bool:
         """
         Hides the notification control panel on the specified smartphone by swiping up and verifying the Bluetooth button is not visible.
@@ -778,65 +1268,14 @@ class Mobile:
             TimeoutError: If the Bluetooth button remains visible after 5 seconds.
         """
         try:
-            if sp_num is None or not isinstance(sp_num, int) or sp_num < 0:
-                raise ValueError(f"Invalid sp_num: {sp_num} must be a non-negative integer")
-            if sp_num not in self.devices:
-                raise ValueError(f"Device {sp_num} not found in loaded configurations")
-            if self.devices[sp_num]["driver"] is None:
-                raise ValueError(f"InitSmartphone must be called first for device {sp_num}")
-
-            size = self.devices[sp_num]["driver"].get_window_size()
-            if not isinstance(size, dict) or 'width' not in size or 'height' not in size:
-                raise ValueError("Invalid screen dimensions returned by driver")
+            screen_width, screen_height = self._get_window_size(sp_num)
 
-            self.mapping_path = self.devices[sp_num]["mapping_path"]
-            start_x = size['width'] // 2
-            start_y = size['height'] - 100
+            start_x = screen_width // 2
+            start_y = screen_height - 100
             end_y = 100
-            self.devices[sp_num]["driver"].swipe(start_x, start_y, start_x, end_y, 400)
+            self._native_swipe(sp_num, start_x, start_y, start_x, end_y, 400)
 
-            # Check if BLE_Indicator is present and non-empty
-            ble_indicator = self._get_capability(sp_num, 'BLE_Indicator')
-            if not ble_indicator:
-                return True  # Bypass check if BLE_Indicator is absent or empty
-
-            # Initialize XPath
-            xpath = None
-            if ble_indicator.startswith("/"):
-                xpath = ble_indicator
-            else:
-                xpath = self._resolve_xpath(ble_indicator)
-
-            if not xpath:
-                raise ValueError(f"Invalid XPath resolved from BLE_Indicator: '{ble_indicator}'")
-
-            # Normalize XPath quotes and create variations
-            normalized_xpath = re.sub(r"@(\w+)=[']([^']*?)[']", r'@\1="\2"', xpath)
-            xpath_variations = [
-                xpath,
-                normalized_xpath,
-                re.sub(r"@(\w+)=['\"]([^'\"]*?)['\"]", r'@\1[normalize-space(.)="\2"]', normalized_xpath),
-                re.sub(r"@(\w+)=['\"]([^'\"]*?)['\"]", r'@\1[contains(., "\2")]', normalized_xpath)
-            ]
-
-            end_time = time.time() + 5
-            while time.time() < end_time:
-                xml_source = self.devices[sp_num]["driver"].page_source
-                for alt_xpath in xpath_variations:
-                    try:
-                        # Check element presence in XML
-                        elem = self._get_element_from_xpath(xml=xml_source, xpath=alt_xpath)
-                        if elem is None:
-                            return True  # Element not found, considered not visible
-                        # Check if element is visible
-                        is_visible = self._is_element_visible(elem, sp_num=sp_num)
-                        if not is_visible:
-                            return True  # Element not visible
-                    except (NoSuchElementException, etree.LxmlError):
-                        return True  # Element not found or XML error, considered not visible
-                time.sleep(0.3)
-
-            raise TimeoutError("Timeout after 5s: Bluetooth indicator still visible in notification control panel")
+            return self._wait_ble_indicator_hidden(sp_num, timeout=5)
 
         except ValueError as ve:
             raise ValueError(f"Failed to check Bluetooth indicator for Smartphone_{sp_num}: {ve}")
@@ -845,6 +1284,59 @@ class Mobile:
         except TimeoutError:
             raise  # Re-raise TimeoutError
 
+    def _wait_ble_indicator_hidden(self, sp_num: int, timeout: float = 5) -> bool:
+        """
+        Waits until the Bluetooth indicator configured as BLE_Indicator is absent or not displayed.
+
+        The XPath is resolved and its variations are built once; the driver then polls for them
+        directly, so no page source is transferred or parsed while waiting.
+
+        Args:
+            sp_num (int): Smartphone identifier.
+            timeout (float): Maximum time to wait in seconds.
+
+        Returns:
+            bool: True once the first XPath variation that evaluates matches no displayed element, or if
+                  no BLE_Indicator is configured.
+
+        Raises:
+            ValueError: If the BLE_Indicator cannot be resolved to a valid XPath.
+            TimeoutError: If the indicator is still displayed after the timeout.
+        """
+        # Check if BLE_Indicator is present and non-empty
+        ble_indicator = self._get_capability(sp_num, 'BLE_Indicator')
+        if not ble_indicator:
+            return True  # Bypass check if BLE_Indicator is absent or empty
+
+        if ble_indicator.startswith("/"):
+            xpath = ble_indicator
+        else:
+            xpath = self._resolve_xpath(ble_indicator, self.devices[sp_num]["mapping_path"])
+        if not xpath:
+            raise ValueError(f"Invalid XPath resolved from BLE_Indicator: '{ble_indicator}'")
+
+        # The driver takes no XPath variables, so each strategy is sent in its canonical string form
+        variations = tuple(canonical for _, canonical in _xpath_templates(xpath)[0])
+
+        def indicator_hidden(driver) -> bool:
+            for alt_xpath in variations:
+                try:
+                    elements = driver.find_elements(AppiumBy.XPATH, alt_xpath)
+                except InvalidSelectorException:
+                    continue  # Fall back to the next variation only if this one cannot be evaluated
+                try:
+                    return not any(element.is_displayed() for element in elements)
+                except StaleElementReferenceException:
+                    return True  # The indicator went away while it was being checked
+            raise ValueError(f"No valid XPath variation for BLE_Indicator: '{xpath}'")
+
+        try:
+            WebDriverWait(self.devices[sp_num]["driver"], timeout, poll_frequency=0.3).until(indicator_hidden)
+        except TimeoutException:
+            raise TimeoutError(f"Timeout after {timeout}s: Bluetooth indicator still visible in notification control panel")
+        return True
+
+    @_require_device
     def UnlockDevice(self, sp_num: Optional[int] = None) -> bool:
         """
         Unlocks the specified smartphone.
@@ -860,19 +1352,17 @@ class Mobile:
             WebDriverException: If the unlock operation fails.
         """
         try:
-            if sp_num is None or not isinstance(sp_num, int) or sp_num < 0:
-                raise ValueError(f"Invalid sp_num: {sp_num} must be a non-negative integer")
-            if sp_num not in self.devices:
-                raise ValueError(f"Device {sp_num} not found in loaded configurations")
-            if self.devices[sp_num]["driver"] is None:
-                raise ValueError(f"InitSmartphone must be called first for device {sp_num}")
-            self.devices[sp_num]["driver"].unlock()
+            dev = self.devices[sp_num]
+            driver = dev["driver"]
+            driver.unlock()
+            self._invalidate_dom(sp_num)
             return True
         except WebDriverException as wde:
             raise WebDriverException(f"Failed to unlock device for Smartphone_{sp_num}: {wde}")
         except ValueError as ve:
             raise ValueError(f"Failed to unlock device for Smartphone_{sp_num}: {ve}")
 
+    @_require_device
     def LockDevice(self, sp_num: Optional[int] = None) -> bool:
         """
         Locks the specified smartphone.
@@ -888,28 +1378,30 @@ class Mobile:
             WebDriverException: If the lock operation fails.
         """
         try:
-            if sp_num is None or not isinstance(sp_num, int) or sp_num < 0:
-                raise ValueError(f"Invalid sp_num: {sp_num} must be a non-negative integer")
-            if sp_num not in self.devices:
-                raise ValueError(f"Device {sp_num} not found in loaded configurations")
-            if self.devices[sp_num]["driver"] is None:
-                raise ValueError(f"InitSmartphone must be called first for device {sp_num}")
-            self.devices[sp_num]["driver"].lock()
+            dev = self.devices[sp_num]
+            driver = dev["driver"]
+            driver.lock()
+            self._invalidate_dom(sp_num)
             return True
         except WebDriverException as wde:
             raise WebDriverException(f"Failed to lock device for Smartphone_{sp_num}: {wde}")
         except ValueError as ve:
             raise ValueError(f"Failed to lock device for Smartphone_{sp_num}: {ve}")
 
-    def CheckTextPresence(self, name_substring: str, sp_num: Optional[int] = None, scroll_distance: int = 50, timeout: int = 8000) -> bool:
+    @_require_device
+    def CheckTextPresence(self, name_substring: str, sp_num: Optional[int] = None, scroll_distance: int = 50, timeout: int = 8000, legacy: bool = False) -> bool:
         """
-        Checks if an element containing the specified substring is present in the XML page source of the specified smartphone.
+        Checks if an element containing the specified substring is present on the screen of the specified smartphone.
+
+        By default the driver searches for the text natively with an XPath; legacy=True instead fetches and
+        scans the XML page source in Python.
 
         Args:
             name_substring (str): The substring to search for in element text or attributes.
             sp_num (Optional[int]): Smartphone identifier.
             scroll_distance (int): Distance to scroll in pixels when adjusting view (default: 50).
             timeout (int): Maximum time to wait for the element in milliseconds (default: 8000).
+            legacy (bool): If True, matches the text against the page source in Python (default: False).
 
         Returns:
             bool: True if an element matching the substring is found within the timeout.
@@ -921,25 +1413,15 @@ class Mobile:
             TimeoutError: If the timeout expires without finding the element.
         """
         try:
-            if sp_num is None or not isinstance(sp_num, int) or sp_num < 0:
-                raise ValueError(f"Invalid sp_num: {sp_num} must be a non-negative integer")
-            if sp_num not in self.devices:
-                raise ValueError(f"Device {sp_num} not found in loaded configurations")
             if not name_substring or not isinstance(name_substring, str):
                 raise ValueError(f"Invalid name_substring: '{name_substring}' must be a non-empty string")
             if not isinstance(scroll_distance, int) or scroll_distance <= 0:
                 raise ValueError(f"Invalid scroll_distance: {scroll_distance} must be positive")
             if not isinstance(timeout, int) or timeout < 0:
                 raise ValueError(f"Invalid timeout: {timeout} must be non-negative")
-            if self.devices[sp_num]["driver"] is None:
-                raise ValueError(f"InitSmartphone must be called first for device {sp_num}")
 
             # Get screen dimensions
-            window_size = self.devices[sp_num]["driver"].get_window_size()
-            if not isinstance(window_size, dict) or 'width' not in window_size or 'height' not in window_size:
-                raise WebDriverException("Failed to retrieve valid window size from driver")
-            screen_width = window_size['width']
-            screen_height = window_size['height']
+            screen_width, screen_height = self._get_window_size(sp_num)
 
             # Define thresholds (10% of screen height)
             threshold = screen_height * 0.1
@@ -949,50 +1431,52 @@ class Mobile:
             # Timeout and polling setup
             start_time = time.time()
             timeout_seconds = timeout / 1000.0
-            poll_interval = 0.5  # seconds
+            # Poll with exponential backoff; legacy mode keeps the fixed 500ms interval
+            poll = _POLL_MAX if legacy else _POLL_START  # seconds
 
             while (time.time() - start_time) < timeout_seconds:
-                # Get page source
-                xml_source = self.devices[sp_num]["driver"].page_source
-                match = self._get_deepest_matching_element(xml=xml_source, text_to_find=name_substring, sp_num=sp_num)
-                if match:
-                    element, x, y = match["element"], match["x"], match["y"]
+                position = self._locate_text(sp_num, name_substring, legacy)
+                if position:
+                    x, y = position
 
-                    # Check if scrolling is needed
-                    scrolled = False
+                    # Check if scrolling is needed; shift is how far the content moves on screen
+                    shift = 0
                     center_x = screen_width // 2
                     if y < top_threshold or y < 0:
                         # Swipe down to bring element into view
                         start_y = int(screen_height * 0.3)
                         end_y = start_y + scroll_distance
-                        self.devices[sp_num]["driver"].swipe(center_x, start_y, center_x, end_y, 300)
-                        scrolled = True
+                        self._native_swipe(sp_num, center_x, start_y, center_x, end_y)
+                        shift = scroll_distance
                     elif y > bottom_threshold or y > screen_height:
                         # Swipe up to bring element into view
                         start_y = int(screen_height * 0.7)
                         end_y = start_y - scroll_distance
-                        self.devices[sp_num]["driver"].swipe(center_x, start_y, center_x, end_y, 300)
-                        scrolled = True
-
-                    if scrolled:
-                        # Re-fetch page source and re-find element
-                        xml_source = self.devices[sp_num]["driver"].page_source
-                        match = self._get_deepest_matching_element(xml=xml_source, text_to_find=name_substring, sp_num=sp_num)
-                        if not match:
-                            continue  # Element not found after scrolling, try again
-                        element, x, y = match["element"], match["x"], match["y"]
+                        self._native_swipe(sp_num, center_x, start_y, center_x, end_y)
+                        shift = -scroll_distance
+
+                    if shift:
+                        poll = _POLL_MAX if legacy else _POLL_START  # Fast polling again after the scroll
+                        # A short scroll just moves the element; only look it up again if the estimate is off screen
+                        if abs(shift) <= screen_height * _SMALL_SCROLL_RATIO and top_threshold <= y + shift <= bottom_threshold:
+                            y += shift
+                        else:
+                            # Re-find element after scrolling
+                            position = self._locate_text(sp_num, name_substring, legacy)
+                            if not position:
+                                continue  # Element not found after scrolling, try again
+                            x, y = position
 
                     # Verify final coordinates
-                    if x < 0 or x > screen_width or y < 0 or y > screen_height:
+                    if not (0 <= x <= screen_width and 0 <= y <= screen_height):
                         continue  # Skip invalid coordinates, try again
 
                     return True  # Element found
 
-                time.sleep(poll_interval)
+                time.sleep(poll)
+                poll = min(poll * _POLL_BACKOFF, _POLL_MAX)
 
-            print(
-                f"Timeout after {timeout}ms: No element found matching '{name_substring}' for Smartphone_{sp_num}"
-            )
+            logger.debug("Timeout after %sms: No element found matching '%s' for Smartphone_%s", timeout, name_substring, sp_num)
             return False
         
         except WebDriverException as wde:
@@ -1004,6 +1488,51 @@ class Mobile:
                 f"Failed to check presence of substring '{name_substring}' for Smartphone_{sp_num}: Invalid XML source. Error: {le}"
             )
 
+    def _locate_text(self, sp_num: int, text: str, legacy: bool = False) -> Optional[Tuple[float, float]]:
+        """
+        Locates the center of a visible element whose label, name or value contains the text.
+
+        Matches are ranked like _get_deepest_matching_element: an attribute equal to the text wins over one
+        containing it, then the lowest element on screen, then the smallest one (the driver reports no depth,
+        and a nested element is never larger than its container). The search XPath already leaves out hidden
+        elements, so each candidate costs one rect request.
+
+        Args:
+            sp_num (int): Smartphone identifier.
+            text (str): The text to search for, matched case-insensitively with normalized whitespace.
+            legacy (bool): If True, fetches the page source and picks the deepest match in Python instead of
+                           letting the driver evaluate the search XPath.
+
+        Returns:
+            Optional[Tuple[float, float]]: The (x, y) center of the element, or None if no displayed element matches.
+
+        Raises:
+            etree.LxmlError: If legacy is True and the XML page source is invalid.
+            WebDriverException: If the driver search fails.
+        """
+        if legacy:
+            match = self._get_deepest_matching_element(xml=self._get_dom(sp_num), text_to_find=text, sp_num=sp_num)
+            return (match["x"], match["y"]) if match else None
+
+        driver = self.devices[sp_num]["driver"]
+        # Exact matches first; the substring search only runs when none is displayed
+        for exact in (True, False):
+            best = None  # ((-y, area), rect) of the best candidate so far
+            for element in driver.find_elements(AppiumBy.XPATH, _contains_text_xpath(text, exact)):
+                try:
+                    rect = element.rect
+                except StaleElementReferenceException:
+                    continue  # The screen changed under the search; try the next candidate
+                if rect['width'] > 0 and rect['height'] > 0 and rect['x'] >= 0 and rect['y'] >= 0:
+                    key = (-rect['y'], rect['width'] * rect['height'])
+                    if best is None or key < best[0]:
+                        best = (key, rect)
+            if best is not None:
+                rect = best[1]
+                return rect['x'] + rect['width'] / 2, rect['y'] + rect['height'] / 2
+        return None
+
+    @_require_device
     def TapByScreenCoverageFromSubString(
         self,
         name_substring: str,
@@ -1012,12 +1541,17 @@ class Mobile:
         sp_num: Optional[int] = None,
         scroll_distance: int = 50,
         timeout: int = 8000,
-        scroll_if_needed: bool = False
+        scroll_if_needed: bool = False,
+        legacy: bool = False
     ) -> bool:
         """
         Taps an element identified by a substring using screen coordinates on the specified smartphone.
         Optionally scrolls the screen downward to find the element if it is not initially visible.
 
+        By default the driver searches for the text natively with an XPath; legacy=True instead fetches and
+        scans the XML page source in Python. The page source is still fetched while scrolling, to stop once
+        a scroll no longer changes the screen.
+
         Args:
             name_substring (str): The substring to search for in element text or attributes.
             tap_count (int): Number of times to tap the element.
@@ -1027,6 +1561,7 @@ class Mobile:
             timeout (int): Maximum time to wait for the element in milliseconds (default: 8000).
             scroll_if_needed (bool): If True, attempts to scroll down repeatedly until the element is found
                                     or until the end of the scrollable content is reached (default: False).
+            legacy (bool): If True, matches the text against the page source in Python (default: False).
 
         Returns:
             bool: True if the tap(s) were successful.
@@ -1038,10 +1573,6 @@ class Mobile:
             TimeoutError: If the timeout expires without finding the element.
         """
         try:
-            if sp_num is None or not isinstance(sp_num, int) or sp_num < 0:
-                raise ValueError(f"Invalid sp_num: {sp_num} must be a non-negative integer")
-            if sp_num not in self.devices:
-                raise ValueError(f"Device {sp_num} not found in loaded configurations")
             if not name_substring or not isinstance(name_substring, str):
                 raise ValueError(f"Invalid name_substring: '{name_substring}' must be a non-empty string")
             if not isinstance(tap_count, int) or tap_count < 0:
@@ -1052,19 +1583,9 @@ class Mobile:
                 raise ValueError(f"Invalid scroll_distance: {scroll_distance} must be positive")
             if not isinstance(timeout, int) or timeout < 0:
                 raise ValueError(f"Invalid timeout: {timeout} must be non-negative")
-            if self.devices[sp_num]["driver"] is None:
-                raise ValueError(f"InitSmartphone must be called first for device {sp_num}")
-
-            platform_name = self.devices[sp_num]["capabilities"].get(
-                "platformName", self.devices[sp_num]["capabilities"].get("appium:platformName", "")
-            ).lower()
 
             # Get screen dimensions
-            window_size = self.devices[sp_num]["driver"].get_window_size()
-            if not isinstance(window_size, dict) or 'width' not in window_size or 'height' not in window_size:
-                raise WebDriverException("Failed to retrieve valid window size from driver")
-            screen_width = window_size['width']
-            screen_height = window_size['height']
+            screen_width, screen_height = self._get_window_size(sp_num)
 
             # Define thresholds (10% of screen height)
             threshold = screen_height * 0.1
@@ -1074,71 +1595,72 @@ class Mobile:
             # Timeout and polling setup
             start_time = time.time()
             timeout_seconds = timeout / 1000.0
-            poll_interval = 0.5  # seconds
+            poll = _POLL_START  # seconds, grows up to _POLL_MAX
 
-            last_page_source = ""
+            last_root = None
             while (time.time() - start_time) < timeout_seconds:
-                # Get current page source
-                xml_source = self.devices[sp_num]["driver"].page_source
-
                 # Try to find the element
-                match = self._get_deepest_matching_element(xml=xml_source, text_to_find=name_substring, sp_num=sp_num)
-                if match:
-                    element, x, y = match["element"], match["x"], match["y"]
+                position = self._locate_text(sp_num, name_substring, legacy)
+                if position:
+                    x, y = position
 
-                    # Check if scrolling is needed to bring it into view
-                    scrolled = False
+                    # Check if scrolling is needed to bring it into view; shift is how far the content moves on screen
+                    shift = 0
                     center_x = screen_width // 2
                     if scroll_if_needed:
                         if y < top_threshold or y < 0:
                             start_y = int(screen_height * 0.3)
                             end_y = start_y + scroll_distance
-                            self.devices[sp_num]["driver"].swipe(center_x, start_y, center_x, end_y, 300)
-                            scrolled = True
+                            self._native_swipe(sp_num, center_x, start_y, center_x, end_y)
+                            shift = scroll_distance
                         elif y > bottom_threshold or y > screen_height:
                             start_y = int(screen_height * 0.7)
                             end_y = start_y - scroll_distance
-                            self.devices[sp_num]["driver"].swipe(center_x, start_y, center_x, end_y, 300)
-                            scrolled = True
-
-                    if scrolled:
-                        xml_source = self.devices[sp_num]["driver"].page_source
-                        match = self._get_deepest_matching_element(xml=xml_source, text_to_find=name_substring, sp_num=sp_num)
-                        if not match:
-                            continue  # Still not found, keep looping
-                        element, x, y = match["element"], match["x"], match["y"]
+                            self._native_swipe(sp_num, center_x, start_y, center_x, end_y)
+                            shift = -scroll_distance
+
+                    if shift:
+                        poll = _POLL_START  # Fast polling again after the scroll
+                        # A short scroll just moves the element; only look it up again if the estimate is off screen
+                        if abs(shift) <= screen_height * _SMALL_SCROLL_RATIO and top_threshold <= y + shift <= bottom_threshold:
+                            y += shift
+                        else:
+                            position = self._locate_text(sp_num, name_substring, legacy)
+                            if not position:
+                                continue  # Still not found, keep looping
+                            x, y = position
 
                     # Ensure the coordinates are valid
-                    if x < 0 or x > screen_width or y < 0 or y > screen_height:
+                    if not (0 <= x <= screen_width and 0 <= y <= screen_height):
                         raise ValueError(
                             f"Failed to tap '{name_substring}' for Smartphone_{sp_num}: Coordinates (x={x}, y={y}) "
                             f"are outside screen range (width={screen_width}, height={screen_height})"
                         )
 
                     # Perform tap(s)
-                    for _ in range(tap_count):
-                        if platform_name.lower() == "iOS".lower():
-                            self._tap_gesture_iOS(x, y, duration=100, sp_num=sp_num)
-                        elif platform_name.lower() == "android".lower():
-                            self._tap_gesture_android(x, y, duration=100, sp_num=sp_num)
+                    self._tap_repeated(sp_num, x, y, tap_count, 0)
                     return True
 
                 if scroll_if_needed:
-                    # Stop if page content doesn’t change — reached bottom
-                    if xml_source == last_page_source:
+                    # Stop if page content doesn’t change — reached bottom (_get_dom returns the same tree).
+                    # The legacy search has just fetched the tree, and nothing scrolled since
+                    root = self.devices[sp_num]["dom_cache"]["tree"] if legacy else self._get_dom(sp_num)
+                    if root is last_root:
                         break
-                    last_page_source = xml_source
+                    last_root = root
 
                     # Try scrolling down
                     center_x = screen_width // 2
                     start_y = int(screen_height * 0.7)
                     end_y = start_y - scroll_distance
-                    self.devices[sp_num]["driver"].swipe(center_x, start_y, center_x, end_y, 300)
+                    self._native_swipe(sp_num, center_x, start_y, center_x, end_y)
+                    poll = _POLL_START  # Fast polling again after the scroll
 
-                time.sleep(poll_interval)
+                time.sleep(poll)
+                poll = min(poll * _POLL_BACKOFF, _POLL_MAX)
 
-            print(
-                f"Timeout after {timeout}ms: No element found matching element '{name_substring}' for Smartphone_{sp_num}"
+            logger.debug(
+                "Timeout after %sms: No element found matching element '%s' for Smartphone_%s", timeout, name_substring, sp_num
             )
             return False
 
@@ -1152,6 +1674,7 @@ class Mobile:
                 f"Failed to tap '{name_substring}' by screen coverage for Smartphone_{sp_num}: Invalid XML source. Error: {le}"
             )
 
+    @_require_device
     def TapElement(self, name: str, sp_num: Optional[int] = None) -> bool:
         """
         Taps an element on the specified smartphone using XPath, text-based fallback, or screen coverage tap.
@@ -1170,143 +1693,76 @@ class Mobile:
             TimeoutError: If the element is not found after attempting all fallbacks.
         """
         try:
-            if sp_num is None or not isinstance(sp_num, int) or sp_num < 0:
-                raise ValueError(f"Invalid sp_num: {sp_num} must be a non-negative integer")
-            if sp_num not in self.devices:
-                raise ValueError(f"Device {sp_num} not found in loaded configurations")
+            dev = self.devices[sp_num]
+            driver = dev["driver"]
             if not name or not isinstance(name, str):
                 raise ValueError(f"Invalid name: '{name}' must be a non-empty string")
-            if self.devices[sp_num]["driver"] is None:
-                raise ValueError(f"InitSmartphone must be called first for device {sp_num}")
             
-            platform_name = self.devices[sp_num]["capabilities"].get(
-                "platformName", self.devices[sp_num]["capabilities"].get("appium:platformName", "")
-            ).lower()
-
             xpath = None
-            xml_source = self.devices[sp_num]["driver"].page_source
-            self.mapping_path = self.devices[sp_num]["mapping_path"]
-            elem = None
             text_to_find = name
-            fallback_coordinates = None
 
             # Check if the name is an XPath (starts with /)
             if name.startswith("/"):
                 xpath = name
                 # Extract name value for fallback
-                match = re.search(r"@(name|label|value)=['\"]([^'\"]*?)['\"]", name)
+                match = _LABEL_ATTR_RE.search(name)
                 if match:
                     text_to_find = match.group(2).strip()
             else:
                 # Try resolving the element as a logical name
-                xpath = self._resolve_xpath(name)
+                xpath = self._resolve_xpath(name, dev["mapping_path"])
 
             if xpath is not None:
-                # Normalize XPath quotes and try variations
-                normalized_xpath = re.sub(r"@(\w+)=[']([^']*?)[']", r'@\1="\2"', xpath)
-                xpath_variations = [
-                    xpath,
-                    normalized_xpath,
-                    re.sub(r"@(\w+)=['\"]([^'\"]*?)['\"]", r'@\1[normalize-space(.)="\2"]', normalized_xpath),
-                    re.sub(r"@(\w+)=['\"]([^'\"]*?)['\"]", r'@\1[contains(., "\2")]', normalized_xpath)
-                ]
-                for alt_xpath in xpath_variations:
-                    try:
-                        # Use _get_element_from_xpath for state validation
-                        elem = self._get_element_from_xpath(xml=xml_source, xpath=alt_xpath)
-                        if elem is not None:
-                            # Check if the element is visible and enabled
-                            is_visible = self._is_element_visible(elem, sp_num=sp_num)
-                            is_enabled = elem.attrib.get("enabled", "false").lower() == "true"
-                            if not (is_visible and is_enabled):
-                                raise AssertionError(f"Element '{name}' is not tappable (visible={is_visible}, enabled={is_enabled})")
-                            # Store initial coordinates as fallback
-                            try:
-                                # Parse width and height, default to 0 if missing or invalid
-                                try:
-                                    if platform_name.lower() == "iOS".lower():
-                                        width, height = self._parse_size_iOS(elem)
-                                    elif platform_name.lower() == "android".lower():
-                                        width, height = self._parse_size_android(elem)
-                                except (TypeError, ValueError):
-                                    width = 0
-                                    height = 0
-
-                                # Parse x and y coordinates, default to -1 if missing or invalid
-                                try:
-                                    if platform_name.lower() == "iOS".lower():
-                                        x, y = self._parse_position_iOS(elem)
-                                    elif platform_name.lower() == "android".lower():
-                                        x, y = self._parse_size_android(elem)
-                                except (TypeError, ValueError):
-                                    x = -1
-                                    y = -1
-                                
-                                # x = int(elem.attrib.get("x", "-1"))
-                                # y = int(elem.attrib.get("y", "-1"))
-                                # width = int(elem.attrib.get("width", "0"))
-                                # height = int(elem.attrib.get("height", "0"))
-                                center_x = x + width / 2
-                                center_y = y + height / 2
-                                size = self.devices[sp_num]["driver"].get_window_size()
-                                if not isinstance(size, dict) or 'width' not in size or 'height' not in size:
-                                    raise ValueError("Invalid screen dimensions returned by driver")
-                                if center_x >= 0 and center_x <= size['width'] and center_y >= 0 and center_y <= size['height']:
-                                    fallback_coordinates = (center_x, center_y)
-                            except ValueError:
-                                pass  # Continue without fallback coordinates if invalid
-                            # Fetch WebDriver element and tap
-                            try:
-                                webdriver_elem = self.devices[sp_num]["driver"].find_element(AppiumBy.XPATH, alt_xpath)
-                                self._tap_element_center(webdriver_elem, sp_num=sp_num)
-                            except (NoSuchElementException, StaleElementReferenceException, ValueError):
-                                # Try fallback coordinates if available
-                                if fallback_coordinates:
-                                    center_x, center_y = fallback_coordinates
-                                    if platform_name.lower() == "iOS".lower():
-                                        self._tap_gesture_iOS(center_x, center_y, duration=100, sp_num=sp_num)
-                                    elif platform_name.lower() == "android".lower():
-                                        self._tap_gesture_android(center_x, center_y, duration=100, sp_num=sp_num)
-                                else:
-                                    continue  # Try next XPath variation
-                            return True
-                    except (NoSuchElementException, StaleElementReferenceException, ValueError):
+                # Look the XPath as written up on the device first, which needs no page source
+                try:
+                    # find_elements returns an empty list on no match instead of building an exception
+                    found = driver.find_elements(AppiumBy.XPATH, xpath)
+                    if found:
+                        webdriver_elem = found[0]
+                        # Check if the element is visible and enabled; a match that is not tappable ends the
+                        # lookup, since the fallbacks would only find the same element again
+                        is_visible = webdriver_elem.is_displayed()
+                        is_enabled = webdriver_elem.is_enabled()
+                        if not (is_visible and is_enabled):
+                            raise AssertionError(f"Element '{name}' is not tappable (visible={is_visible}, enabled={is_enabled})")
+                        self._tap_element_center(webdriver_elem, sp_num=sp_num)
+                        return True
+                except (StaleElementReferenceException, InvalidSelectorException, ValueError):
+                    pass  # Fall back to the page source
+
+            root = self._get_dom(sp_num, ttl_ms=self.page_source_ttl_ms)
+
+            if xpath is not None:
+                # The page source tries the normalized and substring variations, and the element type fallback
+                # (an element of another type with the same name, label or value), and gives the coordinates to tap
+                is_ios = self._platform_name(sp_num) == "ios"
+                strategies, bindings = _xpath_templates(xpath)
+                variables = dict(bindings)
+                for template, _ in strategies:
+                    elem = self._get_element_from_xpath(xml=root, xpath=self._compile_xpath(template), variables=variables)
+                    if elem is None:
                         continue  # Try next XPath variation
+                    x, y, width, height, is_enabled, is_visible = self._extract_tap_props(elem, is_ios)
+                    if not (is_visible and is_enabled):
+                        raise AssertionError(f"Element '{name}' is not tappable (visible={is_visible}, enabled={is_enabled})")
+                    center_x = x + width / 2
+                    center_y = y + height / 2
+                    screen_width, screen_height = self._get_window_size(sp_num)
+                    if 0 <= center_x <= screen_width and 0 <= center_y <= screen_height \
+                            and self._tap(sp_num, center_x, center_y, duration=100):
+                        return True
 
             # Fallback to finding the deepest matching element by text
-            match = self._get_deepest_matching_element(xml=xml_source, text_to_find=text_to_find, sp_num=sp_num)
+            match = self._get_deepest_matching_element(xml=root, text_to_find=text_to_find, sp_num=sp_num)
             if match is not None:
-                elem = match["element"]
-                # Check if the element is visible and enabled
-                is_visible = self._is_element_visible(elem, sp_num=sp_num)
-                is_enabled = elem.attrib.get("enabled", "false").lower() == "true"
-                if not (is_visible and is_enabled):
-                    raise AssertionError(f"Element '{name}' is not tappable (visible={is_visible}, enabled={is_enabled})")
-                # Construct XPath from the found element
-                xpath = self._element_to_xpath(elem)
-                if xpath is None:
-                    raise ValueError(f"Could not construct XPath for element '{name}'")
-                # Use coordinates for tapping
-                x, y = match["x"], match["y"]
-                size = self.devices[sp_num]["driver"].get_window_size()
-                if not isinstance(size, dict) or 'width' not in size or 'height' not in size:
-                    raise ValueError("Invalid screen dimensions returned by driver")
-                if x < 0 or x > size['width'] or y < 0 or y > size['height']:
-                    raise ValueError(
-                        f"Failed to tap '{name}' for Smartphone_{sp_num}: Coordinates (x={x}, y={y}) are outside "
-                        f"screen range (width={size['width']}, height={size['height']})"
-                    )
-                if platform_name.lower() == "iOS".lower():
-                    self._tap_gesture_iOS(x, y, duration=100, sp_num=sp_num)
-                elif platform_name.lower() == "android".lower():
-                    self._tap_gesture_android(x, y, duration=100, sp_num=sp_num)
+                self._tap_text_match(match, name, 1, 0, sp_num)
                 return True
 
             # Fallback to TapByScreenCoverageFromSubString
             if not self.TapByScreenCoverageFromSubString(name, tap_count=1, tap_duration_ms=100, sp_num=sp_num):
-                print(
-                    f"Failed to tap element '{name}' for Smartphone_{sp_num}: XPath not found, text-based search failed, "
-                    "and tap by screen coverage failed"
+                logger.debug(
+                    "Failed to tap element '%s' for Smartphone_%s: XPath not found, text-based search failed, "
+                    "and tap by screen coverage failed", name, sp_num
                 )
                 return False
             return True
@@ -1349,13 +1805,12 @@ class Mobile:
             if self.devices[sp_num]["driver"] is None:
                 raise ValueError(f"InitSmartphone must be called first for device {sp_num}")
 
-            platform_name = self.devices[sp_num]["capabilities"].get(
-                "platformName", self.devices[sp_num]["capabilities"].get("appium:platformName", "")
-            ).lower()
+            # Resolved once; the retry loop below only uses it
+            is_ios = self._platform_name(sp_num) == "ios"
 
             xpath = None
-            xml_source = self.devices[sp_num]["driver"].page_source
-            self.mapping_path = self.devices[sp_num]["mapping_path"]
+            # Parsed once and shared by every lookup below; a source fetched just before (and not followed by a tap) is reused
+            root = self._get_dom(sp_num, ttl_ms=self.page_source_ttl_ms)
             elem = None
             text_to_find = element_name
             fallback_coordinates = None
@@ -1364,122 +1819,74 @@ class Mobile:
             if element_name.startswith("/"):
                 xpath = element_name
                 # Extract name value for fallback
-                match = re.search(r"@(name|label|value)=['\"]([^'\"]*?)['\"]", element_name)
+                match = _LABEL_ATTR_RE.search(element_name)
                 if match:
                     text_to_find = match.group(2).strip()
             else:
                 # Try resolving the element as a logical name
-                xpath = self._resolve_xpath(element_name)
+                xpath = self._resolve_xpath(element_name, self.devices[sp_num]["mapping_path"])
 
             if xpath is not None:
-                # Normalize XPath quotes and try variations
-                normalized_xpath = re.sub(r"@(\w+)=[']([^']*?)[']", r'@\1="\2"', xpath)
-                xpath_variations = [
-                    xpath,
-                    normalized_xpath,
-                    re.sub(r"@(\w+)=['\"]([^'\"]*?)['\"]", r'@\1[normalize-space(.)="\2"]', normalized_xpath),
-                    re.sub(r"@(\w+)=['\"]([^'\"]*?)['\"]", r'@\1[contains(., "\2")]', normalized_xpath)
-                ]
-                for alt_xpath in xpath_variations:
+                # Try each matching strategy; lxml evaluates the template with the values bound as variables,
+                # the driver gets the canonical string
+                strategies, bindings = _xpath_templates(xpath)
+                variables = dict(bindings)
+                target = None  # Center to tap; the retries only cover the lookup, never the taps
+                for template, alt_xpath in strategies:
+                    compiled_xpath = self._compile_xpath(template)
                     for _ in range(2):  # Retry twice
                         try:
                             # Use _get_element_from_xpath for state validation
-                            elem = self._get_element_from_xpath(xml=xml_source, xpath=alt_xpath)
+                            elem = self._get_element_from_xpath(xml=root, xpath=compiled_xpath, variables=variables)
                             if elem is not None:
-                                # Check if the element is visible and enabled
-                                is_visible = self._is_element_visible(elem, sp_num=sp_num)
-                                is_enabled = elem.attrib.get("enabled", "false").lower() == "true"
-                                if not (is_visible and is_enabled):
-                                    raise AssertionError(f"Element '{element_name}' is not tappable (visible={is_visible}, enabled={is_enabled})")
+                                # Read position, size and state in one pass, then check it is visible and enabled;
+                                # a match that is not tappable ends the lookup without a text search
+                                x, y, width, height, is_enabled, is_visible = self._extract_tap_props(elem, is_ios)
+                                if not is_enabled:
+                                    raise AssertionError(f"Element '{element_name}' is not tappable (enabled=False)")
+                                if not is_visible:
+                                    raise AssertionError(f"Element '{element_name}' is not tappable (visible=False, enabled=True)")
                                 # Store initial coordinates as fallback
                                 try:
-                                    # Parse width and height, default to 0 if missing or invalid
-                                    try:
-                                        if platform_name.lower() == "iOS".lower():
-                                            width, height = self._parse_size_iOS(elem)
-                                        elif platform_name.lower() == "android".lower():
-                                            width, height = self._parse_size_android(elem)
-                                    except (TypeError, ValueError):
-                                        width = 0
-                                        height = 0
-
-                                    # Parse x and y coordinates, default to -1 if missing or invalid
-                                    try:
-                                        if platform_name.lower() == "iOS".lower():
-                                            x, y = self._parse_position_iOS(elem)
-                                        elif platform_name.lower() == "android".lower():
-                                            x, y = self._parse_size_android(elem)
-                                    except (TypeError, ValueError):
-                                        x = -1
-                                        y = -1
-                                    # x = int(elem.attrib.get("x", "-1"))
-                                    # y = int(elem.attrib.get("y", "-1"))
-                                    # width = int(elem.attrib.get("width", "0"))
-                                    # height = int(elem.attrib.get("height", "0"))
                                     center_x = x + width / 2
                                     center_y = y + height / 2
-                                    size = self.devices[sp_num]["driver"].get_window_size()
-                                    if not isinstance(size, dict) or 'width' not in size or 'height' not in size:
-                                        raise ValueError("Invalid screen dimensions returned by driver")
-                                    if center_x >= 0 and center_x <= size['width'] and center_y >= 0 and center_y <= size['height']:
+                                    screen_width, screen_height = self._get_window_size(sp_num)
+                                    if 0 <= center_x <= screen_width and 0 <= center_y <= screen_height:
                                         fallback_coordinates = (center_x, center_y)
                                 except ValueError:
                                     pass  # Continue without fallback coordinates if invalid
-                                # Tap the element multiple times, re-fetching each time
-                                for i in range(tap_count):
-                                    try:
-                                        webdriver_elem = self.devices[sp_num]["driver"].find_element(AppiumBy.XPATH, alt_xpath)
-                                        self._tap_element_center(webdriver_elem, sp_num=sp_num)
-                                    except (NoSuchElementException, StaleElementReferenceException, ValueError):
-                                        # Try fallback coordinates if available
-                                        if fallback_coordinates:
-                                            center_x, center_y = fallback_coordinates
-                                            if platform_name.lower() == "iOS".lower():
-                                                self._tap_gesture_iOS(center_x, center_y, duration=100, sp_num=sp_num)
-                                            elif platform_name.lower() == "android".lower():
-                                                self._tap_gesture_android(center_x, center_y, duration=100, sp_num=sp_num)
-                                        else:
-                                            raise ValueError(f"Failed to tap '{element_name}' after retrying with XPath '{alt_xpath}'")
-                                    if i < tap_count - 1:
-                                        time.sleep(delay_between_tap_ms / 1000.0)
-                                        xml_source = self.devices[sp_num]["driver"].page_source  # Refresh XML source for next tap
-                                return True
+                                # Look the element up once on the device, by its attributes through the platform's
+                                # native query (XPath evaluation on the device is slow, especially on iOS), and send
+                                # every tap to its center in one action sequence
+                                locator = self._native_locator(elem, is_ios) or (AppiumBy.XPATH, alt_xpath)
+                                try:
+                                    found = self.devices[sp_num]["driver"].find_elements(*locator)
+                                    if not found:
+                                        raise ValueError(f"No element matches {locator[0]} '{locator[1]}'")
+                                    center_x, center_y = self._element_center(found[0], sp_num)
+                                except (StaleElementReferenceException, ValueError):
+                                    # Try fallback coordinates if available
+                                    if not fallback_coordinates:
+                                        raise ValueError(f"Failed to tap '{element_name}' after retrying with XPath '{alt_xpath}'")
+                                    center_x, center_y = fallback_coordinates
+                                target = (center_x, center_y)
                         except (NoSuchElementException, WebDriverException, StaleElementReferenceException):
                             # Refresh XML source and retry
-                            xml_source = self.devices[sp_num]["driver"].page_source
+                            root = self._get_dom(sp_num)
                             continue
                         break  # Exit retry loop if successful
+                    if target is not None:
+                        break
+                if target is not None:
+                    # Outside the retries: a sequence that failed partway must not be sent again.
+                    # The delay runs from tap to tap, so the 100 ms each tap is held is part of it
+                    self._tap_repeated(sp_num, target[0], target[1], tap_count, max(0, delay_between_tap_ms - 100))
+                    return True
 
             # Fallback to finding the deepest matching element by text
-            match = self._get_deepest_matching_element(xml=xml_source, text_to_find=text_to_find, sp_num=sp_num)
+            match = self._get_deepest_matching_element(xml=root, text_to_find=text_to_find, sp_num=sp_num)
             if match is not None:
-                elem = match["element"]
-                # Check if the element is visible and enabled
-                is_visible = self._is_element_visible(elem, sp_num=sp_num)
-                is_enabled = elem.attrib.get("enabled", "false").lower() == "true"
-                if not (is_visible and is_enabled):
-                    raise AssertionError(f"Element '{element_name}' is not tappable (visible={is_visible}, enabled={is_enabled})")
-                # Construct XPath from the found element
-                xpath = self._element_to_xpath(elem)
-                if xpath is None:
-                    raise ValueError(f"Could not construct XPath for element '{element_name}'")
-                # Use coordinates for tapping
-                x, y = match["x"], match["y"]
-                size = self.devices[sp_num]["driver"].get_window_size()
-                if not isinstance(size, dict) or 'width' not in size or 'height' not in size:
-                    raise ValueError("Invalid screen dimensions returned by driver")
-                if x < 0 or x > size['width'] or y < 0 or y > size['height']:
-                    raise ValueError(
-                        f"Failed to tap '{element_name}' for Smartphone_{sp_num}: Coordinates (x={x}, y={y}) are outside "
-                        f"screen range (width={size['width']}, height={size['height']})"
-                    )
-                for i in range(tap_count):
-                    if platform_name.lower() == "iOS".lower():
-                        self._tap_gesture_iOS(x, y, duration=100, sp_num=sp_num)
-                    elif platform_name.lower() == "android".lower():
-                        self._tap_gesture_android(x, y, duration=100, sp_num=sp_num)
-                    if i < tap_count - 1:
-                        time.sleep(delay_between_tap_ms / 1000.0)
+                self._tap_text_match(match, element_name, tap_count, delay_between_tap_ms, sp_num)
                 return True
 
             # Final fallback to TapByScreenCoverageFromSubString
@@ -1489,9 +1896,9 @@ class Mobile:
                 tap_duration_ms=100,
                 sp_num=sp_num
             ):
-                print(
-                    f"Failed to tap element '{element_name}' for Smartphone_{sp_num}: XPath not found, text-based search failed, "
-                    "and tap by screen coverage failed"
+                logger.debug(
+                    "Failed to tap element '%s' for Smartphone_%s: XPath not found, text-based search failed, "
+                    "and tap by screen coverage failed", element_name, sp_num
                 )
                 return False
             return True
@@ -1501,50 +1908,222 @@ class Mobile:
         except WebDriverException as wde:
             raise WebDriverException(f"Failed to tap element '{element_name}' for Smartphone_{sp_num} with text search: {wde}")
 
-    def _tap_gesture_iOS(self, x, y, duration, sp_num):
-        """Tap at (x, y) on iOS using 'mobile: tap'."""
-        self.devices[sp_num]["driver"].execute_script("mobile: tap", {"x": x, "y": y, "duration": duration})
+    def _tap_text_match(self, match: Dict[str, any], name: str, tap_count: int, delay_between_tap_ms: int, sp_num: int) -> None:
+        """
+        Taps the center of a text match found by _get_deepest_matching_element, shared by TapElement and TapElementExt.
 
-    def _tap_gesture_android(self, x, y, duration, sp_num):
-        """Tap at (x, y) on Android using 'mobile: clickGesture'."""
-        self.devices[sp_num]["driver"].execute_script(
-            "mobile: clickGesture",
-            {"x": x, "y": y, "tapCount": 1, "duration": duration}
-        )
+        Args:
+            match (Dict[str, any]): The match, with its 'element' and center 'x'/'y'.
+            name (str): The name the caller was asked to tap, used in error messages.
+            tap_count (int): Number of times to tap.
+            delay_between_tap_ms (int): Delay between taps in milliseconds.
+            sp_num (int): Smartphone identifier.
 
-    def _tap_element_center(self, element, sp_num: int):
+        Raises:
+            ValueError: If the coordinates are outside the screen.
+            AssertionError: If the element is not enabled.
         """
-        Private method to tap the center of a given element using Appium's mobile: tap command.
+        # Text matches are already visible with a positive size; only the enabled state is left to check
+        self._assert_interactable(match["element"], name, "tappable", sp_num=sp_num, check_visibility=False)
+        x, y = match["x"], match["y"]
+        screen_width, screen_height = self._get_window_size(sp_num)
+        if not (0 <= x <= screen_width and 0 <= y <= screen_height):
+            raise ValueError(
+                f"Failed to tap '{name}' for Smartphone_{sp_num}: Coordinates (x={x}, y={y}) are outside "
+                f"screen range (width={screen_width}, height={screen_height})"
+            )
+        # The delay runs from tap to tap, so the 100 ms each tap is held is part of it
+        self._tap_repeated(sp_num, x, y, tap_count, max(0, delay_between_tap_ms - 100))
+
+    def _tap(self, sp_num: int, x: float, y: float, duration: int = 100) -> bool:
+        """
+        Taps at (x, y) with the platform's tap script, resolved once per session and kept on the device entry.
 
         Args:
-            element: The WebElement to tap.
+            sp_num (int): Smartphone identifier.
+            x (float): X coordinate of the tap.
+            y (float): Y coordinate of the tap.
+            duration (int): Tap duration in milliseconds.
+
+        Returns:
+            bool: True if a tap was sent, False if the platform is not supported.
+        """
+        dev = self.devices[sp_num]
+        tap_script = dev.get("tap_script")
+        if tap_script is None:
+            tap_script = _TAP_SCRIPTS.get(self._platform_name(sp_num))
+            if tap_script is None:
+                return False
+            dev["tap_script"] = tap_script
+        script, payload = tap_script
+        dev["driver"].execute_script(script, {**payload, "x": x, "y": y, "duration": duration})
+        self._invalidate_dom(sp_num)
+        return True
+
+    def _tap_repeated(self, sp_num: int, x: float, y: float, count: int, interval_ms: float, duration_ms: int = 100) -> None:
+        """
+        Taps the same point several times as a single W3C touch action sequence, dispatched in one request.
+
+        A single tap goes through _tap. If the driver does not implement W3C actions, the taps are sent one by one;
+        any other failure is raised, since part of the sequence may already have been performed.
+
+        Args:
+            sp_num (int): Smartphone identifier.
+            x (float): X coordinate of the taps.
+            y (float): Y coordinate of the taps.
+            count (int): Number of taps to perform.
+            interval_ms (float): Pause between the end of a tap and the start of the next one in milliseconds.
+            duration_ms (int): How long each tap is held in milliseconds.
 
         Raises:
-            ValueError: If the element's coordinates or dimensions are invalid.
+            WebDriverException: If a tap fails.
+        """
+        if count <= 1:
+            if count == 1:
+                self._tap(sp_num, x, y, duration_ms)
+            return
+        finger = PointerInput(interaction.POINTER_TOUCH, "finger")
+        actions = ActionBuilder(self.devices[sp_num]["driver"], mouse=finger)
+        finger.create_pointer_move(duration=0, x=round(x), y=round(y))
+        for i in range(count):
+            if i and interval_ms:
+                finger.create_pause(interval_ms / 1000.0)
+            finger.create_pointer_down(button=MouseButton.LEFT)
+            finger.create_pause(duration_ms / 1000.0)
+            finger.create_pointer_up(button=MouseButton.LEFT)
+        try:
+            actions.perform()
+        except WebDriverException as wde:
+            if not isinstance(wde, UnknownMethodException) \
+                    and not any(text in str(wde).lower() for text in _UNSUPPORTED_COMMAND_MESSAGES):
+                raise  # Replaying the taps could tap more than count times
+            for i in range(count):
+                if i and interval_ms:
+                    time.sleep(interval_ms / 1000.0)
+                self._tap(sp_num, x, y, duration_ms)
+            return
+        self._invalidate_dom(sp_num)
+
+    def _native_locator(self, elem: etree._Element, is_ios: bool) -> Optional[Tuple[str, str]]:
+        """
+        Builds an iOS predicate or Android UiSelector locator from a page source element's attributes.
+
+        Args:
+            elem (etree._Element): The element matched in the page source.
+            is_ios (bool): True for an iOS page source, False for Android.
+
+        Returns:
+            Optional[Tuple[str, str]]: The (strategy, selector) pair to pass to find_elements, or None if the
+            element has no identifying attribute besides its type, or if other elements of the page source
+            carry the same attributes.
+        """
+        attrib = elem.attrib
+        attrs = _IOS_PREDICATE_ATTRS if is_ios else _UI_SELECTOR_ATTRS
+        parts = []
+        present = []
+        for attr, prop in attrs:
+            value = attrib.get(attr)
+            if not value:
+                continue
+            present.append((attr, value))
+            if is_ios:
+                value = value.replace("\\", "\\\\").replace("'", "\\'")
+                parts.append(f"{prop} == '{value}'")
+            else:
+                value = value.replace("\\", "\\\\").replace('"', '\\"')
+                parts.append(f'.{prop}("{value}")')
+        # The type alone would match any element of that type
+        if not parts or (attrib.get(attrs[0][0]) and len(parts) == 1):
+            return None
+        # The native query keeps none of the positional or ancestor steps of an XPath, so it is only used when
+        # no other element (e.g. the same button in another list row) has the same attributes
+        unique = self._compile_xpath("//*[" + " and ".join(f"@{attr}=$v{i}" for i, (attr, _) in enumerate(present)) + "]")
+        if unique(elem, **{f"v{i}": value for i, (_, value) in enumerate(present)}) != [elem]:
+            return None
+        if is_ios:
+            return AppiumBy.IOS_PREDICATE, " AND ".join(parts)
+        return AppiumBy.ANDROID_UIAUTOMATOR, "new UiSelector()" + "".join(parts)
+
+    def _find_on_device(self, sp_num: int, xpath: str):
+        """
+        Private method to look an element up on the device by XPath, without fetching the page source.
+
+        Args:
+            sp_num (int): Smartphone identifier.
+            xpath (str): The XPath expression.
+
+        Returns:
+            The first matching WebElement, or None if nothing matches or the driver rejects the XPath.
+
+        Raises:
+            WebDriverException: If the lookup fails for another reason.
+        """
+        try:
+            found = self.devices[sp_num]["driver"].find_elements(AppiumBy.XPATH, xpath)
+        except InvalidSelectorException:
+            return None
+        return found[0] if found else None
+
+    def _device_attribute(self, sp_num: int, xpath: str, attribute: str) -> Optional[str]:
+        """
+        Private method to read an attribute of an element looked up on the device by XPath.
+
+        Args:
+            sp_num (int): Smartphone identifier.
+            xpath (str): The XPath expression.
+            attribute (str): The attribute to read.
+
+        Returns:
+            Optional[str]: The attribute value, or None if nothing matches or the driver cannot serve the attribute.
+        """
+        try:
+            webdriver_elem = self._find_on_device(sp_num, xpath)
+            return webdriver_elem.get_attribute(attribute) if webdriver_elem is not None else None
+        except WebDriverException:
+            # The drivers only serve a fixed set of attributes; the page source carries all of them
+            return None
+
+    def _element_center(self, element, sp_num: int) -> Tuple[float, float]:
         """
-        platform_name = self.devices[sp_num]["capabilities"].get(
-            "platformName", self.devices[sp_num]["capabilities"].get("appium:platformName", "")
-        ).lower()
+        Private method to get the on-screen center of a given element.
+
+        Args:
+            element: The WebElement to locate.
+            sp_num (int): Smartphone identifier.
 
+        Returns:
+            Tuple[float, float]: The x and y coordinates of the element's center.
+
+        Raises:
+            ValueError: If the element's coordinates or dimensions are invalid.
+        """
         try:
             rect = element.rect
             x = rect['x'] + rect['width'] / 2
             y = rect['y'] + rect['height'] / 2
-            size = element._parent.get_window_size()
-            if not isinstance(size, dict) or 'width' not in size or 'height' not in size:
-                raise ValueError("Invalid screen dimensions returned by driver")
-            if x < 0 or x > size['width'] or y < 0 or y > size['height']:
+            screen_width, screen_height = self._get_window_size(sp_num)
+            if not (0 <= x <= screen_width and 0 <= y <= screen_height):
                 raise ValueError(
                     f"Failed to tap element: Coordinates (x={x}, y={y}) are outside "
-                    f"screen range (width={size['width']}, height={size['height']})"
+                    f"screen range (width={screen_width}, height={screen_height})"
                 )
-            if platform_name.lower() == "iOS".lower():
-                self._tap_gesture_iOS(x, y, duration=100, sp_num=sp_num)
-            elif platform_name.lower() == "android".lower():
-                self._tap_gesture_android(x, y, duration=100, sp_num=sp_num)
+            return x, y
         except (ValueError, KeyError) as ve:
             raise ValueError(f"Invalid element coordinates or dimensions: {ve}")
 
+    def _tap_element_center(self, element, sp_num: int):
+        """
+        Private method to tap the center of a given element using Appium's mobile: tap command.
+
+        Args:
+            element: The WebElement to tap.
+
+        Raises:
+            ValueError: If the element's coordinates or dimensions are invalid.
+        """
+        x, y = self._element_center(element, sp_num)
+        self._tap(sp_num, x, y)
+
     def TapElementById(self, element_name: str, sp_num: Optional[int] = None) -> bool:
         """
         Taps an element using its ID on the specified smartphone.
@@ -1571,6 +2150,7 @@ class Mobile:
             if self.devices[sp_num]["driver"] is None:
                 raise ValueError(f"InitSmartphone must be called first for device {sp_num}")
             self.devices[sp_num]["driver"].find_element(AppiumBy.ACCESSIBILITY_ID, element_name).click()
+            self._invalidate_dom(sp_num)
             return True
         except ValueError as ve:
             raise ValueError(f"Failed to tap element by ID '{element_name}' for Smartphone_{sp_num}: {ve}")
@@ -1638,7 +2218,6 @@ class Mobile:
         try:
             if sp_num is None or sp_num not in self.devices:
                 raise ValueError(f"Invalid sp_num: '{sp_num}' must be a valid device identifier")
-            driver = self.devices[sp_num]["driver"]
 
             # Validate inputs
             if not isinstance(x_percentage, (int, float)) or x_percentage < 0.0 or x_percentage > 1.0:
@@ -1650,36 +2229,22 @@ class Mobile:
             if not isinstance(tap_duration_ms, int) or tap_duration_ms < 0:
                 raise ValueError(f"Invalid tap_duration_ms: {tap_duration_ms} must be a non-negative integer")
 
-            platform_name = self.devices[sp_num]["capabilities"].get(
-                "platformName", self.devices[sp_num]["capabilities"].get("appium:platformName", "")
-            ).lower()
-
             # Get screen dimensions
-            window_size = driver.get_window_size()
-            if not isinstance(window_size, dict) or 'width' not in window_size or 'height' not in window_size:
-                raise ValueError("Invalid screen dimensions returned by driver")
-            screen_width = window_size['width']
-            screen_height = window_size['height']
+            screen_width, screen_height = self._get_window_size(sp_num)
 
             # Calculate absolute coordinates
             x = x_percentage * screen_width
             y = y_percentage * screen_height
 
             # Validate coordinates
-            if x < 0 or x > screen_width or y < 0 or y > screen_height:
+            if not (0 <= x <= screen_width and 0 <= y <= screen_height):
                 raise ValueError(
                     f"Calculated coordinates (x={x}, y={y}) are outside "
                     f"screen range (width={screen_width}, height={screen_height})"
                 )
 
-            # Perform taps
-            for i in range(tap_count):
-                if platform_name.lower() == "iOS".lower():
-                        self._tap_gesture_iOS(x, y, duration=100, sp_num=sp_num)
-                elif platform_name.lower() == "android".lower():
-                    self._tap_gesture_android(x, y, duration=100, sp_num=sp_num)
-                if i < tap_count - 1:
-                    time.sleep(tap_duration_ms / 1000.0)  # Apply delay between taps
+            # Perform taps, with tap_duration_ms between them
+            self._tap_repeated(sp_num, x, y, tap_count, tap_duration_ms)
 
             return True
 
@@ -1708,14 +2273,23 @@ class Mobile:
         try:
             if sp_num is None or sp_num not in self.devices:
                 raise ValueError(f"Invalid sp_num: '{sp_num}' must be a valid device identifier")
-            driver = self.devices[sp_num]["driver"]
-            self.mapping_path = self.devices[sp_num]["mapping_path"]
 
             if not element_name or not isinstance(element_name, str):
                 raise ValueError(f"Invalid element_name: '{element_name}' must be a non-empty string")
 
+            if element_name.startswith("/"):
+                # An explicit XPath is evaluated on the device, which sends back one element instead of the whole
+                # page source; the page source lookups below only run if the device finds nothing
+                webdriver_elem = self._find_on_device(sp_num, element_name)
+                if webdriver_elem is not None:
+                    text = webdriver_elem.text or webdriver_elem.get_attribute("value") or ""
+                    if not text:
+                        logger.debug("Text not found or empty for element '%s' on device %s", element_name, sp_num)
+                        return None
+                    return text
+
             xpath = None
-            xml_source = driver.page_source
+            xml = None
             elem = None
             text_to_find = element_name
 
@@ -1723,27 +2297,31 @@ class Mobile:
             if element_name.startswith("/"):
                 xpath = element_name
                 # Extract name value for fallback if XPath is for XCUIElementTypeOther
-                match = re.search(r"@name='([^']*)'", element_name)
+                match = _NAME_ATTR_RE.search(element_name)
                 if match:
                     text_to_find = match.group(1).strip()
             else:
-                xpath = self._resolve_xpath(element_name)
+                xpath = self._resolve_xpath(element_name, self.devices[sp_num]["mapping_path"])
+                simple = _SIMPLE_NAME_XPATH_RE.match(xpath) if xpath is not None else None
+                if simple is not None and self._cached_dom(sp_num, self.page_source_ttl_ms) is None:
+                    # A type-and-name XPath is answered while streaming the source, without building the
+                    # tree of a large page; the same source is parsed below only if nothing matches
+                    xml = self.devices[sp_num]["driver"].page_source
+                    elem = self._stream_find(xml, simple.group(1), simple.group(2))
 
-            if xpath is not None:
+            if elem is None:
+                # Parsed once; the XPath lookup and the text fallback below share the tree
+                root = self._get_dom(sp_num, ttl_ms=self.page_source_ttl_ms, xml=xml)
+
+            if elem is None and xpath is not None:
                 # Use the provided or resolved XPath to get the element
-                elem = self._get_element_from_xpath(xml=xml_source, xpath=xpath)
+                elem = self._get_element_from_xpath(xml=root, xpath=xpath)
 
             # Fallback to finding the deepest matching element by text
             if elem is None:
-                match = self._get_deepest_matching_element(xml=xml_source, text_to_find=text_to_find, sp_num=sp_num)
+                match = self._get_deepest_matching_element(xml=root, text_to_find=text_to_find, sp_num=sp_num)
                 if match is not None:
                     elem = match["element"]
-                    # Construct XPath from the found element
-                    xpath = self._element_to_xpath(elem)
-                    if xpath is None:
-                        raise ValueError(f"Could not construct XPath for element '{element_name}'")
-                    # Re-fetch element with constructed XPath for consistency
-                    elem = self._get_element_from_xpath(xml=xml_source, xpath=xpath)
 
             # If no element is found, raise an exception
             if elem is None:
@@ -1752,7 +2330,7 @@ class Mobile:
             # Extract text from element (try text, then value attribute)
             text = elem.text if elem.text else elem.attrib.get("value", "")
             if not text:
-                print(f"Text not found or empty for element '{element_name}' on device {sp_num}")
+                logger.debug("Text not found or empty for element '%s' on device %s", element_name, sp_num)
                 return None
             return text
 
@@ -1761,6 +2339,24 @@ class Mobile:
         except etree.LxmlError as le:
             raise etree.LxmlError(f"XML parsing failed while getting text for '{element_name}' on device {sp_num}: {le}")
 
+    def GetElementTextMulti(self, element_name: str, sp_nums: List[int]) -> Dict[int, Optional[str]]:
+        """
+        Retrieves the text of an element on several smartphones at once.
+
+        The devices are queried in parallel, so the call takes about as long as the slowest device.
+
+        Args:
+            element_name (str): The logical name of the element or an XPath expression.
+            sp_nums (List[int]): Smartphone identifiers of the target devices.
+
+        Returns:
+            Dict[int, Optional[str]]: The text of the element per smartphone identifier (see GetElementText).
+
+        Raises:
+            ValueError: If sp_nums is invalid, or as raised by GetElementText for any device.
+        """
+        return self._run_on_devices(self.GetElementText, sp_nums, element_name)
+
     def GetElementTextById(self, element_name: str, sp_num: Optional[int] = None) -> str:
         """
         Retrieves the text of an element using its ID.
@@ -1788,7 +2384,7 @@ class Mobile:
             element = driver.find_element(AppiumBy.ACCESSIBILITY_ID, element_name)
             text = element.text or ""
             if not text:
-                print(f"Text not found or empty for element with ID '{element_name}' on device {sp_num}")
+                logger.debug("Text not found or empty for element with ID '%s' on device %s", element_name, sp_num)
                 return None
             return text
 
@@ -1818,7 +2414,6 @@ class Mobile:
             if sp_num is None or sp_num not in self.devices:
                 raise ValueError(f"Invalid sp_num: '{sp_num}' must be a valid device identifier")
             driver = self.devices[sp_num]["driver"]
-            self.mapping_path = self.devices[sp_num]["mapping_path"]
 
             if not element_name or not isinstance(element_name, str):
                 raise ValueError(f"Invalid element_name: '{element_name}' must be a non-empty string")
@@ -1830,14 +2425,14 @@ class Mobile:
             else:
                 # Try resolving the element as a logical name
 
-                xpath = self._resolve_xpath(element_name)
+                xpath = self._resolve_xpath(element_name, self.devices[sp_num]["mapping_path"])
                 if xpath is None:
                     raise ValueError(f"No XPath found for element '{element_name}' in mapping file for device {sp_num}")
 
             element = driver.find_element(AppiumBy.XPATH, xpath)
             text = element.text or ""
             if not text:
-                print(f"Text not found or empty for element '{element_name}' with XPath '{xpath}' on device {sp_num}")
+                logger.debug("Text not found or empty for element '%s' with XPath '%s' on device %s", element_name, xpath, sp_num)
                 return None
             return text
         except WebDriverException as wde:
@@ -1867,8 +2462,6 @@ class Mobile:
         try:
             if sp_num is None or sp_num not in self.devices:
                 raise ValueError(f"Invalid sp_num: '{sp_num}' must be a valid device identifier")
-            driver = self.devices[sp_num]["driver"]
-            self.mapping_path = self.devices[sp_num]["mapping_path"]
 
             if not element or not isinstance(element, str):
                 raise ValueError(f"Invalid element: '{element}' must be a non-empty string")
@@ -1879,116 +2472,36 @@ class Mobile:
             if not comparison or not isinstance(comparison, str):
                 raise ValueError(f"Invalid comparison: '{comparison}' must be a non-empty string")
 
-            xpath = None
-            xml_source = driver.page_source
-            elem = None
-            text_to_find = element
-
-            # Check if the element is an XPath (starts with / or //)
-            if element.startswith('/') or element.startswith('//'):
-                xpath = element
-                # Extract name value for fallback if XPath is for XCUIElementTypeOther
-                match = re.search(r"@name='([^']*)'", element)
-                if match:
-                    text_to_find = match.group(1).strip()
-            else:
-                # Try resolving the element as a logical name
-                xpath = self._resolve_xpath(element)
-
-            if xpath is not None:
-                # Use the provided or resolved XPath to get the element
-                elem = self._get_element_from_xpath(xml=xml_source, xpath=xpath)
-
-            # Fallback to finding the deepest matching element by text
-            if elem is None:
-                match = self._get_deepest_matching_element(xml=xml_source, text_to_find=text_to_find, sp_num=sp_num)
-                if match is not None:
-                    elem = match["element"]
-                    # Construct XPath from the found element
-                    xpath = self._element_to_xpath(elem)
-                    if xpath is None:
-                        raise ValueError(f"Could not construct XPath for element '{element}'")
-                    # Re-fetch element with constructed XPath for consistency
-                    elem = self._get_element_from_xpath(xml=xml_source, xpath=xpath)
-
-            # If no element is found, raise an exception
-            if elem is None:
-                raise ValueError(f"No element found for '{element}' in XML source on device {sp_num}")
-
-            # Get the attribute value
-            actual = elem.attrib.get(attribute, "")
+            # Explicit and mapped XPaths are evaluated on the device, which sends back one attribute instead of the
+            # whole page source; the page source is searched (including the text fallback) if nothing matches or the
+            # driver does not serve the attribute (e.g. x/y/width/height on XCUITest, index on UiAutomator2)
+            xpath = element if element.startswith('/') else self._resolve_xpath(element, self.devices[sp_num]["mapping_path"])
+            actual = self._device_attribute(sp_num, xpath, attribute) if xpath is not None else None
+            if not actual:
+                elem = self._find_in_source(self._get_dom(sp_num, ttl_ms=self.page_source_ttl_ms), element, sp_num)
+                if elem is None:
+                    raise ValueError(f"No element found for '{element}' in XML source on device {sp_num}")
+                actual = elem.attrib.get(attribute, "")
             if not actual:
                 raise AssertionError(f"Attribute '{attribute}' not found or empty on element '{element}' on device {sp_num}")
 
-            # Perform comparison
-            if comparison == "==":
-                if actual != expected:
-                    print(f"Element '{element}' attribute '{attribute}'={actual}, expected={expected} for comparison '==' on device {sp_num}")
-                    return False
-                return True
-            if comparison == "!=":
-                if actual == expected:
-                    print(f"Element '{element}' attribute '{attribute}'={actual}, not expected={expected} for comparison '!=' on device {sp_num}")
-                    return False
-                return True
-            if comparison == "contains":
-                if expected not in actual:
-                    print(f"Element '{element}' attribute '{attribute}'={actual} does not contain '{expected}' on device {sp_num}")
-                    return False
-                return True
-            if comparison == "!contains":
-                if expected in actual:
-                    print(f"Element '{element}' attribute '{attribute}'={actual} contains '{expected}', not expected on device {sp_num}")
-                    return False
-                return True
-            if comparison == "startsWith":
-                if not actual.startswith(expected):
-                    print(f"Element '{element}' attribute '{attribute}'={actual} does not start with '{expected}' on device {sp_num}")
-                    return False
-                return True
-            if comparison == "!startsWith":
-                if actual.startswith(expected):
-                    print(f"Element '{element}' attribute '{attribute}'={actual} starts with '{expected}', not expected on device {sp_num}")
-                    return False
-                return True
-            if comparison == "endsWith":
-                if not actual.endswith(expected):
-                    print(f"Element '{element}' attribute '{attribute}'={actual} does not end with '{expected}' on device {sp_num}")
-                    return False
-                return True
-            if comparison == "!endsWith":
-                if actual.endswith(expected):
-                    print(f"Element '{element}' attribute '{attribute}'={actual} ends with '{expected}', not expected on device {sp_num}")
-                    return False
-                return True
-
-            try:
-                actual_num = float(actual)
-                expected_num = float(expected)
-                if comparison == "<=":
-                    if actual_num > expected_num:
-                        print(f"Element '{element}' attribute '{attribute}'={actual_num}, expected <= {expected_num} on device {sp_num}")
-                        return False
-                    return True
-                if comparison == ">=":
-                    if actual_num < expected_num:
-                        print(f"Element '{element}' attribute '{attribute}'={actual_num}, expected >= {expected_num} on device {sp_num}")
-                        return False
-                    return True
-                if comparison == ">":
-                    if actual_num <= expected_num:
-                        print(f"Element '{element}' attribute '{attribute}'={actual_num}, expected > {expected_num} on device {sp_num}")
-                        return False
-                    return True
-                if comparison == "<":
-                    if actual_num >= expected_num:
-                        print(f"Element '{element}' attribute '{attribute}'={actual_num}, expected < {expected_num} on device {sp_num}")
-                        return False
-                    return True
-            except ValueError:
-                raise ValueError(f"Failed to convert actual='{actual}' or expected='{expected}' to float for numeric comparison '{comparison}' on device {sp_num}")
-
-            raise ValueError(f"Unsupported comparison operator: '{comparison}' on device {sp_num}")
+            # Perform comparison, looked up by operator; numeric operators compare the values as floats
+            check = _STRING_COMPARISONS.get(comparison)
+            if check is not None:
+                values = (actual, expected)
+            else:
+                check = _NUMERIC_COMPARISONS.get(comparison)
+                if check is None:
+                    raise ValueError(f"Unsupported comparison operator: '{comparison}' on device {sp_num}")
+                try:
+                    values = (float(actual), float(expected))
+                except ValueError:
+                    raise ValueError(f"Failed to convert actual='{actual}' or expected='{expected}' to float for numeric comparison '{comparison}' on device {sp_num}")
+            passes, mismatch = check
+            if not passes(*values):
+                logger.debug(mismatch, {"element": element, "attribute": attribute, "actual": values[0], "expected": values[1], "sp_num": sp_num})
+                return False
+            return True
 
         except etree.LxmlError as le:
             raise etree.LxmlError(f"Failed to check property '{attribute}' for element '{element}' on device {sp_num} due to XML parsing: {le}")
@@ -2015,54 +2528,24 @@ class Mobile:
         try:
             if sp_num is None or sp_num not in self.devices:
                 raise ValueError(f"Invalid sp_num: '{sp_num}' must be a valid device identifier")
-            driver = self.devices[sp_num]["driver"]
-            self.mapping_path = self.devices[sp_num]["mapping_path"]
 
             if not element or not isinstance(element, str):
                 raise ValueError(f"Invalid element: '{element}' must be a non-empty string")
             if not attribute or not isinstance(attribute, str):
                 raise ValueError(f"Invalid attribute: '{attribute}' must be a non-empty string")
 
-            xpath = None
-            xml_source = driver.page_source
-            elem = None
-            text_to_find = element
-
-            # Check if the element is an XPath (starts with / or //)
-            if element.startswith('/') or element.startswith('//'):
-                xpath = element
-                # Extract name value for fallback if XPath is for XCUIElementTypeOther
-                match = re.search(r"@name='([^']*)'", element)
-                if match:
-                    text_to_find = match.group(1).strip()
-            else:
-                # Try resolving the element as a logical name
-                xpath = self._resolve_xpath(element)
-
-            if xpath is not None:
-                # Use the provided or resolved XPath to get the element
-                elem = self._get_element_from_xpath(xml=xml_source, xpath=xpath)
-
-            # Fallback to finding the deepest matching element by text
-            if elem is None:
-                match = self._get_deepest_matching_element(xml=xml_source, text_to_find=text_to_find, sp_num=sp_num)
-                if match is not None:
-                    elem = match["element"]
-                    # Construct XPath from the found element
-                    xpath = self._element_to_xpath(elem)
-                    if xpath is None:
-                        raise ValueError(f"Could not construct XPath for element '{element}'")
-                    # Re-fetch element with constructed XPath for consistency
-                    elem = self._get_element_from_xpath(xml=xml_source, xpath=xpath)
-
-            # If no element is found, raise an exception
-            if elem is None:
-                raise ValueError(f"No element found for '{element}' in XML source on device {sp_num}")
-
-            # Get the attribute value
-            value = elem.attrib.get(attribute, "")
+            # Explicit and mapped XPaths are evaluated on the device, which sends back one attribute instead of the
+            # whole page source; the page source is searched (including the text fallback) if nothing matches or the
+            # driver does not serve the attribute (e.g. x/y/width/height on XCUITest, index on UiAutomator2)
+            xpath = element if element.startswith('/') else self._resolve_xpath(element, self.devices[sp_num]["mapping_path"])
+            value = self._device_attribute(sp_num, xpath, attribute) if xpath is not None else None
+            if not value:
+                elem = self._find_in_source(self._get_dom(sp_num, ttl_ms=self.page_source_ttl_ms), element, sp_num)
+                if elem is None:
+                    raise ValueError(f"No element found for '{element}' in XML source on device {sp_num}")
+                value = elem.attrib.get(attribute, "")
             if not value:
-                print(f"Attribute '{attribute}' not found or empty on element '{element}' on device {sp_num}")
+                logger.debug("Attribute '%s' not found or empty on element '%s' on device %s", attribute, element, sp_num)
                 return None
             return value
 
@@ -2071,6 +2554,25 @@ class Mobile:
         except etree.LxmlError as le:
             raise etree.LxmlError(f"Failed to get property '{attribute}' for element '{element}' on device {sp_num} due to XML parsing: {le}")
 
+    def GetElementPropertyMulti(self, element: str, attribute: str, sp_nums: List[int]) -> Dict[int, Optional[str]]:
+        """
+        Retrieves the value of an element's attribute on several smartphones at once.
+
+        The devices are queried in parallel, so the call takes about as long as the slowest device.
+
+        Args:
+            element (str): The logical name of the element or an XPath expression.
+            attribute (str): The attribute to retrieve.
+            sp_nums (List[int]): Smartphone identifiers of the target devices.
+
+        Returns:
+            Dict[int, Optional[str]]: The attribute value per smartphone identifier (see GetElementProperty).
+
+        Raises:
+            ValueError: If sp_nums is invalid, or as raised by GetElementProperty for any device.
+        """
+        return self._run_on_devices(self.GetElementProperty, sp_nums, element, attribute)
+
     def GetAllElementMap(self, sp_num: Optional[int] = None) -> str:
         """
         Retrieves the contents of the element mapping file for the specified device.
@@ -2079,30 +2581,73 @@ class Mobile:
             sp_num (Optional[int]): Smartphone identifier to select the target device.
 
         Returns:
-            str: The contents of the mapping file, or empty string if not found.
+            str: The contents of the mapping file, or empty string if not found.
+
+        Raises:
+            ValueError: If sp_num is invalid.
+            FileNotFoundError: If the mapping file is missing.
+            IOError: If there is an error reading the mapping file.
+        """
+        try:
+            if sp_num is None or sp_num not in self.devices:
+                raise ValueError(f"Invalid sp_num: '{sp_num}' must be a valid device identifier")
+            mapping_path = self.devices[sp_num]["mapping_path"]
+
+            if not mapping_path:
+                raise ValueError(f"Mapping path is not set for device {sp_num}")
+            # Read again only once the file was modified
+            mtime = self._mapping_mtime(mapping_path)
+            cached = self._mapping_texts.get(mapping_path)
+            if cached is not None and cached[0] == mtime:
+                return cached[1]
+            with open(mapping_path, "r", encoding="utf-8") as f:
+                text = f.read()
+            self._mapping_texts[mapping_path] = (mtime, text)
+            return text
+        except FileNotFoundError as fnf:
+            raise FileNotFoundError(f"Failed to read mapping file for device {sp_num}: {fnf}")
+        except IOError as ioe:
+            raise IOError(f"Failed to read mapping file '{mapping_path}' for device {sp_num}: {ioe}")
+        except ValueError as ve:
+            raise ValueError(f"Failed to get mapping file for device {sp_num}: {ve}")
+
+    def GetAllElementMapTo(self, dst_path: str, sp_num: Optional[int] = None) -> bool:
+        """
+        Copies the element mapping file of the specified device to another file, without reading it into memory.
+
+        Args:
+            dst_path (str): Path of the file to write; an existing file is overwritten.
+            sp_num (Optional[int]): Smartphone identifier to select the target device.
+
+        Returns:
+            bool: True if the mapping file was copied.
 
         Raises:
-            ValueError: If sp_num is invalid.
+            ValueError: If dst_path or sp_num is invalid.
             FileNotFoundError: If the mapping file is missing.
-            IOError: If there is an error reading the mapping file.
+            IOError: If there is an error copying the mapping file.
         """
+        mapping_path = None
         try:
             if sp_num is None or sp_num not in self.devices:
                 raise ValueError(f"Invalid sp_num: '{sp_num}' must be a valid device identifier")
+            if not dst_path or not isinstance(dst_path, str):
+                raise ValueError(f"Invalid dst_path: '{dst_path}' must be a non-empty string")
             mapping_path = self.devices[sp_num]["mapping_path"]
 
             if not mapping_path:
                 raise ValueError(f"Mapping path is not set for device {sp_num}")
             if not os.path.exists(mapping_path):
                 raise FileNotFoundError(f"Mapping file not found at '{mapping_path}' for device {sp_num}")
-            with open(mapping_path, "r", encoding="utf-8") as f:
-                return f.read()
+            # copyfile lets the kernel copy the data (sendfile on Linux) instead of passing it through Python
+            shutil.copyfile(mapping_path, dst_path)
+            return True
         except FileNotFoundError as fnf:
-            raise FileNotFoundError(f"Failed to read mapping file for device {sp_num}: {fnf}")
+            raise FileNotFoundError(f"Failed to copy mapping file for device {sp_num}: {fnf}")
         except IOError as ioe:
-            raise IOError(f"Failed to read mapping file '{mapping_path}' for device {sp_num}: {ioe}")
+            raise IOError(f"Failed to copy mapping file '{mapping_path}' to '{dst_path}' for device {sp_num}: {ioe}")
         except ValueError as ve:
-            raise ValueError(f"Failed to get mapping file for device {sp_num}: {ve}")
+            raise ValueError(f"Failed to copy mapping file for device {sp_num}: {ve}")
 
     def WaitForElementText(self, element: str, expected_data: str, ignore_case: int, time_ms: int, sp_num: Optional[int] = None) -> Tuple[bool, Optional[str]]:
         """
@@ -2127,8 +2672,6 @@ class Mobile:
         try:
             if sp_num is None or sp_num not in self.devices:
                 raise ValueError(f"Invalid sp_num: '{sp_num}' must be a valid device identifier")
-            driver = self.devices[sp_num]["driver"]
-            self.mapping_path = self.devices[sp_num]["mapping_path"]
 
             if not element or not isinstance(element, str):
                 raise ValueError(f"Invalid element: '{element}' must be a non-empty string")
@@ -2142,62 +2685,64 @@ class Mobile:
             xpath = None
             text_to_find = element
             end_time = time.time() + time_ms / 1000.0
-            poll_interval = 0.5
+            attempt = 0
+            expected_lower = expected_data.lower()  # Lowercased once, not on every poll
+            last_root = None
 
-            # Check if the element is an XPath (starts with / or //)
-            if element.startswith('/') or element.startswith('//'):
+            # Check if the element is an XPath (starts with /)
+            if element.startswith('/'):
                 xpath = element
                 # Extract name value for fallback if XPath is for XCUIElementTypeOther
-                match = re.search(r"@name='([^']*)'", element)
+                match = _NAME_ATTR_RE.search(element)
                 if match:
                     text_to_find = match.group(1).strip()
             else:
                 # Try resolving the element as a logical name
-                xpath = self._resolve_xpath(element)
+                xpath = self._resolve_xpath(element, self.devices[sp_num]["mapping_path"])
 
             while time.time() < end_time:
+                if attempt:
+                    # Text that shows up quickly is seen quickly (the wait backs off from _POLL_START to _POLL_MAX),
+                    # and the last wait does not run past the deadline
+                    time.sleep(max(0.0, min(_POLL_START * _POLL_BACKOFF ** (attempt - 1), _POLL_MAX, end_time - time.time())))
+                attempt += 1
                 try:
-                    xml_source = driver.page_source
+                    # Parse once per poll and share the tree between all lookups (unchanged screens are not reparsed)
+                    root = self._get_dom(sp_num)
+                    if root is last_root:
+                        continue  # Same screen as the last poll, which did not find the text
+                    last_root = root
                     elem = None
 
                     if xpath is not None:
                         # Use the provided or resolved XPath to get the element
-                        elem = self._get_element_from_xpath(xml=xml_source, xpath=xpath)
+                        elem = self._get_element_from_xpath(xml=root, xpath=xpath)
 
                     # Fallback to finding the deepest matching element by text
                     if elem is None:
-                        match = self._get_deepest_matching_element(xml=xml_source, text_to_find=text_to_find, sp_num=sp_num)
+                        match = self._get_deepest_matching_element(xml=root, text_to_find=text_to_find, sp_num=sp_num)
                         if match is not None:
                             elem = match["element"]
-                            # Construct XPath from the found element
-                            xpath = self._element_to_xpath(elem)
-                            if xpath is None:
-                                raise ValueError(f"Could not construct XPath for element '{element}'")
-                            # Re-fetch element with constructed XPath for consistency
-                            elem = self._get_element_from_xpath(xml=xml_source, xpath=xpath)
 
                     if elem is not None:
                         # Extract text from element (try text, then value attribute)
                         text = elem.text if elem.text else elem.attrib.get("value", "")
                         if text:
                             if ignore_case:
-                                if expected_data.lower() in text.lower():
+                                if expected_lower in text.lower():
                                     return True, text
                                 elif expected_data in text:  # Matches but wrong case
                                     raise AssertionError(f"Element '{element}' text='{text}' contains '{expected_data}' but case sensitivity (ignore_case={ignore_case}) does not match on device {sp_num}")
                             else:
                                 if expected_data in text:
                                     return True, text
-                                elif expected_data.lower() in text.lower():  # Matches but wrong case
-                                    print(f"Element '{element}' text='{text}' contains '{expected_data}' but case sensitivity (ignore_case={ignore_case}) does not match on device {sp_num}")
+                                elif expected_lower in text.lower():  # Matches but wrong case
+                                    logger.debug("Element '%s' text='%s' contains '%s' but case sensitivity (ignore_case=%s) does not match on device %s", element, text, expected_data, ignore_case, sp_num)
                                     return False, None
-                    time.sleep(poll_interval)
-                except ValueError as ve:
-                    # Continue polling on ValueError (e.g., XPath construction failure)
-                    time.sleep(poll_interval)
-                    continue
+                except ValueError:
+                    pass  # Continue polling on ValueError (e.g., XPath construction failure)
 
-            print(f"Timeout after {time_ms}ms: Expected text '{expected_data}' not found in element '{element}' on device {sp_num}")
+            logger.debug("Timeout after %sms: Expected text '%s' not found in element '%s' on device %s", time_ms, expected_data, element, sp_num)
             return False, None
 
         except etree.LxmlError as le:
@@ -2205,6 +2750,63 @@ class Mobile:
         except WebDriverException as wde:
             raise WebDriverException(f"Failed to check wait for element text '{element}' on device {sp_num}: {wde}")
 
+    def BatchQuery(self, queries: List[Dict[str, str]], sp_num: Optional[int] = None) -> List[Optional[object]]:
+        """
+        Runs several element queries against a single page source of the specified smartphone.
+
+        Each query is a dictionary with an 'op' and an 'element' (logical name or XPath):
+        'text' returns the element's text (or value attribute), 'prop' returns the attribute named by 'attr',
+        'enabled' returns whether the element is accessible, and 'visible' whether it is visible.
+
+        Args:
+            queries (List[Dict[str, str]]): The queries to run, in order.
+            sp_num (Optional[int]): Smartphone identifier to select the target device.
+
+        Returns:
+            List[Optional[object]]: One result per query; None where the element is not found or the text or
+            attribute is empty.
+
+        Raises:
+            ValueError: If a query is invalid or sp_num is invalid.
+            etree.LxmlError: If the XML source is invalid.
+        """
+        try:
+            if sp_num is None or sp_num not in self.devices:
+                raise ValueError(f"Invalid sp_num: '{sp_num}' must be a valid device identifier")
+            if not isinstance(queries, list):
+                raise ValueError(f"Invalid queries: {queries} must be a list of dictionaries")
+            for query in queries:
+                if not isinstance(query, dict) or query.get("op") not in ("text", "prop", "enabled", "visible"):
+                    raise ValueError(f"Invalid query: {query} must have an op of 'text', 'prop', 'enabled' or 'visible'")
+                if not query.get("element") or not isinstance(query["element"], str):
+                    raise ValueError(f"Invalid query: {query} must name a non-empty element")
+                if query["op"] == "prop" and (not query.get("attr") or not isinstance(query["attr"], str)):
+                    raise ValueError(f"Invalid query: {query} must name a non-empty attr")
+
+            # One fetch and parse shared by every query
+            root = self._get_dom(sp_num, ttl_ms=self.page_source_ttl_ms)
+            results = []
+            for query in queries:
+                elem = self._find_in_source(root, query["element"], sp_num)
+                if elem is None:
+                    results.append(None)
+                    continue
+                op = query["op"]
+                if op == "text":
+                    results.append((elem.text if elem.text else elem.attrib.get("value", "")) or None)
+                elif op == "prop":
+                    results.append(elem.attrib.get(query["attr"]) or None)
+                elif op == "enabled":
+                    results.append(elem.attrib.get("accessible", "false").lower() == "true")
+                else:
+                    results.append(self._is_element_visible(elem, sp_num=sp_num))
+            return results
+
+        except etree.LxmlError as le:
+            raise etree.LxmlError(f"Failed to run batch query on device {sp_num} due to XML parsing: {le}")
+        except WebDriverException as wde:
+            raise WebDriverException(f"Failed to run batch query on device {sp_num}: {wde}")
+
     def CheckElementEnabled(self, element: str, displayed: bool, sp_num: Optional[int] = None) -> bool:
         """
         Checks if an element is enabled (accessible) as expected.
@@ -2225,8 +2827,6 @@ class Mobile:
         try:
             if sp_num is None or sp_num not in self.devices:
                 raise ValueError(f"Invalid sp_num: '{sp_num}' must be a valid device identifier")
-            driver = self.devices[sp_num]["driver"]
-            self.mapping_path = self.devices[sp_num]["mapping_path"]
 
             if not element or not isinstance(element, str):
                 raise ValueError(f"Invalid element: '{element}' must be a non-empty string")
@@ -2234,36 +2834,31 @@ class Mobile:
                 raise ValueError(f"Invalid displayed: {displayed} must be a boolean")
 
             xpath = None
-            xml_source = driver.page_source
+            # Parsed once; the XPath lookup and the text fallback below share the tree
+            root = self._get_dom(sp_num, ttl_ms=self.page_source_ttl_ms)
             elem = None
             text_to_find = element
 
-            # Check if the element is an XPath (starts with / or //)
-            if element.startswith('/') or element.startswith('//'):
+            # Check if the element is an XPath (starts with /)
+            if element.startswith('/'):
                 xpath = element
                 # Extract name value for fallback if XPath is for XCUIElementTypeOther
-                match = re.search(r"@name='([^']*)'", element)
+                match = _NAME_ATTR_RE.search(element)
                 if match:
                     text_to_find = match.group(1).strip()
             else:
                 # Try resolving the element as a logical name
-                xpath = self._resolve_xpath(element)
+                xpath = self._resolve_xpath(element, self.devices[sp_num]["mapping_path"])
 
             if xpath is not None:
                 # Use the provided or resolved XPath to get the element
-                elem = self._get_element_from_xpath(xml=xml_source, xpath=xpath)
+                elem = self._get_element_from_xpath(xml=root, xpath=xpath)
 
             # Fallback to finding the deepest matching element by text
             if elem is None:
-                match = self._get_deepest_matching_element(xml=xml_source, text_to_find=text_to_find, sp_num=sp_num)
+                match = self._get_deepest_matching_element(xml=root, text_to_find=text_to_find, sp_num=sp_num)
                 if match is not None:
                     elem = match["element"]
-                    # Construct XPath from the found element
-                    xpath = self._element_to_xpath(elem)
-                    if xpath is None:
-                        raise ValueError(f"Could not construct XPath for element '{element}'")
-                    # Re-fetch element with constructed XPath for consistency
-                    elem = self._get_element_from_xpath(xml=xml_source, xpath=xpath)
 
             # If no element is found, raise an exception
             if elem is None:
@@ -2272,7 +2867,7 @@ class Mobile:
             # Check enabled state
             is_enabled = elem.attrib.get("accessible", "false").lower() == "true"
             if is_enabled != displayed:
-                print(f"Element '{element}' enabled={is_enabled}, expected={displayed} on device {sp_num}")
+                logger.debug("Element '%s' enabled=%s, expected=%s on device %s", element, is_enabled, displayed, sp_num)
                 return False
             return True
 
@@ -2304,7 +2899,6 @@ class Mobile:
             if sp_num is None or sp_num not in self.devices:
                 raise ValueError(f"Invalid sp_num: '{sp_num}' must be a valid device identifier")
             driver = self.devices[sp_num]["driver"]
-            self.mapping_path = self.devices[sp_num]["mapping_path"]
 
             if not element or not isinstance(element, str):
                 raise ValueError(f"Invalid element: '{element}' must be a non-empty string")
@@ -2317,33 +2911,50 @@ class Mobile:
             elem = None
             text_to_find = element
             end_time = time.time() + (time_ms / 1000.0)
+            attempt = 0
+            last_root = None
 
-            # Check if the element is an XPath (starts with / or //)
-            if element.startswith('/') or element.startswith('//'):
+            # Check if the element is an XPath (starts with /)
+            if element.startswith('/'):
                 xpath = element
                 # Extract name value for fallback
-                match = re.search(r"@(name|label|value)=['\"]([^'\"]*?)['\"]", element)
+                match = _LABEL_ATTR_RE.search(element)
                 if match:
                     text_to_find = match.group(2).strip()
             else:
                 # Try resolving the element as a logical name
-                xpath = self._resolve_xpath(element)
+                xpath = self._resolve_xpath(element, self.devices[sp_num]["mapping_path"])
 
             while time.time() < end_time:
-                xml_source = driver.page_source
+                if attempt:
+                    # Back off from _POLL_START to _POLL_MAX between polls; the polls that retry straight away
+                    # wait here too, and the last wait does not run past the deadline
+                    time.sleep(max(0.0, min(_POLL_START * _POLL_BACKOFF ** (attempt - 1), _POLL_MAX, end_time - time.time())))
+                attempt += 1
+
+                if attempt == 1 and displayed and xpath is not None:
+                    # An element already shown is confirmed on the device, without downloading the page source
+                    try:
+                        webdriver_elem = self._find_on_device(sp_num, xpath)
+                        if webdriver_elem is not None and webdriver_elem.is_displayed():
+                            return True
+                    except StaleElementReferenceException:
+                        pass  # Gone while it was being checked; the page source below decides
+
+                # Parse once per poll and share the tree between all lookups (unchanged screens are not reparsed)
+                root = self._get_dom(sp_num)
+                if root is last_root:
+                    continue  # Same screen as the last poll, which found no match
+                last_root = root
 
                 if xpath is not None:
-                    # Normalize XPath quotes and try variations
-                    normalized_xpath = re.sub(r"@(\w+)=[']([^']*?)[']", r'@\1="\2"', xpath)
-                    xpath_variations = [
-                        xpath,
-                        normalized_xpath,
-                        re.sub(r"@(\w+)=['\"]([^'\"]*?)['\"]", r'@\1[normalize-space(@\1)="\2"]', normalized_xpath)
-                    ]
-                    for alt_xpath in xpath_variations:
+                    # Try the exact and whitespace-normalized predicates, with the values bound as variables
+                    strategies, bindings = _xpath_templates(xpath)
+                    variables = dict(bindings)
+                    for template, _ in strategies[:2]:
                         try:
                             # Use _get_element_from_xpath for state validation
-                            elem = self._get_element_from_xpath(xml=xml_source, xpath=alt_xpath)
+                            elem = self._get_element_from_xpath(xml=root, xpath=self._compile_xpath(template), variables=variables)
                             if elem is not None:
                                 # Check visibility
                                 actual_visibility = self._is_element_visible(elem, sp_num=sp_num)
@@ -2357,33 +2968,24 @@ class Mobile:
 
                 # Fallback to finding the deepest matching element by text
                 if elem is None:
-                    match = self._get_deepest_matching_element(xml=xml_source, text_to_find=text_to_find, sp_num=sp_num)
+                    match = self._get_deepest_matching_element(xml=root, text_to_find=text_to_find, sp_num=sp_num)
                     if match is None:
                         try:
-                            match = driver.find_element(AppiumBy.XPATH, text_to_find)
-                            if match:
-                                actual_visibility = match.is_displayed()
+                            # find_elements returns an empty list on no match, so a miss costs no exception
+                            found = driver.find_elements(AppiumBy.XPATH, text_to_find)
+                            if found:
+                                actual_visibility = found[0].is_displayed()
                                 if actual_visibility == displayed:
                                     return True
                                 else:
                                     return False
+                            continue
                         except Exception:
                             # Skip this iteration and try again
                             match = None
                             continue
                     if match is not None:
                         elem = match["element"]
-                        # Construct XPath from the found element
-                        xpath = self._element_to_xpath(elem)
-                        if xpath is None:
-                            raise ValueError(f"Could not construct XPath for element '{element}'")
-                        # Re-fetch element with constructed XPath for consistency
-                        try:
-                            elem = self._get_element_from_xpath(xml=xml_source, xpath=xpath)
-                        except (NoSuchElementException, etree.LxmlError):
-                            if not displayed:
-                                return True  # Element not found, matches displayed=False
-                            elem = None
 
                     if elem is not None:
                         # Check visibility
@@ -2395,9 +2997,7 @@ class Mobile:
                 if elem is None and not displayed:
                     return True
 
-                time.sleep(0.3)
-
-            print(f"Timeout after {time_ms}ms: Element '{element}' visibility={actual_visibility if elem else 'not found'}, expected={displayed} on device {sp_num}")
+            logger.debug("Timeout after %sms: Element '%s' visibility=%s, expected=%s on device %s", time_ms, element, actual_visibility if elem else 'not found', displayed, sp_num)
             return False
 
         except etree.LxmlError as le:
@@ -2425,8 +3025,6 @@ class Mobile:
         try:
             if sp_num is None or sp_num not in self.devices:
                 raise ValueError(f"Invalid sp_num: '{sp_num}' must be a valid device identifier")
-            driver = self.devices[sp_num]["driver"]
-            self.mapping_path = self.devices[sp_num]["mapping_path"]
 
             if not element or not isinstance(element, str):
                 raise ValueError(f"Invalid element: '{element}' must be a non-empty string")
@@ -2434,36 +3032,31 @@ class Mobile:
                 raise ValueError(f"Invalid displayed: {displayed} must be a boolean")
 
             xpath = None
-            xml_source = driver.page_source
+            # Parsed once; the XPath lookup and the text fallback below share the tree
+            root = self._get_dom(sp_num, ttl_ms=self.page_source_ttl_ms)
             elem = None
             text_to_find = element
 
-            # Check if the element is an XPath (starts with / or //)
-            if element.startswith('/') or element.startswith('//'):
+            # Check if the element is an XPath (starts with /)
+            if element.startswith('/'):
                 xpath = element
                 # Extract name value for fallback if XPath is for XCUIElementTypeOther
-                match = re.search(r"@name='([^']*)'", element)
+                match = _NAME_ATTR_RE.search(element)
                 if match:
                     text_to_find = match.group(1).strip()
             else:
                 # Try resolving the element as a logical name
-                xpath = self._resolve_xpath(element)
+                xpath = self._resolve_xpath(element, self.devices[sp_num]["mapping_path"])
 
             if xpath is not None:
                 # Use the provided or resolved XPath to get the element
-                elem = self._get_element_from_xpath(xml=xml_source, xpath=xpath)
+                elem = self._get_element_from_xpath(xml=root, xpath=xpath)
 
             # Fallback to finding the deepest matching element by text
             if elem is None:
-                match = self._get_deepest_matching_element(xml=xml_source, text_to_find=text_to_find, sp_num=sp_num)
+                match = self._get_deepest_matching_element(xml=root, text_to_find=text_to_find, sp_num=sp_num)
                 if match is not None:
                     elem = match["element"]
-                    # Construct XPath from the found element
-                    xpath = self._element_to_xpath(elem)
-                    if xpath is None:
-                        raise ValueError(f"Could not construct XPath for element '{element}'")
-                    # Re-fetch element with constructed XPath for consistency
-                    elem = self._get_element_from_xpath(xml=xml_source, xpath=xpath)
 
             # If no element is found, raise an exception
             if elem is None:
@@ -2472,7 +3065,7 @@ class Mobile:
             # Check visibility
             actual_visibility = self._is_element_visible(elem, sp_num=sp_num)
             if actual_visibility != displayed:
-                print(f"Element '{element}' visible={actual_visibility}, expected={displayed} on device {sp_num}")
+                logger.debug("Element '%s' visible=%s, expected=%s on device %s", element, actual_visibility, displayed, sp_num)
                 return False
             return True
 
@@ -2481,6 +3074,20 @@ class Mobile:
         except WebDriverException as wde:
             raise WebDriverException(f"Failed to check for element presence for '{element}' on device {sp_num}: {wde}")
 
+    def InvalidatePageSource(self, sp_num: Optional[int] = None) -> None:
+        """
+        Drops the cached parsed page source of the specified device.
+
+        Args:
+            sp_num (Optional[int]): Smartphone identifier to select the target device.
+
+        Raises:
+            ValueError: If sp_num is invalid.
+        """
+        if sp_num is None or sp_num not in self.devices:
+            raise ValueError(f"Invalid sp_num: '{sp_num}' must be a valid device identifier")
+        self.devices[sp_num]["dom_cache"] = {"fingerprint": None, "source": None, "tree": None, "fetched_at": None}
+
     def StopApplication(self, sp_num: Optional[int] = None) -> bool:
         """
         Stops the application by quitting the driver for the specified device.
@@ -2576,11 +3183,58 @@ class Mobile:
             if driver:
                 driver.quit()
                 self.devices[sp_num]["driver"] = None
+                self.devices[sp_num]["window_size"] = None
         except ValueError as ve:
             raise ValueError(f"Failed to quit driver for device {sp_num}: {ve}")
         except WebDriverException as wde:
             raise WebDriverException(f"Failed to quit driver for device {sp_num}: {wde}")
 
+    def InvalidateWindowSize(self, sp_num: Optional[int] = None) -> None:
+        """
+        Drops the cached screen size of the specified device, e.g. after an orientation change.
+
+        The size is queried from the driver again on the next gesture that needs it.
+
+        Args:
+            sp_num (Optional[int]): Smartphone identifier.
+
+        Raises:
+            ValueError: If sp_num is invalid or not found.
+        """
+        if sp_num is None or sp_num not in self.devices:
+            raise ValueError(f"Invalid sp_num: '{sp_num}' must be a valid device identifier")
+        self.devices[sp_num]["window_size"] = None
+
+    def _run_on_devices(self, method, sp_nums: List[int], *args) -> Dict[int, object]:
+        """
+        Calls a per-device method for each smartphone in parallel.
+
+        Each call only touches its own device entry and blocks on its own Appium round-trips,
+        so the devices are served by one thread each.
+
+        Args:
+            method: Bound method taking the given arguments followed by sp_num.
+            sp_nums (List[int]): Smartphone identifiers of the target devices.
+            *args: Arguments passed to method before sp_num.
+
+        Returns:
+            Dict[int, object]: The result of method per smartphone identifier.
+
+        Raises:
+            ValueError: If sp_nums is empty or names an unknown device.
+            Exception: The first exception raised by method, in sp_nums order.
+        """
+        if not sp_nums or not isinstance(sp_nums, (list, tuple)):
+            raise ValueError(f"Invalid sp_nums: '{sp_nums}' must be a non-empty list of device identifiers")
+        for sp_num in sp_nums:
+            if sp_num not in self.devices:
+                raise ValueError(f"Invalid sp_num: '{sp_num}' must be a valid device identifier")
+        sp_nums = list(dict.fromkeys(sp_nums))
+
+        with ThreadPoolExecutor(max_workers=len(sp_nums)) as executor:
+            futures = {sp_num: executor.submit(method, *args, sp_num=sp_num) for sp_num in sp_nums}
+            return {sp_num: future.result() for sp_num, future in futures.items()}
+
     def _scroll_to_element_xpath(self, driver, xpath: str, max_swipes: int = 5) -> etree._Element:
         """
         Scrolls to make an element visible using XPath.
@@ -2615,12 +3269,12 @@ class Mobile:
         except WebDriverException as wde:
             raise WebDriverException(f"Failed to scroll to element with XPath '{xpath}': {wde}")
 
-    def _extract_coordinates(self, element: ET.Element, screen_width: int, screen_height: int, sp_num: int) -> Tuple[int, int]:
+    def _extract_coordinates(self, element: etree._Element, screen_width: int, screen_height: int, sp_num: int) -> Tuple[int, int]:
         """
         Extracts x, y coordinates from an XML element's attributes.
 
         Args:
-            element (ET.Element): The XML element to extract coordinates from.
+            element (etree._Element): The XML element to extract coordinates from.
             screen_width (int): Screen width to validate coordinates.
             screen_height (int): Screen height to validate coordinates.
 
@@ -2631,14 +3285,9 @@ class Mobile:
             ValueError: If coordinates cannot be extracted or are invalid.
         """
         try:
-            platform_name = self.devices[sp_num]["capabilities"].get(
-                "platformName", self.devices[sp_num]["capabilities"].get("appium:platformName", "")
-            ).lower()
+            _, _, parse_position = self._element_parsers(self._platform_name(sp_num))
             try:
-                if platform_name.lower() == "iOS".lower():
-                    x, y = self._parse_position_iOS(element)
-                elif platform_name.lower() == "android".lower():
-                    x, y = self._parse_size_android(element)
+                x, y = parse_position(element)
             except (TypeError, ValueError):
                 x = -1
                 y = -1
@@ -2650,6 +3299,70 @@ class Mobile:
         except (ValueError, TypeError) as ve:
             raise ValueError(f"Failed to extract coordinates: {ve}")
         
+    def _get_window_size(self, sp_num: int) -> Tuple[int, int]:
+        """
+        Returns the screen size of a device, querying and validating it only once per session.
+
+        Args:
+            sp_num (int): Smartphone identifier.
+
+        Returns:
+            Tuple[int, int]: The window width and height.
+
+        Raises:
+            ValueError: If the driver returns malformed screen dimensions.
+            WebDriverException: If the window size cannot be retrieved.
+        """
+        device = self.devices[sp_num]
+        size = device.get("window_size")
+        if size is None:
+            reported = device["driver"].get_window_size()
+            if not isinstance(reported, dict) or 'width' not in reported or 'height' not in reported:
+                raise ValueError("Invalid screen dimensions returned by driver")
+            size = device["window_size"] = (reported['width'], reported['height'])
+        return size
+
+    def _platform_name(self, sp_num: int) -> str:
+        """
+        Returns the lowercased platform name from the capabilities of a device, reading it only once.
+
+        Args:
+            sp_num (int): Smartphone identifier.
+
+        Returns:
+            str: The platform name, e.g. 'ios' or 'android', or an empty string if not configured.
+        """
+        device = self.devices[sp_num]
+        platform_name = device.get("platform_name")
+        if platform_name is None:
+            capabilities = device["capabilities"]
+            platform_name = device["platform_name"] = capabilities.get(
+                "platformName", capabilities.get("appium:platformName", "")
+            ).lower()
+        return platform_name
+
+    def _ensure_ready(self, sp_num: Optional[int]) -> Dict[str, object]:
+        """
+        Validates a smartphone identifier and returns its device entry once a driver is initialized.
+
+        Args:
+            sp_num (Optional[int]): Smartphone identifier.
+
+        Returns:
+            Dict[str, object]: The device entry with an initialized driver.
+
+        Raises:
+            ValueError: If sp_num is invalid, not found, or InitSmartphone has not been called for it.
+        """
+        if sp_num is None or not isinstance(sp_num, int) or sp_num < 0:
+            raise ValueError(f"Invalid sp_num: {sp_num} must be a non-negative integer")
+        dev = self.devices.get(sp_num)
+        if dev is None:
+            raise ValueError(f"Device {sp_num} not found in loaded configurations")
+        if dev.get("driver") is None:
+            raise ValueError(f"InitSmartphone must be called first for device {sp_num}")
+        return dev
+
     def _get_mapping_path(self, sp_num) -> str:
         """
         Retrieves the element mapping file path from the configuration file.
@@ -2667,14 +3380,16 @@ class Mobile:
             if not self or not self.config_path:
                 raise ValueError("Configuration not loaded. Call LoadPhoneConfiguration first.")
             
-            config = configparser.ConfigParser()
             if not os.path.exists(self.config_path):
                 raise FileNotFoundError(f"Configuration file not found at '{self.config_path}'")
-            config.read(self.config_path, encoding="utf-8")
+            config = _load_config(self.config_path)
             section = f"Smartphone_{sp_num}"
             if section not in config:
                 raise KeyError(f"Configuration section '{section}' not found in '{self.config_path}'")
-            mapping_path = config.get(section, "elementMapping", fallback="")
+            # Keys are case-preserved in the cached configuration; look up 'elementMapping' case-insensitively
+            mapping_path = next(
+                (value for key, value in config[section].items() if key.lower() == "elementmapping"), ""
+            )
             if not mapping_path:
                 raise KeyError(f"'elementMapping' key not found in section '{section}' of '{self.config_path}'")
             return mapping_path
@@ -2687,12 +3402,15 @@ class Mobile:
         except ValueError as ve:
             raise ValueError(f"Failed to get mapping path for Smartphone_{sp_num}: {ve}")
 
-    def _resolve_xpath(self, logical_name: str) -> Optional[str]:
+    def _resolve_xpath(self, logical_name: str, mapping_path: str) -> Optional[str]:
         """
         Resolves the XPath for a given logical element name from the mapping file.
 
+        The mapping file is parsed once and kept until it is modified, so lookups are dictionary reads.
+
         Args:
             logical_name (str): The logical name of the element to look up.
+            mapping_path (str): Path to the mapping file of the target device.
 
         Returns:
             Optional[str]: The resolved XPath, or None if not found.
@@ -2701,46 +3419,83 @@ class Mobile:
             ValueError: If logical_name or mapping_path is invalid.
             FileNotFoundError: If the mapping file is missing.
             IOError: If there is an error reading the mapping file.
-            SyntaxError: If a mapping line is malformed.
         """
         try:
             if not logical_name or not isinstance(logical_name, str):
                 raise ValueError(f"Invalid logical_name: '{logical_name}' must be a non-empty string")
-            if not self.mapping_path:
+            if not mapping_path:
                 raise ValueError("Mapping path is not set; cannot resolve XPath")
-            if not os.path.exists(self.mapping_path):
-                raise FileNotFoundError(f"Mapping file not found at '{self.mapping_path}'")
-
-            with open(self.mapping_path, "r", encoding="utf-8") as f:
-                for line in f:
-                    line = line.strip()
-                    if not line or "<=>" not in line:
-                        continue
-                    try:
-                        key, xpath = map(str.strip, line.split("<=>", 1))
-                    except ValueError:
-                        raise SyntaxError(f"Malformed mapping line in '{self.mapping_path}': '{line}'")
-                    if key == logical_name:
-                        if (xpath.startswith('"') and xpath.endswith('"')) or (xpath.startswith("'") and xpath.endswith("'")):
-                            xpath = xpath[1:-1]
-                        return xpath
-            return None
+            return self._load_mapping(mapping_path).get(logical_name)
 
         except FileNotFoundError as fnf:
             raise FileNotFoundError(f"Failed to resolve XPath for '{logical_name}': {fnf}")
         except IOError as ioe:
-            raise IOError(f"Failed to read mapping file '{self.mapping_path}' for '{logical_name}': {ioe}")
-        except SyntaxError as se:
-            raise SyntaxError(f"Failed to parse mapping file '{self.mapping_path}' for '{logical_name}': {se}")
+            raise IOError(f"Failed to read mapping file '{mapping_path}' for '{logical_name}': {ioe}")
         except Exception as e:
             raise Exception(f"Unexpected error while resolving XPath for '{logical_name}': {e}") from e
 
-    def _extract_element_types(self, xml: str) -> set:
+    def _mapping_mtime(self, mapping_path: str) -> int:
+        """
+        Returns the modification time of a mapping file, used to tell when its cached contents are stale.
+
+        Args:
+            mapping_path (str): Path to the mapping file.
+
+        Returns:
+            int: The modification time in nanoseconds.
+
+        Raises:
+            FileNotFoundError: If the mapping file is missing.
+        """
+        try:
+            return os.stat(mapping_path).st_mtime_ns
+        except OSError:
+            raise FileNotFoundError(f"Mapping file not found at '{mapping_path}'")
+
+    def _load_mapping(self, mapping_path: str) -> Dict[str, str]:
+        """
+        Returns the logical name to XPath mapping of a mapping file, parsing it only when it changed.
+
+        Lines have the form 'name <=> xpath'; the XPath may be quoted, and the first line for a name wins.
+
+        Args:
+            mapping_path (str): Path to the mapping file.
+
+        Returns:
+            Dict[str, str]: The XPath of each logical name.
+
+        Raises:
+            FileNotFoundError: If the mapping file is missing.
+            IOError: If there is an error reading the mapping file.
+        """
+        mtime = self._mapping_mtime(mapping_path)
+        cached = self._mappings.get(mapping_path)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+
+        mapping = {}
+        with open(mapping_path, "r", encoding="utf-8", buffering=65536) as f:
+            for line in f:
+                key, sep, xpath = line.partition("<=>")
+                if not sep:
+                    continue
+                key = key.strip()
+                if key in mapping:
+                    continue  # The first line for a name wins; its XPath is not needed
+                xpath = xpath.strip()
+                if xpath[:1] in ("'", '"') and xpath[-1] == xpath[0]:
+                    xpath = xpath[1:-1]
+                mapping[key] = xpath
+
+        self._mappings[mapping_path] = (mtime, mapping)
+        return mapping
+
+    def _extract_element_types(self, xml: Union[str, etree._Element]) -> set:
         """
         Extracts all unique element types from the XML page source.
 
         Args:
-            xml (str): The XML page source.
+            xml (Union[str, etree._Element]): The XML page source or its already parsed root element.
 
         Returns:
             set: A set of unique element type names (e.g., {'XCUIElementTypeOther', 'XCUIElementTypeButton', ...}).
@@ -2749,22 +3504,193 @@ class Mobile:
             etree.LxmlError: If the XML source is invalid.
         """
         try:
-            root = etree.fromstring(xml.encode('utf-8'))
-            # Extract all unique tag names starting with XCUIElementType
+            root = self._to_root(xml)
+            # Extract all unique tag names starting with XCUIElementType (a plain walk, no '//*' XPath pass)
             element_types = set(
-                elem.tag for elem in root.xpath('//*') if elem.tag.startswith('XCUIElementType')
+                elem.tag for elem in root.iter() if isinstance(elem.tag, str) and elem.tag.startswith('XCUIElementType')
             )
             return element_types
         except etree.LxmlError as le:
             raise etree.LxmlError(f"Failed to parse XML for element types: {le}")
 
-    def _get_element_from_xpath(self, xml: str, xpath: str) -> Optional[etree._Element]:
+    def _to_root(self, xml: Union[str, etree._Element]) -> etree._Element:
         """
-        Retrieves an element from XML source using the provided XPath.
+        Returns the root element for an XML page source, parsing it only if it is not already a parsed element.
+
+        Args:
+            xml (Union[str, etree._Element]): The XML page source or its already parsed root element.
+
+        Returns:
+            etree._Element: The root element.
+
+        Raises:
+            etree.LxmlError: If the XML source is invalid.
+        """
+        if isinstance(xml, etree._Element):
+            return xml
+        return self._parse_xml(xml)
+
+    def _parse_xml(self, xml: Union[str, bytes]) -> etree._Element:
+        """
+        Parses an XML page source with a parser reused by every parse of the calling thread.
+
+        Each thread gets its own parser, so devices queried in parallel do not wait on each other.
+        The parser keeps no ID table (page sources have no xml:id attributes to look up) and drops
+        whitespace-only text between elements, which carries nothing in Appium page sources.
+
+        Args:
+            xml (Union[str, bytes]): The XML page source; bytes are parsed as they are.
+
+        Returns:
+            etree._Element: The root element.
+
+        Raises:
+            etree.LxmlError: If the XML source is invalid.
+        """
+        parser = getattr(self._xml_parsers, "parser", None)
+        if parser is None:
+            parser = self._xml_parsers.parser = etree.XMLParser(huge_tree=True, remove_blank_text=True, collect_ids=False)
+        # A str carrying an encoding declaration cannot be parsed directly, so it is encoded first
+        return etree.fromstring(xml.encode('utf-8') if isinstance(xml, str) else xml, parser=parser)
+
+    def _get_dom(self, sp_num: int, ttl_ms: float = 0, xml: Optional[str] = None) -> etree._Element:
+        """
+        Fetches the page source of a device and returns its parsed root element.
+
+        The parsed tree is cached per device together with the page source it came from, so
+        consecutive lookups on an unchanged screen skip parsing. With a ttl_ms, a tree fetched
+        less than ttl_ms ago is returned without asking the driver at all; taps invalidate it.
+
+        Args:
+            sp_num (int): Smartphone identifier.
+            ttl_ms (float): Maximum age in milliseconds of a cached tree that may be reused without a fetch.
+            xml (Optional[str]): A page source the caller has just fetched, used instead of asking the driver.
+
+        Returns:
+            etree._Element: The root element of the current page source.
+
+        Raises:
+            etree.LxmlError: If the XML source is invalid.
+            WebDriverException: If the page source cannot be retrieved.
+        """
+        device = self.devices[sp_num]
+        cache = device.setdefault("dom_cache", {"fingerprint": None, "source": None, "tree": None, "fetched_at": None})
+        if xml is None:
+            tree = self._cached_dom(sp_num, ttl_ms)
+            if tree is not None:
+                return tree
+            xml = device["driver"].page_source
+        cache["fetched_at"] = time.monotonic()
+        # Length plus head and tail rules out almost every changed screen without touching the whole
+        # source; the full comparison only runs when the fingerprint matches
+        fingerprint = (len(xml), xml[:64], xml[-64:])
+        if cache["tree"] is None or fingerprint != cache["fingerprint"] or xml != cache["source"]:
+            cache["tree"] = self._parse_xml(xml)
+            cache["fingerprint"] = fingerprint
+            cache["source"] = xml
+        return cache["tree"]
+
+    def _cached_dom(self, sp_num: int, ttl_ms: float) -> Optional[etree._Element]:
+        """
+        Returns the cached tree of a device if it was fetched less than ttl_ms ago.
+
+        Args:
+            sp_num (int): Smartphone identifier.
+            ttl_ms (float): Maximum age in milliseconds of the cached tree; 0 never reuses it.
+
+        Returns:
+            Optional[etree._Element]: The cached root element, or None if there is no fresh tree.
+        """
+        cache = self.devices[sp_num].get("dom_cache")
+        if not ttl_ms or cache is None or cache["tree"] is None or cache["fetched_at"] is None:
+            return None
+        if (time.monotonic() - cache["fetched_at"]) * 1000.0 >= ttl_ms:
+            return None
+        return cache["tree"]
+
+    def _stream_find(self, xml: str, tag: str, name: str) -> Optional[etree._Element]:
+        """
+        Finds the first element of a type with a given name while streaming the page source, without building its tree.
+
+        Elements that have been fully read without matching are cleared and detached, so only the
+        open ancestors of the current position are held in memory. The returned element keeps its
+        own attributes and text; its descendants may be cleared.
 
         Args:
             xml (str): The XML page source.
-            xpath (str): The XPath to query.
+            tag (str): The element type to match, or '*' for any type.
+            name (str): The value of the name attribute to match.
+
+        Returns:
+            Optional[etree._Element]: The first matching element in document order (as //tag[@name='name']
+            would select), or None if there is none.
+
+        Raises:
+            etree.LxmlError: If the XML source is invalid.
+        """
+        target = None
+        for event, elem in etree.iterparse(io.BytesIO(xml.encode('utf-8')), events=("start", "end"),
+                                          huge_tree=True, remove_blank_text=True):
+            if event == "start":
+                # Attributes are known at the start tag, which also gives document order for nested matches
+                if target is None and (tag == "*" or elem.tag == tag) and elem.get("name") == name:
+                    target = elem
+            elif elem is target:
+                return elem
+            elif target is None:
+                elem.clear()
+                while elem.getprevious() is not None:
+                    del elem.getparent()[0]
+        return None
+
+    def _invalidate_dom(self, sp_num: int) -> None:
+        """
+        Marks the cached page source of a device as stale, so the next _get_dom call fetches it again.
+
+        Args:
+            sp_num (int): Smartphone identifier.
+        """
+        cache = self.devices[sp_num].get("dom_cache")
+        if cache is not None:
+            cache["fetched_at"] = None
+
+    def _compile_xpath(self, xpath: str) -> etree.XPath:
+        """
+        Returns a compiled XPath for an expression, compiling it only on first use.
+
+        The cache keeps the most recently used expressions, so the mapped XPaths queried on every poll
+        stay compiled however many one-off expressions pass through.
+
+        Args:
+            xpath (str): The XPath expression.
+
+        Returns:
+            etree.XPath: The compiled, reusable XPath evaluator.
+
+        Raises:
+            etree.XPathSyntaxError: If the XPath is malformed.
+        """
+        cache = self._xpath_cache
+        # The lookup, the move to the end and the eviction must not interleave with another thread's
+        with self._xpath_cache_lock:
+            compiled = cache.pop(xpath, None)
+            if compiled is None:
+                if len(cache) >= _XPATH_CACHE_SIZE:
+                    # Dicts keep insertion order and hits are moved to the end, so the first key is the least recently used
+                    cache.pop(next(iter(cache)), None)
+                # Plain str results; smart strings would keep a reference back into the tree
+                compiled = etree.XPath(xpath, smart_strings=False)
+            cache[xpath] = compiled
+        return compiled
+
+    def _get_element_from_xpath(self, xml: Union[str, etree._Element], xpath: Union[str, etree.XPath], variables: Optional[Mapping[str, str]] = None) -> Optional[etree._Element]:
+        """
+        Retrieves an element from XML source using the provided XPath.
+
+        Args:
+            xml (Union[str, etree._Element]): The XML page source or its already parsed root element.
+            xpath (Union[str, etree.XPath]): The XPath to query, as an expression or an already compiled evaluator.
+            variables (Optional[Mapping[str, str]]): Values for the $variables the XPath references, if any.
 
         Returns:
             Optional[etree._Element]: The first matching element, or None if not found.
@@ -2773,48 +3699,95 @@ class Mobile:
             etree.LxmlError: If the XML source is invalid or the XPath is malformed.
         """
         try:
-            root = etree.fromstring(xml.encode('utf-8'))
+            if isinstance(xpath, str):
+                compiled = self._compile_xpath(xpath)
+            else:
+                compiled, xpath = xpath, xpath.path
+            root = self._to_root(xml)
             # Try the original XPath
-            elements = root.xpath(xpath)
+            elements = compiled(root, **variables) if variables else compiled(root)
             if elements:
                 return elements[0]
 
-            # Update global ELEMENT_TYPES if empty
-            global ELEMENT_TYPES
-            if not ELEMENT_TYPES:
-                ELEMENT_TYPES = self._extract_element_types(xml)
+            # Update global ELEMENT_TYPES if empty, walking each tree at most once (a page without
+            # XCUIElementType elements, e.g. on Android, leaves it empty)
+            global ELEMENT_TYPES, _ELEMENT_TYPES_AND_FILTER
+            element_types, type_filter = _ELEMENT_TYPES_AND_FILTER
+            if not element_types and root is not self._element_types_root:
+                self._element_types_root = root
+                element_types = self._extract_element_types(root)
+                type_filter = " or ".join(f"self::{t}" for t in sorted(element_types))
+                _ELEMENT_TYPES_AND_FILTER = (element_types, type_filter)
+                ELEMENT_TYPES = element_types
+            if not element_types:
+                return None  # No element could pass the type check below
 
             # Fallback: Try variations for all element types with name, label, or value attributes
-            for attr in ['name', 'label', 'value']:
-                match = re.search(fr"@{attr}=['\"]([^'\"]*?)['\"]", xpath)
+            for attr, attr_value_re in _ATTR_VALUE_RES:
+                match = attr_value_re.search(xpath)
                 if match:
-                    attr_value = match.group(1).strip()
-                    # Try each element type with single and double quotes, original and normalized
-                    for elem_type in ELEMENT_TYPES:
-                        single_quote_xpaths = [
-                            f"//{elem_type}[@{attr}='{attr_value}']",
-                            f"//{elem_type}[normalize-space(@{attr})='{attr_value}']"
-                        ]
-                        double_quote_xpaths = [
-                            f"//{elem_type}[@{attr}=\"{attr_value}\"]",
-                            f"//{elem_type}[normalize-space(@{attr})=\"{attr_value}\"]"
-                        ]
-                        for alt_xpath in single_quote_xpaths + double_quote_xpaths:
-                            elements = root.xpath(alt_xpath)
-                            if elements:
-                                return elements[0]
+                    if match.group(1) is not None:
+                        attr_value = match.group(1)
+                    elif variables and match.group(2) in variables:
+                        attr_value = variables[match.group(2)]
+                    else:
+                        continue
+                    attr_value = attr_value.strip()
+                    # Match any element of a known type, original and normalized, in a single pass over the tree;
+                    # the value is bound as a variable, so the compiled expression is shared by every value and
+                    # needs no quote variants
+                    alt_xpath = _ATTR_FALLBACK_XPATHS[attr].format(types=type_filter)
+                    elements = self._compile_xpath(alt_xpath)(root, value=attr_value)
+                    # An exact match takes precedence over a normalized one, as when they were queried in turn
+                    for elem in elements:
+                        if elem.get(attr) == attr_value:
+                            return elem
+                    if elements:
+                        return elements[0]
 
             return None
 
         except etree.LxmlError as le:
             raise etree.LxmlError(f"Failed to parse XML or XPath '{xpath}': {le}")
 
-    def _get_deepest_matching_element(self, xml: str, text_to_find: str, sp_num: int) -> Optional[Dict[str, any]]:
+    def _find_in_source(self, root: etree._Element, element: str, sp_num: int) -> Optional[etree._Element]:
+        """
+        Finds an element in a parsed page source by XPath or logical name, falling back to a text search.
+
+        Args:
+            root (etree._Element): The parsed page source.
+            element (str): The logical name of the element or an XPath expression.
+            sp_num (int): Smartphone identifier.
+
+        Returns:
+            Optional[etree._Element]: The element, or None if not found.
+
+        Raises:
+            etree.LxmlError: If the XPath is malformed.
+        """
+        text_to_find = element
+        if element.startswith('/'):
+            xpath = element
+            # Extract name value for fallback
+            match = _NAME_ATTR_RE.search(element)
+            if match:
+                text_to_find = match.group(1).strip()
+        else:
+            xpath = self._resolve_xpath(element, self.devices[sp_num]["mapping_path"])
+
+        if xpath is not None:
+            elem = self._get_element_from_xpath(xml=root, xpath=xpath)
+            if elem is not None:
+                return elem
+        match = self._get_deepest_matching_element(xml=root, text_to_find=text_to_find, sp_num=sp_num)
+        return match["element"] if match is not None else None
+
+    def _get_deepest_matching_element(self, xml: Union[str, etree._Element], text_to_find: str, sp_num: int) -> Optional[Dict[str, any]]:
         """
         Finds the deepest element in the XML source containing the specified text.
 
         Args:
-            xml (str): The XML page source.
+            xml (Union[str, etree._Element]): The XML page source or its already parsed root element.
             text_to_find (str): The text to search for in element attributes or text content.
 
         Returns:
@@ -2824,24 +3797,31 @@ class Mobile:
             etree.LxmlError: If the XML source is invalid.
         """
         try:
-            root = etree.fromstring(xml.encode('utf-8'))
-            matches = []
+            best = None  # (sort key, element, x, y, width, height) of the best match so far
 
             # Normalize text_to_find by removing surrounding quotes and normalizing whitespace
-            import re
-            normalized_text = re.sub(r'^[\'"]|[\'"]$', '', text_to_find).strip()
-            # Normalize whitespace: replace multiple spaces with single space
-            normalized_text = re.sub(r'\s+', ' ', normalized_text).lower()
-            target = normalized_text
+            target = _normalize_text(text_to_find)
+            parse_visibility, parse_size, parse_position = self._element_parsers(self._platform_name(sp_num))
+            # Every word of the target must occur in the raw attributes, whatever their quotes and spacing;
+            # the longest word rejects the most elements, so it is tested first and on its own
+            words = sorted(target.split(), key=len, reverse=True)
+            first_word = words[0] if words else ""
+            other_words = words[1:]
+
+            # iter() walks the tree in C; depth is only worked out for the few elements that match
+            for elem in self._to_root(xml).iter(etree.Element):
+                attrib = elem.attrib
+                raw_label = attrib.get("label", "")
+                raw_name = attrib.get("name", "")
+                raw_value = attrib.get("value", "")
+                haystack = f"{raw_label}\n{raw_name}\n{raw_value}".lower()
+                if first_word not in haystack or (other_words and not all(word in haystack for word in other_words)):
+                    continue
 
-            for elem in root.xpath('//*'):
                 # Get attributes, removing quotes and normalizing whitespace
-                label = re.sub(r'^[\'"]|[\'"]$', '', elem.attrib.get("label", "")).strip()
-                label = re.sub(r'\s+', ' ', label).lower()
-                name = re.sub(r'^[\'"]|[\'"]$', '', elem.attrib.get("name", "")).strip()
-                name = re.sub(r'\s+', ' ', name).lower()
-                value = re.sub(r'^[\'"]|[\'"]$', '', elem.attrib.get("value", "")).strip()
-                value = re.sub(r'\s+', ' ', value).lower()
+                label = _normalize_text(raw_label)
+                name = _normalize_text(raw_name)
+                value = _normalize_text(raw_value)
 
                 match_score = 0
                 if label == target or name == target or value == target:
@@ -2850,31 +3830,19 @@ class Mobile:
                     match_score = 2
 
                 if match_score > 0:
-                    platform_name = self.devices[sp_num]["capabilities"].get(
-                        "platformName", self.devices[sp_num]["capabilities"].get("appium:platformName", "")
-                    ).lower()
                     # Check visibility attribute (default to 'true' if missing)
-                    if platform_name.lower() == "iOS".lower():
-                        visible = self._parse_visibility_iOS(elem)
-                    elif platform_name.lower() == "android".lower():
-                        visible = self._parse_visibility_android(elem)
+                    visible = parse_visibility(elem)
 
                     # Parse width and height, default to 0 if missing or invalid
                     try:
-                        if platform_name.lower() == "iOS".lower():
-                            width, height = self._parse_size_iOS(elem)
-                        elif platform_name.lower() == "android".lower():
-                            width, height = self._parse_size_android(elem)
+                        width, height = parse_size(elem)
                     except (TypeError, ValueError):
                         width = 0
                         height = 0
 
                     # Parse x and y coordinates, default to -1 if missing or invalid
                     try:
-                        if platform_name.lower() == "iOS".lower():
-                            x, y = self._parse_position_iOS(elem)
-                        elif platform_name.lower() == "android".lower():
-                            x, y = self._parse_size_android(elem)
+                        x, y = parse_position(elem)
                     except (TypeError, ValueError):
                         x = -1
                         y = -1
@@ -2884,14 +3852,20 @@ class Mobile:
                     # visible = elem.attrib.get("visible", "true").lower() == "true"
                     # x = int(elem.attrib.get("x", "-1"))
                     # y = int(elem.attrib.get("y", "-1"))
-                    depth = len(elem.xpath("ancestor::*"))
 
                     if width > 0 and height > 0 and visible and x >= 0 and y >= 0:
-                        matches.append((match_score, y, depth, width * height, elem, x, y, width, height))
+                        # Best score, then lowest on screen, then deepest, then smallest; on a tie the first
+                        # match in document order is kept. A match that already loses on score and position
+                        # skips the walk up its ancestors.
+                        if best is not None and (-match_score, -y) > best[0][:2]:
+                            continue
+                        depth = sum(1 for _ in elem.iterancestors())
+                        key = (-match_score, -y, -depth, width * height)
+                        if best is None or key < best[0]:
+                            best = (key, elem, x, y, width, height)
 
-            matches.sort(key=lambda item: (-item[0], -item[1], -item[2], item[3]))
-            if matches:
-                _, _, _, _, elem, x, y, width, height = matches[0]
+            if best is not None:
+                _, elem, x, y, width, height = best
                 center_x = x + width / 2
                 center_y = y + height / 2
                 return {"element": elem, "x": center_x, "y": center_y}
@@ -2900,6 +3874,23 @@ class Mobile:
         except etree.LxmlError as le:
             raise etree.LxmlError(f"Failed to parse XML for text '{text_to_find}': {le}")
 
+    def _element_parsers(self, platform_name: str):
+        """
+        Returns the visibility, size and position attribute parsers for a lowercased platform name.
+
+        iOS elements carry visible/x/y/width/height attributes, Android elements displayed/bounds;
+        resolving them once lets per-element loops call the parsers without branching.
+
+        Args:
+            platform_name (str): The lowercased platform name, 'ios' or 'android'.
+
+        Returns:
+            Tuple of the (visibility, size, position) parser methods; platforms other than 'ios' use the Android ones.
+        """
+        if platform_name == "ios":
+            return self._parse_visibility_iOS, self._parse_size_iOS, self._parse_position_iOS
+        return self._parse_visibility_android, self._parse_size_android, self._parse_position_android
+
     def _parse_visibility_iOS(self, elem: etree._Element) -> bool:
         """Return True if the iOS element is visible, based on the 'visible' attribute."""
         return elem.attrib.get("visible", "true").lower() == "true"
@@ -2924,7 +3915,7 @@ class Mobile:
         if not bounds_str:
             return -1, -1
 
-        match = re.match(r'\[(\d+),(\d+)\]\[(\d+),(\d+)\]', bounds_str)
+        match = _BOUNDS_RE.match(bounds_str)
         if not match:
             return -1, -1
 
@@ -2944,19 +3935,72 @@ class Mobile:
         return x, y
 
     def _parse_position_android(self, elem: etree._Element) -> tuple[int, int]:
-        """Return (x, y) center position of an Android element parsed from the 'bounds' attribute."""
+        """Return (x, y) top-left position of an Android element parsed from the 'bounds' attribute, like iOS 'x'/'y'."""
         bounds = elem.attrib.get('bounds')
         if not bounds:
             return -1, -1
 
-        match = re.match(r'\[(\d+),(\d+)\]\[(\d+),(\d+)\]', bounds)
+        match = _BOUNDS_RE.match(bounds)
         if not match:
             return -1, -1
 
-        x1, y1, x2, y2 = map(int, match.groups())
-        center_x = (x1 + x2) // 2
-        center_y = (y1 + y2) // 2
-        return center_x, center_y
+        x1, y1, _, _ = map(int, match.groups())
+        return x1, y1
+
+    def _extract_tap_props(self, elem: etree._Element, is_ios: bool) -> Tuple[int, int, int, int, bool, bool]:
+        """
+        Reads the position, size, enabled state and visibility of an XML element in one pass over its attributes.
+
+        Missing or invalid values default like the _parse_* helpers, and visibility follows _is_element_visible.
+
+        Args:
+            elem (etree._Element): The XML element to read.
+            is_ios (bool): True for iOS attributes (x, y, width, height, visible), False for Android (bounds, displayed).
+
+        Returns:
+            Tuple[int, int, int, int, bool, bool]: x, y (top-left corner), width, height, enabled and visible.
+        """
+        attrib = elem.attrib
+        if is_ios:
+            try:
+                x, y = int(attrib.get("x", "-1")), int(attrib.get("y", "-1"))
+            except (TypeError, ValueError):
+                x = y = -1
+            try:
+                width, height = int(attrib.get("width", "0")), int(attrib.get("height", "0"))
+            except (TypeError, ValueError):
+                width = height = 0
+            shown = attrib.get("visible", "true").lower() == "true"
+        else:
+            match = _BOUNDS_RE.match(attrib.get("bounds") or "")
+            if match:
+                x, y, x2, y2 = map(int, match.groups())
+                width, height = x2 - x, y2 - y
+            else:
+                x = y = width = height = -1
+            shown = attrib.get("displayed", "true").lower() == "true"
+        visible = shown and width > 0 and height > 0 and x >= 0 and y >= 0
+        return x, y, width, height, attrib.get("enabled") == "true", visible
+
+    def _assert_interactable(self, elem: etree._Element, name: str, action: str, sp_num: int, check_visibility: bool = True) -> None:
+        """
+        Checks that an XML element is enabled and visible, testing the cheap 'enabled' attribute first.
+
+        Args:
+            elem (etree._Element): The XML element to check.
+            name (str): The element name used in the error message.
+            action (str): The adjective used in the error message, e.g. 'tappable'.
+            sp_num (int): Smartphone identifier.
+            check_visibility (bool): False if the caller already knows the element is visible.
+
+        Raises:
+            AssertionError: If the element is disabled or not visible.
+        """
+        # Appium writes boolean attributes as lowercase 'true'/'false'
+        if elem.get("enabled") != "true":
+            raise AssertionError(f"Element '{name}' is not {action} (enabled=False)")
+        if check_visibility and not self._is_element_visible(elem, sp_num=sp_num):
+            raise AssertionError(f"Element '{name}' is not {action} (visible=False, enabled=True)")
 
     def _is_element_visible(self, elem: etree._Element, sp_num: int) -> bool:
         """
@@ -2971,32 +4015,21 @@ class Mobile:
         Raises:
             ValueError: If element attributes are invalid or cannot be processed.
         """
-        platform_name = self.devices[sp_num]["capabilities"].get(
-            "platformName", self.devices[sp_num]["capabilities"].get("appium:platformName", "")
-        ).lower()
+        parse_visibility, parse_size, parse_position = self._element_parsers(self._platform_name(sp_num))
         try:
             # Check visibility attribute (default to 'true' if missing)
-            if platform_name.lower() == "iOS".lower():
-                visible_attr = self._parse_visibility_iOS(elem)
-            elif platform_name.lower() == "android".lower():
-                visible_attr = self._parse_visibility_android(elem)
+            visible_attr = parse_visibility(elem)
 
             # Parse width and height, default to 0 if missing or invalid
             try:
-                if platform_name.lower() == "iOS".lower():
-                    width, height = self._parse_size_iOS(elem)
-                elif platform_name.lower() == "android".lower():
-                    width, height = self._parse_size_android(elem)
+                width, height = parse_size(elem)
             except (TypeError, ValueError):
                 width = 0
                 height = 0
 
             # Parse x and y coordinates, default to -1 if missing or invalid
             try:
-                if platform_name.lower() == "iOS".lower():
-                    x, y = self._parse_position_iOS(elem)
-                elif platform_name.lower() == "android".lower():
-                    x, y = self._parse_size_android(elem)
+                x, y = parse_position(elem)
             except (TypeError, ValueError):
                 x = -1
                 y = -1
@@ -3028,6 +4061,13 @@ class Mobile:
             if elem is None:
                 return None
 
+            # A name that no other element of the same type carries identifies the element on its own,
+            # without walking its ancestors (the common case on iOS)
+            name = elem.get("name")
+            if name and "'" not in name and isinstance(elem.tag, str):
+                if self._compile_xpath(f"//{elem.tag}[@name=$name]")(elem, name=name) == [elem]:
+                    return f"//{elem.tag}[@name='{name}']"
+
             # Start with the element's tag
             path_parts = []
             current = elem
@@ -3038,7 +4078,8 @@ class Mobile:
                     return None
 
                 # Get all siblings with the same tag
-                siblings = [sib for sib in current.getparent().xpath(f"./{tag}") if sib.tag == tag] if current.getparent() is not None else [current]
+                parent = current.getparent()
+                siblings = list(parent.iterchildren(tag)) if parent is not None else [current]
                 index = siblings.index(current) + 1 if len(siblings) > 1 else None
 
                 # Build predicates based on attributes (label, name, value)
@@ -3061,7 +4102,7 @@ class Mobile:
                     path_part = f"{tag}"
 
                 path_parts.append(path_part)
-                current = current.getparent()
+                current = parent
 
             # Reverse and join the path parts
             xpath = '/' + '/'.join(reversed(path_parts))
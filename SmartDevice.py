@@ -750,6 +750,33 @@ class SmartDevice(BaseComponent):
             AddComment("Error - SmartDevice.GetAllElementMap(): "+str(e))
             return None
         return element_attribute 
+
+    def GetAllElementMapTo(self, dst_path: str) -> bool:
+        '''
+        Use this command to copy the list of all available mapped elements tied to a smartphone to a file.
+        @param dst_path: Path of the file to write.
+        @return: 'True' if the file was written, 'False' otherwise.
+        '''
+        try:
+            result = self._device.GetAllElementMapTo(dst_path, self.sp_num)
+        except Exception as e:
+            AddComment("Error - SmartDevice.GetAllElementMapTo(): "+str(e))
+            return False
+        return result
+
+    def BatchQuery(self, queries: List[dict]) -> list:
+        '''
+        Use this command to run several element queries against one page source.
+        @param queries: List of queries such as {"op": "text", "element": name}, {"op": "prop", "element": name, "attr": attribute},
+                        {"op": "enabled", "element": name} or {"op": "visible", "element": name}.
+        @return: One result per query (None where the element or value is not found), None if the queries failed.
+        '''
+        try:
+            results = self._device.BatchQuery(queries, self.sp_num)
+        except Exception as e:
+            AddComment("Error - SmartDevice.BatchQuery(): "+str(e))
+            return None
+        return results
         
     def WaitForElementText(self, element: str, expected_data: str, ignore_case: int, time_ms: int):
         '''